@@ -0,0 +1,78 @@
+"""
+Benchmark: CityIndex build time and lookup latency on a large synthetic airport list.
+
+Run from the repository root:
+    python -m benchmarks.bench_city_index
+"""
+import random
+import statistics
+import time
+from src.city_index import CityIndex
+from src.graph import Graph
+
+
+CITY_COUNT = 50000
+QUERY_COUNT = 1000
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiou"
+
+
+def synthetic_word(rng: random.Random) -> str:
+    """A pronounceable made-up word of 2-4 syllables."""
+    return "".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) + (rng.choice("nrlst") if rng.random() < 0.3 else "")
+                   for _ in range(rng.randint(2, 4))).title()
+
+
+def synthetic_airports(count: int, seed: int = 0) -> Graph:
+    """A graph with count cities with made-up one- or two-word names (no routes needed for lookups)."""
+    rng = random.Random(seed)
+    graph = Graph()
+    with graph.batch():
+        for i in range(count):
+            name = synthetic_word(rng)
+            if rng.random() < 0.3:
+                name += " " + synthetic_word(rng)
+            graph.add_node(f"a{i}", name)
+    return graph
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Swap two neighbouring letters of a name."""
+    if len(name) < 4:
+        return name
+    i = rng.randrange(1, len(name) - 2)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def median_us(lookup, texts) -> float:
+    """Median latency of lookup(text) in microseconds."""
+    latencies = []
+    for text in texts:
+        began = time.perf_counter()
+        lookup(text)
+        latencies.append((time.perf_counter() - began) * 1e6)
+    return statistics.median(latencies)
+
+
+def main():
+    graph = synthetic_airports(CITY_COUNT)
+    began = time.perf_counter()
+    index = CityIndex(graph)
+    print(f"{CITY_COUNT} cities, index built in {(time.perf_counter() - began) * 1000:.0f} ms\n")
+
+    rng = random.Random(1)
+    names = [graph.nodes[node_id]["name"] for node_id in rng.sample(list(graph.nodes), QUERY_COUNT)]
+    cases = [
+        ("resolve exact name", index.resolve, names),
+        ("resolve 4-letter prefix", index.resolve, [name[:4] for name in names]),
+        ("complete 3-letter prefix", index.complete, [name[:3] for name in names]),
+        ("resolve misspelling", index.resolve, [misspell(name, rng) for name in names]),
+        ("suggest misspelling", index.suggest, [misspell(name, rng) for name in names]),
+    ]
+    print(f"{'lookup':<28}{'median us':>12}")
+    for label, lookup, texts in cases:
+        print(f"{label:<28}{median_us(lookup, texts):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark: dijkstra_pathfind on the original network versus the compressed one.
+
+The network has hubs joined by chains of pass-through cities, with a pricier parallel
+fare on every chain leg. Queries run between hubs (kept by compress_graph); the time on
+the compressed network includes expanding each route back to the original cities.
+
+Run from the repository root:
+    python -m benchmarks.bench_compression
+"""
+import random
+import time
+from benchmarks.bench_priority_queues import median_ms
+from benchmarks.graphs import chained_route_network
+from src.dijkstra import dijkstra_pathfind
+from src.graph_compression import compress_graph
+
+
+HUB_COUNT = 300
+CHAIN_COUNT = 600
+QUERY_COUNT = 50
+
+
+def main():
+    graph = chained_route_network(HUB_COUNT, CHAIN_COUNT)
+    hubs = [f"c{i}" for i in range(HUB_COUNT)]
+    rng = random.Random(1)
+    queries = [(rng.choice(hubs), rng.choice(hubs)) for _ in range(QUERY_COUNT)]
+
+    began = time.perf_counter()
+    compressed = compress_graph(graph, keep=hubs)
+    compress_s = time.perf_counter() - began
+    print(f"{compressed.report()}  (compressed in {compress_s:.2f} s)\n")
+
+    # Build the reachability indexes up front so they are not counted in the first query
+    graph.can_reach(*queries[0])
+    compressed.graph.can_reach(*queries[0])
+
+    original_ms = median_ms(lambda s, g: dijkstra_pathfind(graph, s, g), queries)
+    reduced_ms = median_ms(lambda s, g: compressed.expand(dijkstra_pathfind(compressed.graph, s, g)[1]), queries)
+    print(f"{QUERY_COUNT} hub-to-hub queries, median dijkstra_pathfind:")
+    print(f"  original network:    {original_ms:8.2f} ms")
+    print(f"  compressed network:  {reduced_ms:8.2f} ms  ({original_ms / reduced_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: query latency of DiskGraph for different LRU cache sizes.
+
+Queries run without the opt-in reachability index, as a DiskGraph does by default. The
+index's one-off build time and memory are reported separately.
+
+Run from the repository root:
+    python -m benchmarks.bench_disk_graph
+"""
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from benchmarks.graphs import random_flight_network, random_queries
+from src.dijkstra import dijkstra_steps
+from src.disk_graph import DiskGraph
+
+
+NODE_COUNT = 300
+QUERY_COUNT = 20
+CACHE_SIZES = [0, 64, 512, 4096]
+
+
+def run_queries(graph, queries) -> list:
+    """Run cheapest-route searches and return each query's latency in milliseconds."""
+    latencies = []
+    for start, goal in queries:
+        began = time.perf_counter()
+        # Drain the step generator without keeping the steps, like the paged display does
+        for _ in dijkstra_steps(graph, start, goal):
+            pass
+        latencies.append((time.perf_counter() - began) * 1000)
+    return latencies
+
+
+def main():
+    graph = random_flight_network(NODE_COUNT)
+    queries = random_queries(graph, QUERY_COUNT)
+
+    print(f"Network: {NODE_COUNT} cities, {sum(len(e) for e in graph.edges.values())} routes, "
+          f"{QUERY_COUNT} cheapest-route queries\n")
+    print(f"{'backend':<22}{'median ms':>12}{'p90 ms':>12}{'hit rate':>12}")
+
+    latencies = run_queries(graph, queries)
+    print(f"{'in-memory Graph':<22}{statistics.median(latencies):>12.1f}"
+          f"{statistics.quantiles(latencies, n=10)[-1]:>12.1f}{'-':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "routes.sqlite")
+        DiskGraph.from_graph(graph, path).close()
+
+        for cache_size in CACHE_SIZES:
+            disk_graph = DiskGraph(path, cache_size=cache_size)
+            cache = disk_graph.neighbor_cache
+            cache.hits = cache.misses = 0
+
+            latencies = run_queries(disk_graph, queries)
+            hit_rate = cache.hits / max(1, cache.hits + cache.misses)
+            print(f"{f'DiskGraph cache={cache_size}':<22}{statistics.median(latencies):>12.1f}"
+                  f"{statistics.quantiles(latencies, n=10)[-1]:>12.1f}{hit_rate:>12.0%}")
+            disk_graph.close()
+
+        # The opt-in index reads the whole stored graph once and stays in memory
+        # (no caches, so only the index is counted)
+        disk_graph = DiskGraph(path, cache_size=0, reachability_index=True)
+        tracemalloc.start()
+        began = time.perf_counter()
+        disk_graph.can_reach(queries[0][0], queries[0][1])
+        build_ms = (time.perf_counter() - began) * 1000
+        index_kb = tracemalloc.get_traced_memory()[0] / 1024
+        tracemalloc.stop()
+        print(f"\nReachability index (opt-in): built in {build_ms:.1f} ms, {index_kb:.0f} KB in memory")
+        disk_graph.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: building a graph with one add_node/add_edge call at a time versus in one batch().
+
+Single updates are published lazily on the next read, so a plain add_edge loop should
+scale linearly like a batch. The last column reads the graph after every update, which
+forces a publish each time (each publish copies the top-level city dicts).
+
+Run from the repository root:
+    python -m benchmarks.bench_graph_updates
+"""
+import random
+import time
+from src.graph import Graph
+
+
+NODE_COUNTS = [2500, 5000, 10000]
+ROUTES_PER_CITY = 3
+# Reading after every update is quadratic; only run it on the smallest network
+READ_EACH_NODE_COUNT = 2500
+
+
+def build(node_count: int, batched: bool = False, read_each: bool = False) -> float:
+    """Build a random network and return the time taken in seconds."""
+    rng = random.Random(0)
+    node_ids = [f"c{i}" for i in range(node_count)]
+    routes = [(rng.choice(node_ids), rng.choice(node_ids), float(rng.randint(50, 1500)))
+              for _ in range(node_count * ROUTES_PER_CITY)]
+
+    graph = Graph()
+    began = time.perf_counter()
+    if batched:
+        with graph.batch():
+            for i, node_id in enumerate(node_ids):
+                graph.add_node(node_id, f"City {i}")
+            for route in routes:
+                graph.add_edge(*route)
+    else:
+        for i, node_id in enumerate(node_ids):
+            graph.add_node(node_id, f"City {i}")
+            if read_each:
+                graph.get_neighbors(node_id)
+        for route in routes:
+            graph.add_edge(*route)
+            if read_each:
+                graph.get_neighbors(route[0])
+    graph.snapshot()
+    return time.perf_counter() - began
+
+
+def main():
+    print(f"{'cities':>8}{'routes':>8}{'add_edge loop':>16}{'batch()':>12}{'read each':>12}")
+    for node_count in NODE_COUNTS:
+        plain = build(node_count)
+        batched = build(node_count, batched=True)
+        read_each = f"{build(node_count, read_each=True):.2f} s" if node_count <= READ_EACH_NODE_COUNT else "-"
+        print(f"{node_count:>8}{node_count * ROUTES_PER_CITY:>8}{plain:>14.2f} s{batched:>10.2f} s{read_each:>12}")
+
+
+if __name__ == "__main__":
+    main()
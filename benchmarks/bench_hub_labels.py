@@ -0,0 +1,77 @@
+"""
+Benchmark: cheapest-cost queries from hub labels versus a cost-only Dijkstra search
+that stops at the goal.
+
+Reports the label build time (serial, and batched on a process pool), the average label
+size, the size of the saved file, and the median query latency of both approaches.
+
+Run from the repository root:
+    python -m benchmarks.bench_hub_labels
+"""
+import heapq
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from benchmarks.bench_priority_queues import median_ms
+from benchmarks.graphs import random_flight_network, random_queries
+from src.hub_labels import HubLabels
+
+
+NODE_COUNT = 1000
+QUERY_COUNT = 200
+BATCH_SIZE = 64
+
+
+def cheapest_cost(graph, start, goal) -> float:
+    """Cost-only Dijkstra that stops as soon as the goal is settled."""
+    queue = [(0, start)]
+    settled = set()
+    while queue:
+        current_cost, current_node = heapq.heappop(queue)
+        if current_node == goal:
+            return current_cost
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+        for neighbor, weight in graph.get_neighbors(current_node):
+            if neighbor not in settled:
+                heapq.heappush(queue, (current_cost + weight, neighbor))
+    return float('inf')
+
+
+def main():
+    graph = random_flight_network(NODE_COUNT).snapshot()
+    queries = random_queries(graph, QUERY_COUNT)
+
+    began = time.perf_counter()
+    labels = HubLabels.build(graph)
+    serial_s = time.perf_counter() - began
+
+    began = time.perf_counter()
+    with ProcessPoolExecutor() as executor:
+        batched = HubLabels.build(graph, batch_size=BATCH_SIZE, executor=executor)
+    batched_s = time.perf_counter() - began
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hubs.bin")
+        labels.save(path)
+        file_kb = os.path.getsize(path) / 1024
+
+    forward, backward = labels.label_sizes()
+    batched_forward, batched_backward = batched.label_sizes()
+    print(f"{NODE_COUNT} cities, {QUERY_COUNT} queries\n")
+    print(f"build, serial:                    {serial_s:8.2f} s  "
+          f"({(forward + backward) / (2 * NODE_COUNT):.1f} hubs per label)")
+    print(f"{f'build, batches of {BATCH_SIZE} on processes:':<34}{batched_s:8.2f} s  "
+          f"({(batched_forward + batched_backward) / (2 * NODE_COUNT):.1f} hubs per label)")
+    print(f"saved file:                       {file_kb:8.0f} KB")
+
+    dijkstra_ms = median_ms(lambda s, g: cheapest_cost(graph, s, g), queries)
+    labels_ms = median_ms(labels.cost, queries)
+    print(f"\nmedian query, Dijkstra:           {dijkstra_ms:8.3f} ms")
+    print(f"median query, hub labels:         {labels_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
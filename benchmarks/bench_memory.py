@@ -0,0 +1,61 @@
+"""
+Benchmark: memory allocated by the graph and by each search query (tracemalloc).
+
+For every query, reports the peak traced memory while the search runs, both when the
+steps are drained without being kept (paged display) and when they are all collected
+(dijkstra_pathfind/bfs_pathfind).
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+import statistics
+import tracemalloc
+from benchmarks.graphs import random_flight_network, random_queries
+from src.bfs import bfs_pathfind, bfs_steps
+from src.dijkstra import dijkstra_pathfind, dijkstra_steps
+
+
+NODE_COUNTS = [100, 300]
+QUERY_COUNT = 20
+
+
+def drain(make_steps):
+    """Consume a step generator without keeping the steps."""
+    for _ in make_steps():
+        pass
+
+
+def peak_bytes(run) -> int:
+    """Peak memory traced while run() executes, relative to the memory in use before it."""
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    run()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def main():
+    tracemalloc.start()
+    print(f"{'network':<16}{'query':<22}{'median KiB':>12}{'max KiB':>12}")
+    for node_count in NODE_COUNTS:
+        before = tracemalloc.get_traced_memory()[0]
+        graph = random_flight_network(node_count)
+        graph_bytes = tracemalloc.get_traced_memory()[0] - before
+        queries = random_queries(graph, QUERY_COUNT)
+        # Build the reachability index up front so it is not counted in the first query
+        graph.can_reach(queries[0][0], queries[0][1])
+        print(f"{f'{node_count} cities':<16}{'graph':<22}{graph_bytes / 1024:>12.1f}{'-':>12}")
+
+        searches = [
+            ('dijkstra (drained)', lambda s, g: drain(lambda: dijkstra_steps(graph, s, g))),
+            ('dijkstra (collected)', lambda s, g: dijkstra_pathfind(graph, s, g)),
+            ('bfs (drained)', lambda s, g: drain(lambda: bfs_steps(graph, s, g))),
+            ('bfs (collected)', lambda s, g: bfs_pathfind(graph, s, g)),
+        ]
+        for label, search in searches:
+            peaks = [peak_bytes(lambda: search(start, goal)) / 1024 for start, goal in queries]
+            print(f"{'':<16}{label:<22}{statistics.median(peaks):>12.1f}{max(peaks):>12.1f}")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
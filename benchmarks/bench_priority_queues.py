@@ -0,0 +1,83 @@
+"""
+Benchmark: Dijkstra with the binary heap, Dial's bucket queue and the radix heap.
+
+Compares the queues on networks with small fares (1-20) and wide whole-dollar fares
+(50-1500), both for a cost-only search that settles every city, where the queue is a
+large share of the work, and for the step-by-step search (dijkstra_steps, drained).
+
+Run from the repository root:
+    python -m benchmarks.bench_priority_queues
+"""
+import statistics
+import time
+from benchmarks.graphs import random_flight_network, random_queries
+from src.dijkstra import dijkstra_steps
+from src.priority_queues import make_queue
+
+
+# The cost-only search settles every city; the traced search copies the queue each step,
+# so it runs on a smaller network
+NODE_COUNT = 20000
+STEPS_NODE_COUNT = 300
+QUERY_COUNT = 10
+FARE_RANGES = [(1, 20), (50, 1500)]
+QUEUES = ['heap', 'bucket', 'radix']
+
+
+def settle_all(graph, start, priority_queue) -> dict:
+    """Cost-only Dijkstra from start to every city (no steps, no paths)."""
+    queue = make_queue(priority_queue)
+    queue.push(0, start)
+    cost = {start: 0}
+    settled = set()
+    while queue:
+        current_cost, current_node = queue.pop()
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+        for neighbor, weight in graph.get_neighbors(current_node):
+            new_cost = current_cost + weight
+            if neighbor not in cost or new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                queue.push(new_cost, neighbor)
+    return cost
+
+
+def median_ms(run, queries) -> float:
+    """Median latency of run(start, goal) over the queries, in milliseconds."""
+    latencies = []
+    for start, goal in queries:
+        began = time.perf_counter()
+        run(start, goal)
+        latencies.append((time.perf_counter() - began) * 1000)
+    return statistics.median(latencies)
+
+
+def drain(graph, start, goal, priority_queue):
+    """Run the step-by-step search without keeping the steps."""
+    for _ in dijkstra_steps(graph, start, goal, priority_queue=priority_queue):
+        pass
+
+
+def main():
+    print(f"{QUERY_COUNT} queries per cell, median ms\n")
+    print(f"{'fares':<12}{'search':<30}" + "".join(f"{name:>10}" for name in QUEUES))
+    for fare_range in FARE_RANGES:
+        fares = f"{fare_range[0]}-{fare_range[1]}"
+
+        graph = random_flight_network(NODE_COUNT, fare_range=fare_range).snapshot()
+        queries = random_queries(graph, QUERY_COUNT)
+        cells = [median_ms(lambda s, g: settle_all(graph, s, name), queries) for name in QUEUES]
+        print(f"{fares:<12}{f'cost-only, {NODE_COUNT} cities':<30}" + "".join(f"{cell:>10.1f}" for cell in cells))
+
+        graph = random_flight_network(STEPS_NODE_COUNT, fare_range=fare_range).snapshot()
+        queries = random_queries(graph, QUERY_COUNT)
+        # Build the reachability index up front so it is not counted in the first query
+        graph.can_reach(queries[0][0], queries[0][1])
+        cells = [median_ms(lambda s, g: drain(graph, s, g, name), queries) for name in QUEUES]
+        print(f"{'':<12}{f'dijkstra_steps, {STEPS_NODE_COUNT} cities':<30}"
+              + "".join(f"{cell:>10.1f}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
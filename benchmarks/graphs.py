@@ -0,0 +1,96 @@
+import random
+from src.graph import Graph
+
+
+def random_flight_network(node_count: int, routes_per_city: int = 4, seed: int = 0,
+                          fare_range: tuple = (50, 1500)) -> Graph:
+    """
+    Build a random bidirectional flight network for benchmarks.
+
+    Cities are chained in a ring (so every city is reachable) and each city gets
+    routes_per_city extra routes to random cities, with whole-dollar fares.
+
+    Args:
+        node_count (int): Number of cities
+        routes_per_city (int): Extra random routes added per city (each in both directions)
+        seed (int): Random seed, so every run uses the same network
+        fare_range (tuple): (lowest, highest) whole-dollar fare
+
+    Returns:
+        Graph: The generated network. City IDs are 'c0', 'c1', ...
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    node_ids = [f"c{i}" for i in range(node_count)]
+
+    def add_route(from_node, to_node):
+        fare = float(rng.randint(*fare_range))
+        graph.add_edge(from_node, to_node, fare)
+        graph.add_edge(to_node, from_node, fare)
+
+    # One batch, so building the network publishes a single graph version
+    with graph.batch():
+        for i, node_id in enumerate(node_ids):
+            graph.add_node(node_id, f"City {i}")
+        for i in range(node_count):
+            add_route(node_ids[i], node_ids[(i + 1) % node_count])
+            for _ in range(routes_per_city):
+                add_route(node_ids[i], rng.choice(node_ids))
+    return graph
+
+
+def random_queries(graph: Graph, count: int, seed: int = 1) -> list:
+    """
+    Pick random (start, goal) city pairs from a graph.
+
+    Args:
+        graph (Graph): The network to pick cities from
+        count (int): Number of pairs
+        seed (int): Random seed
+
+    Returns:
+        list: (start, goal) tuples
+    """
+    rng = random.Random(seed)
+    node_ids = list(graph.nodes)
+    return [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(count)]
+
+
+def chained_route_network(hub_count: int, chain_count: int, max_chain_length: int = 4, seed: int = 0,
+                          fare_range: tuple = (50, 1500)) -> Graph:
+    """
+    Build a random network of hubs joined by chains of small pass-through cities.
+
+    Starts from random_flight_network(hub_count), then adds chain_count chains between
+    random hubs, each with 1 to max_chain_length cities flown in both directions, and a
+    pricier second fare on every chain leg (a parallel route no cheapest path uses).
+
+    Args:
+        hub_count (int): Number of hub cities ('c0', 'c1', ...)
+        chain_count (int): Number of chains added
+        max_chain_length (int): Most pass-through cities in one chain
+        seed (int): Random seed, so every run uses the same network
+        fare_range (tuple): (lowest, highest) whole-dollar fare
+
+    Returns:
+        Graph: The generated network. Pass-through city IDs are 'p0', 'p1', ...
+    """
+    rng = random.Random(seed)
+    graph = random_flight_network(hub_count, seed=seed, fare_range=fare_range)
+    hubs = list(graph.nodes)
+    next_city = 0
+
+    with graph.batch():
+        for _ in range(chain_count):
+            chain = [rng.choice(hubs)]
+            for _ in range(rng.randint(1, max_chain_length)):
+                graph.add_node(f"p{next_city}", f"Stop {next_city}")
+                chain.append(f"p{next_city}")
+                next_city += 1
+            chain.append(rng.choice(hubs))
+            for from_node, to_node in zip(chain, chain[1:]):
+                fare = float(rng.randint(*fare_range))
+                for pair in ((from_node, to_node), (to_node, from_node)):
+                    graph.add_edge(*pair, fare)
+                    graph.add_edge(*pair, fare * 2)
+    return graph
@@ -1,11 +1,14 @@
-import re
-from src.graph import Graph
-from src.bfs import bfs_pathfind
-from src.dfs import dfs_pathfind
-from src.dijkstra import dijkstra_pathfind
+import time
 
+# Measure from the very first line of the script (interpreter startup itself is not included)
+STARTUP_BEGIN = time.perf_counter()
 
-graph = Graph()
+import sys
+from src.graph_cache import load_or_build_graph
+
+
+# Number of steps shown when the user asks for the next page
+PAGE_SIZE = 10
 
 cities = [
     ("vancouver", "Vancouver"),
@@ -16,9 +19,7 @@ cities = [
     ("seoul", "Seoul"),
 ]
 
-for city_id, name in cities:
-    graph.add_node(node_id=city_id, name=name)
-
+# Every route is flown in both directions
 edges = [
     ("vancouver", "new_york", 250.0),
     ("vancouver", "london", 1200.0),
@@ -33,131 +34,177 @@ edges = [
     ("beijing", "daqing", 200.0),
 ]
 
-for from_node, to_node, weight in edges:
-    graph.add_edge(from_node=from_node, to_node=to_node, weight=weight)
-    graph.add_edge(from_node=to_node, to_node=from_node, weight=weight) 
-
-# User interaction
-def get_user_input():
-    print("Available cities:")
-    for _, name in cities:
-        print(f"- {name}")
-
-    user_input_is_not_valid = True
-    while user_input_is_not_valid:
-        start = input("Enter the starting city: ").strip().lower()
-        start = re.sub(r'\s+', '_', start)  # Replace multiple spaces with single underscore
-        goal = input("Enter the destination city: ").strip().lower()
-        goal = re.sub(r'\s+', '_', goal)  # Replace multiple spaces with single underscore
-
-        if start not in graph.nodes or goal not in graph.nodes:
-            print("One or both of the specified cities do not exist in the graph.")
+# Most suggestions shown when typed text matches several cities (or none exactly)
+SUGGESTION_COUNT = 5
+
+
+def enable_tab_completion(city_index):
+    """Complete city names with the Tab key, where the readline module is available."""
+    # Nobody presses Tab when input is piped in; skip importing readline
+    if not sys.stdin.isatty():
+        return
+    try:
+        import readline
+    except ImportError:
+        return
+
+    def complete(text, state):
+        names = [city_index.names[node_id] for node_id in city_index.complete(readline.get_line_buffer())]
+        return names[state] if state < len(names) else None
+
+    readline.set_completer_delims('')
+    readline.set_completer(complete)
+    readline.parse_and_bind('tab: complete')
+
+
+def ask_city(prompt, city_index):
+    """Ask for one city until the input names exactly one; close matches are only used once confirmed."""
+    while True:
+        text = input(prompt)
+        node_id = city_index.resolve(text)
+        if node_id is not None:
+            return node_id
+        guess = city_index.guess(text)
+        if guess is not None:
+            if input(f"Did you mean {city_index.names[guess]}? (y/n): ").strip().lower() == 'y':
+                return guess
+            continue
+        suggestions = city_index.suggest(text, SUGGESTION_COUNT)
+        if suggestions:
+            print("Did you mean: " + ", ".join(city_index.names[node_id] for node_id in suggestions) + "?")
         else:
-            user_input_is_not_valid = False
+            print(f"No city matches '{text.strip()}'.")
 
+
+# User interaction
+def get_user_input(graph, city_index=None):
+    # The index is normally built once in main(); build one here if called on its own
+    if city_index is None:
+        from src.city_index import CityIndex
+        city_index = CityIndex(graph)
+    print(f"{len(city_index)} cities available. Type a name, its first letters, or press Tab to complete.")
+
+    start = ask_city("Enter the starting city: ", city_index)
+    goal = ask_city("Enter the destination city: ", city_index)
     return start, goal
 
-start, goal = get_user_input()
-
-while True:
-    choice = input("Choose flight finding method (1.Cheapest, 2.Fewest Stops, 3.All Flights, 4.Reenter cities): ").strip()
-    match choice:
-        case '1':
-            steps, route_dijkstra, cost_dijkstra = dijkstra_pathfind(graph, start=start, goal=goal)
-
-            # Ask user preference
-            step_by_step = input("View step-by-step? (y/n): ").strip().lower() == 'y'
-            
-            print(f"\n[Dijkstra] Start: {start} → {goal}\n")
-            #Enumerate will return a list of tuples. 
-            #And each item in the tuples is the index and a single step.
-            #Loop through the list, for each iteration we will get the index and the step.
-            for i, step in enumerate(steps, 1):
-                print(f"Step {i}/{len(steps)}:")
-                #find the value of action in the step dictionary
-                print(f"  Action: {step['action']}")
-                print(f"  Queue: {step['queue']}")
-                print(f"  Path so far: {' → '.join(step['current_path'])}", f"(Cost: {step['cost']})")
-                # Check if 'neighbors' key exists in the step dictionary to find it is the last step or not
-                if 'neighbors' in step:
-                    print(f"  Neighbors: {step['neighbors']}")
-                    print(f"  Updated Queue: {step['updated_queue']}")
-                print()
-            
-                # Pause only if step-by-step mode and not last step
-                if step_by_step and i < len(steps):
-                    user_input = input("Press Enter for next step, or 'a' to show all remaining: ").strip().lower()
-                    if user_input == 'a':
-                        step_by_step = False
-
-            if route_dijkstra:
-                print(f"✓ Lowest cost path: {' → '.join(route_dijkstra)} (Cost: {cost_dijkstra})")
-            else:
-                print("✗ No path found")
-
-        case '2':
-            steps, route_bfs, cost_bfs = bfs_pathfind(graph, start=start, goal=goal)
-
-            # Ask user preference
-            step_by_step = input("View step-by-step? (y/n): ").strip().lower() == 'y'
-
-            print(f"\n[BFS] Start: {start} → {goal}\n")
-            for i, step in enumerate(steps, 1): # [(index1, step1), (index2, step2) ...]
-                print(f"Step {i}/{len(steps)}:")
-                print(f"  Action: {step['action']}")
-                print(f"  Queue: {step['queue']}")
-                print(f"  Previous level: {step['previous_level']}")
-                print(f"  Path so far: {' → '.join(step['current_path'])}", f"(Cost: {step['cost']})")
-                if 'neighbors' in step:
-                    print(f"  Neighbors: {step['neighbors']}")
-                    print(f"  Updated Queue: {step['updated_queue']}")
-                print()
-            
-                # Pause only if step-by-step mode and not last step
-                if step_by_step and i < len(steps):
-                    user_input = input("Press Enter for next step, or 'a' to show all remaining steps: ").strip().lower()
-                    if user_input == 'a':
-                        step_by_step = False  # Show all remaining steps without pausing
-
-            if route_bfs:
-                print(f"✓ Path found: {' → '.join(route_bfs)} (Cost: {cost_bfs})")
+def show_steps(make_steps):
+    """
+    Show a search's steps page by page while the search runs, and return its result.
+
+    Args:
+        make_steps: Zero-argument function returning a new step generator
+                    (e.g. lambda: bfs_steps(graph, start, goal))
+
+    Returns:
+        The search result returned by the step generator (e.g. (path, cost))
+    """
+    # Imported here so the paging code is only loaded once a search is run
+    from src.trace import StepPager, write_trace_in_background
+
+    # Optionally write the full trace to a file in the background while the user pages
+    trace_file = None
+    if input("Save full trace to a file? (y/n): ").strip().lower() == 'y':
+        trace_file = input("Trace filename: ").strip() or None
+    writer = write_trace_in_background(make_steps, trace_file) if trace_file else None
+
+    # Ask user preference
+    step_by_step = input("View step-by-step? (y/n): ").strip().lower() == 'y'
+    pager = StepPager(make_steps())
+
+    if not step_by_step:
+        # Stream every step as it is produced, so output starts immediately
+        while not pager.finished:
+            print(pager.next_page(1), end='')
+    else:
+        print(pager.next_page(1), end='')
+        while not pager.finished:
+            user_input = input("Press Enter for next step, a number to jump to that step, "
+                               "'p' for the next page, 'g' to jump to the goal, "
+                               "'a' to show all remaining, or 's' to skip: ").strip().lower()
+            if user_input == 'a':
+                while not pager.finished:
+                    print(pager.next_page(1), end='')
+            elif user_input == 's':
+                break
+            elif user_input == 'g':
+                print(pager.jump_to_goal(), end='')
+            elif user_input == 'p':
+                print(pager.next_page(PAGE_SIZE), end='')
+            elif user_input.isdigit():
+                print(pager.jump_to(int(user_input)), end='')
             else:
-                print("✗ No path found")
-
-        case '3':
-            steps, all_routes = dfs_pathfind(graph, start=start, goal=goal)
-            # Sort all routes by cost for better readability
-            def get_sort_key(x):
-                return x[1]
-            all_routes.sort(key=get_sort_key)
-            # \n is new line
-            print(f"\n[DFS] Start: {start} → {goal}\n")
-            
-            # Ask user preference
-            step_by_step = input("View step-by-step? (y/n): ").strip().lower() == 'y'
-    
-            for i, step in enumerate(steps, 1):
-                print(f"Step {i}/{len(steps)}:")
-                print(f"  Action: {step['action']}")
-                print(f"  Stack: {step['stack']}")
-                print(f"  Path so far: {' → '.join(step['current_path'])}", f"(Cost: {step['cost']})")
-                if 'neighbors' in step:
-                    print(f"  Neighbors: {step['neighbors']}")
-                    print(f"  Updated Stack: {step['updated_stack']}")
-                print()
-            
-                # Pause only if step-by-step mode and not last step
-                if step_by_step and i < len(steps):
-                    user_input = input("Press Enter for next step, or 'a' to show all remaining steps: ").strip().lower()
-                    if user_input == 'a':
-                        step_by_step = False  # Show all remaining steps without pausing
-            
-            print("All DFS Paths (sorted by cost):")
-            for route_dfs, cost_dfs in all_routes:
-                print(f"  {' → '.join(route_dfs)} (Cost: {cost_dfs})")
-
-        case '4':
-            start, goal = get_user_input()
-
-        case _:
-            print("Invalid choice. Please select 1, 2, 3 or 4.")
+                print(pager.next_page(1), end='')
+
+    result = pager.finish()
+    if writer is not None:
+        writer.join()
+        if writer.error is not None:
+            print(f"Could not write the trace to {trace_file}: {writer.error}")
+        else:
+            print(f"Full trace written to {trace_file}")
+    return result
+
+
+def main():
+    # Load the prebuilt graph snapshot (or build and cache it on the first run)
+    graph, from_cache = load_or_build_graph(cities, edges)
+    if '--timing' in sys.argv:
+        startup_ms = (time.perf_counter() - STARTUP_BEGIN) * 1000
+        source = "loaded from cached snapshot" if from_cache else "built from source data"
+        print(f"Startup: {startup_ms:.1f} ms (graph {source})")
+
+    # Build the city-name lookup index once and reuse it at every prompt
+    # (imported on first use, like the algorithm modules below)
+    from src.city_index import CityIndex
+    city_index = CityIndex(graph)
+    enable_tab_completion(city_index)
+    start, goal = get_user_input(graph, city_index)
+
+    while True:
+        choice = input("Choose flight finding method (1.Cheapest, 2.Fewest Stops, 3.All Flights, 4.Reenter cities): ").strip()
+        match choice:
+            case '1':
+                # Algorithm modules are imported only when their option is chosen
+                from src.dijkstra import dijkstra_steps
+                print(f"\n[Dijkstra] Start: {start} → {goal}\n")
+                route_dijkstra, cost_dijkstra = show_steps(lambda: dijkstra_steps(graph, start=start, goal=goal))
+
+                if route_dijkstra:
+                    print(f"✓ Lowest cost path: {' → '.join(route_dijkstra)} (Cost: {cost_dijkstra})")
+                else:
+                    print("✗ No path found")
+
+            case '2':
+                from src.bfs import bfs_steps
+                print(f"\n[BFS] Start: {start} → {goal}\n")
+                route_bfs, cost_bfs = show_steps(lambda: bfs_steps(graph, start=start, goal=goal))
+
+                if route_bfs:
+                    print(f"✓ Path found: {' → '.join(route_bfs)} (Cost: {cost_bfs})")
+                else:
+                    print("✗ No path found")
+
+            case '3':
+                from src.dfs import dfs_steps
+                # \n is new line
+                print(f"\n[DFS] Start: {start} → {goal}\n")
+                all_routes = show_steps(lambda: dfs_steps(graph, start=start, goal=goal))
+                # Sort all routes by cost for better readability
+                def get_sort_key(x):
+                    return x[1]
+                all_routes.sort(key=get_sort_key)
+
+                print("All DFS Paths (sorted by cost):")
+                for route_dfs, cost_dfs in all_routes:
+                    print(f"  {' → '.join(route_dfs)} (Cost: {cost_dfs})")
+
+            case '4':
+                start, goal = get_user_input(graph, city_index)
+
+            case _:
+                print("Invalid choice. Please select 1, 2, 3 or 4.")
+
+
+if __name__ == "__main__":
+    main()
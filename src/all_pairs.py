@@ -0,0 +1,155 @@
+from typing import List, Tuple
+import numpy as np
+from src.graph import Graph
+from src.graph_arrays import GraphArrays
+
+
+class AllPairsTable:
+    """
+    Precomputed cheapest cost and route between every pair of cities.
+
+    Built once with a NumPy-vectorized Floyd-Warshall, then every (start, goal) query is
+    a table lookup plus a walk along the next-hop matrix. Intended for regional networks
+    of up to a few thousand cities (memory grows with V^2: about 12 bytes per pair).
+
+    Attributes:
+        node_ids (List[str]): City ID for each row/column
+        names (List[str]): City name for each row/column
+        index (Dict[str, int]): Row/column of each city ID
+        dist (np.ndarray): dist[i, j] = cheapest cost from city i to city j (inf if no route)
+        next_hop (np.ndarray): next_hop[i, j] = the city after i on the cheapest route to j (-1 if none)
+
+    Example:
+        table = AllPairsTable.build(graph)
+        table.save('regional.npz')
+
+        table = AllPairsTable.load('regional.npz')
+        path, cost = table.pathfind('vancouver', 'daqing')
+        # path = ['Vancouver', 'Seoul', 'Beijing', 'Daqing']
+        # cost = 1300.0
+    """
+    def __init__(self, node_ids: List[str], names: List[str], dist: np.ndarray, next_hop: np.ndarray):
+        """
+        Store a computed table. Use AllPairsTable.build or AllPairsTable.load to create one.
+
+        Args:
+            node_ids (List[str]): City ID for each row/column
+            names (List[str]): City name for each row/column
+            dist (np.ndarray): V x V cost matrix
+            next_hop (np.ndarray): V x V next-hop matrix
+        """
+        self.node_ids = node_ids
+        self.names = names
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.dist = dist
+        self.next_hop = next_hop
+
+    @classmethod
+    def build(cls, graph: Graph) -> 'AllPairsTable':
+        """
+        Run Floyd-Warshall over the whole graph.
+
+        Each of the V rounds allows one more city k as an intermediate stop and updates
+        the whole matrix at once: dist = min(dist, dist[:, k] + dist[k, :]) via broadcasting.
+
+        Args:
+            graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+
+        Returns:
+            AllPairsTable: The computed table
+
+        Time Complexity: O(V^3) arithmetic, done as V vectorized V x V updates
+        Space Complexity: O(V^2)
+        """
+        arrays = GraphArrays.from_graph(graph)
+        node_count = arrays.node_count
+
+        dist = np.full((node_count, node_count), np.inf)
+        # Keep the cheapest of any parallel flights between the same two cities
+        np.minimum.at(dist, (arrays.sources, arrays.targets), arrays.weights)
+        np.fill_diagonal(dist, 0.0)
+
+        next_hop = np.full((node_count, node_count), -1, dtype=np.int32)
+        rows, columns = np.nonzero(np.isfinite(dist))
+        next_hop[rows, columns] = columns
+
+        for k in range(node_count):
+            # Cost of going i -> k -> j for every pair at once
+            through_k = dist[:, k, np.newaxis] + dist[np.newaxis, k, :]
+            better = through_k < dist
+            # Update in place (row k and column k never change during round k)
+            np.copyto(dist, through_k, where=better)
+            # A route via k starts with the same first hop as the route to k
+            np.copyto(next_hop, next_hop[:, k, np.newaxis], where=better)
+
+        return cls(arrays.node_ids, arrays.names, dist, next_hop)
+
+    def save(self, path: str):
+        """
+        Save the table to an uncompressed NumPy .npz file.
+
+        Args:
+            path (str): Destination file (e.g. 'regional.npz')
+        """
+        np.savez(path, node_ids=np.array(self.node_ids), names=np.array(self.names),
+                 dist=self.dist, next_hop=self.next_hop)
+
+    @classmethod
+    def load(cls, path: str) -> 'AllPairsTable':
+        """
+        Load a table written by save().
+
+        Args:
+            path (str): File written by save()
+
+        Returns:
+            AllPairsTable: The loaded table
+        """
+        with np.load(path) as data:
+            return cls(data['node_ids'].tolist(), data['names'].tolist(), data['dist'], data['next_hop'])
+
+    def cost(self, start: str, goal: str) -> float:
+        """
+        Look up the cheapest cost from start to goal.
+
+        Args:
+            start (str): Starting city ID
+            goal (str): Destination city ID
+
+        Returns:
+            float: Cheapest cost, or float('inf') if there is no route or either city is not in the table
+        """
+        start_index = self.index.get(start)
+        goal_index = self.index.get(goal)
+        if start_index is None or goal_index is None:
+            return float('inf')
+        return float(self.dist[start_index, goal_index])
+
+    def pathfind(self, start: str, goal: str) -> Tuple[List[str], float]:
+        """
+        Look up the cheapest route from start to goal.
+
+        Args:
+            start (str): Starting city ID (e.g., 'vancouver')
+            goal (str): Destination city ID (e.g., 'daqing')
+
+        Returns:
+            Tuple[List[str], float]:
+                - path: List of city names from start to goal (empty list if no path exists),
+                  the same as the path from dijkstra_pathfind
+                - cost: Total cost of the path. Returns float('inf') if no path exists
+                  (including when either city is not in the table)
+        """
+        current = self.index.get(start)
+        goal_index = self.index.get(goal)
+        if current is None or goal_index is None:
+            return ([], float('inf'))
+        cost = float(self.dist[current, goal_index])
+        if cost == float('inf'):
+            return ([], cost)
+
+        path = [self.names[current]]
+        while current != goal_index:
+            current = int(self.next_hop[current, goal_index])
+            path.append(self.names[current])
+        return (path, cost)
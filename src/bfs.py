@@ -1,24 +1,61 @@
 from collections import deque
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from src.graph import Graph
+from src.path_labels import PathLabels
+from src.trace import collect_steps, no_route_step
 
 
-def bfs_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[dict], List[str], float]:
+def bfs_pathfind(graph: Graph, start: str, goal: str,
+                 weight: Optional[Union[str, Dict[str, float]]] = None) -> Tuple[List[dict], List[str], float]:
     """
     Performs Breadth-First Search to find the shortest path (fewest hops) from start to goal.
     
-    Uses a queue (FIFO) to explore nodes level by level, ensuring the first path found
-    has the minimum number of edges. Records each step for users to see.
+    Eager wrapper around bfs_steps: runs the whole search and keeps every step in a list.
     
     Args:
         graph (Graph): The flight graph containing cities (nodes) and routes (edges)
         start (str): Starting city ID (e.g., 'vancouver')
         goal (str): Destination city ID (e.g., 'new_york')
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost, or a
+            linear combination such as {'weight': 1.0, 'duration': 50.0} (see Graph.get_neighbors).
+            Defaults to the edge weight.
     
     Returns:
         Tuple[List[Dict], List[str], float]:
             - steps: List of dictionaries containing step-by-step actions for users to see
+            - path: List of city names from start to goal (empty list if no path exists)
+            - cost: Total cost of the path. Returns float('inf') if no path exists
+    
+    Example:
+        steps, path, cost = bfs_pathfind(graph, 'vancouver', 'new_york')
+    """
+    steps, (path, cost) = collect_steps(bfs_steps(graph, start, goal, weight))
+    return (steps, path, cost)
+
+
+def bfs_steps(graph: Graph, start: str, goal: str,
+              weight: Optional[Union[str, Dict[str, float]]] = None) -> Iterator[dict]:
+    """
+    Performs Breadth-First Search lazily, yielding each step as soon as it happens.
+    
+    Uses a queue (FIFO) to explore nodes level by level, ensuring the first path found
+    has the minimum number of edges. Steps are produced on demand so a caller can show
+    the first step before the search has finished.
+    
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges)
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'new_york')
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost, or a
+            linear combination such as {'weight': 1.0, 'duration': 50.0} (see Graph.get_neighbors).
+            Defaults to the edge weight.
+    
+    Yields:
+        dict: One step at a time for users to see
               Each step includes: action, queue state, visited nodes, current path, cost, neighbors
+    
+    Returns:
+        Tuple[List[str], float] (as the generator's return value, see collect_steps):
             - path: List of city names from start to goal (empty list if no path exists)
             - cost: Total cost of the path (sum of edge weights). Returns float('inf') if no path exists
     
@@ -30,60 +67,69 @@ def bfs_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[dict], List[
         - Does not guarantee lowest cost (use Dijkstra for that)
         - Explores all neighbors at current depth before moving deeper
         - Marks visited nodes to avoid revisiting
+        - Unreachable goals are rejected before searching (see Graph.can_reach)
     
     Example:
-        steps, path, cost = bfs_pathfind(graph, 'vancouver', 'new_york')
-        # path = ['Vancouver', 'Toronto', 'New York']
-        # cost = 350.0
-        # steps = [step1, step2, step3, ...]
+        for step in bfs_steps(graph, 'vancouver', 'new_york'):
+            print(step['action'])
+        # Dequeue: Vancouver
+        # ...
+        # Goal found: New York!
     """
-     # Initialize queue with starting node (FIFO - First In First Out)
-    queue = deque([(start, [start], 0.0)])
+    # Search one fixed version of the graph, even if it is updated while the steps are consumed
+    graph = graph.snapshot()
+    # City records (NodeRecord), looked up once instead of through graph.nodes every time
+    nodes = graph.nodes
+
+    # Reject unreachable goals up front using the graph's reachability index
+    if not graph.can_reach(start, goal):
+        yield no_route_step(nodes, start, goal, cost=0.0, queue=[], previous_level=[])
+        return ([], float('inf'))
+
+    # Paths are kept as parent pointers; queue entries carry a label number instead of a path list
+    labels = PathLabels(start)
+    # Initialize queue with starting node (FIFO - First In First Out): (city ID, label, cost)
+    queue = deque([(start, 0, 0.0)])
     # Track all visited nodes to avoid revisiting them
     previous_level = {start}
-    # Store each step for users to see
-    steps = []
 
     while queue:
         # Dequeue node from front of queue (FIFO behavior)
-        current_node, path, cost = queue.popleft()
+        current_node, label, cost = queue.popleft()
         
         # Record this step for instructional display
         step = {
-            'action': f'Dequeue: {graph.nodes[current_node]["name"]}',
-            'queue': [graph.nodes[node]["name"] for node, _, _ in queue],
-            'previous_level': [graph.nodes[node]["name"] for node in previous_level],
-            'current_path': [graph.nodes[node]["name"] for node in path],
+            'action': f'Dequeue: {nodes[current_node].name}',
+            'queue': [nodes[node].name for node, _, _ in queue],
+            'previous_level': [nodes[node].name for node in previous_level],
+            'current_path': [nodes[node].name for node in labels.path(label)],
             'cost': cost
         }
 
         if current_node == goal:
-            step['action'] = f'Goal found: {graph.nodes[goal]["name"]}!'
-            steps.append(step)
-            # Change city IDs to readable names
-            for i, city_id in enumerate(path):
-                city_name = graph.nodes[city_id]['name']
-                path[i] = city_name
-            return (steps, path, cost)
+            step['action'] = f'Goal found: {nodes[goal].name}!'
+            yield step
+            # The path of readable names was already built for the step
+            return (list(step['current_path']), cost)
         
         # Get all neighbors (outgoing flights from current city)
-        neighbors = graph.get_neighbors(current_node)
-        neighbor = [(graph.nodes[n]["name"], w) for n, w in neighbors]
+        neighbors = graph.get_neighbors(current_node) if weight is None else graph.get_neighbors(current_node, weight)
+        neighbor = [(nodes[n].name, w) for n, w in neighbors]
         step['neighbors'] = neighbor
   
 
         # Explore all unvisited neighbors by adding them to queue
         # Iterate over neighbors and each iteration we will get neighbor and weight
-        for neighbor, weight in neighbors:
+        for neighbor, edge_cost in neighbors:
             # if the city is visited in the current path, skip it to avoid cycles
             if neighbor not in previous_level:
-                queue.append((neighbor, path + [neighbor], cost + weight))
+                queue.append((neighbor, labels.add(neighbor, label), cost + edge_cost))
                 # Mark as visited immediately to ensure each node is processed once
                 previous_level.add(neighbor)
         
-        updated_queue = [graph.nodes[node]["name"] for node, _, _ in queue]
+        updated_queue = [nodes[node].name for node, _, _ in queue]
         step['updated_queue'] = updated_queue
-        steps.append(step)
+        yield step
 
     # No path found - return empty path and infinite cost
-    return (steps, [], float('inf'))
+    return ([], float('inf'))
@@ -0,0 +1,268 @@
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize a city name or ID for lookup.
+
+    Lowercases, removes accents, and turns runs of spaces, underscores, hyphens and
+    dots into a single space, so 'New_York', 'new  york' and 'NEW-YORK' all match.
+
+    Args:
+        text (str): User input, city name or city ID
+
+    Returns:
+        str: The normalized key (e.g. 'new york')
+
+    Example:
+        normalize('  São_Paulo ')   # 'sao paulo'
+    """
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return re.sub(r'[\s_\-.]+', ' ', text).strip().lower()
+
+
+def trigrams(key: str) -> List[str]:
+    """
+    Split a normalized key into overlapping 3-character pieces (padded at both ends).
+
+    Args:
+        key (str): Normalized key
+
+    Returns:
+        List[str]: The key's trigrams, e.g. 'seoul' -> ['  s', ' se', 'seo', 'eou', 'oul', 'ul ']
+    """
+    padded = f"  {key} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class CityIndex:
+    """
+    Lookup index from typed text to city IDs, built once over a graph's city names and IDs.
+
+    - Exact lookup: a dict from normalized key to city ID
+    - Prefix search (autocomplete): a sorted array of normalized keys searched with bisect
+    - Typo-tolerant search: an inverted index from trigrams to keys, ranked by the Dice
+      coefficient of shared trigrams
+
+    Both the name ('New York') and the ID ('new_york') of every city are indexed. The index
+    describes the graph at the time it was built; rebuild it after adding cities.
+
+    Attributes:
+        names (Dict[str, str]): City name of each indexed city ID
+
+    Example:
+        index = CityIndex(graph)
+        index.resolve('new york')      # 'new_york'
+        index.resolve('vanc')          # None (only exact names and IDs resolve)
+        index.guess('vanc')            # 'vancouver' (only city starting with 'vanc')
+        index.guess('vancuver')        # 'vancouver' (close enough spelling)
+        index.complete('be')           # ['beijing']
+        index.suggest('lodnon')        # ['london']
+    """
+    # Lowest Dice score for a spelling to count as a match at all
+    MIN_SCORE = 0.3
+    # Lowest Dice score for guess() to offer a misspelling as the one likely city
+    ACCEPT_SCORE = 0.5
+
+    def __init__(self, graph):
+        """
+        Build the index.
+
+        Args:
+            graph: The flight graph (anything exposing `nodes` with a name for each city)
+
+        Time Complexity: O(K log K) for K = 2 * V keys
+        Space Complexity: O(K * L) for keys of average length L
+        """
+        nodes = graph.snapshot().nodes
+        self.names: Dict[str, str] = {node_id: nodes[node_id]["name"] for node_id in nodes}
+
+        # Each key maps to one city; a name shared by several cities keeps the first one
+        exact: Dict[str, str] = {}
+        for node_id, name in self.names.items():
+            for key in (normalize(name), normalize(node_id)):
+                exact.setdefault(key, node_id)
+        self._exact = exact
+
+        # Sorted keys (with their city IDs alongside) for prefix ranges
+        self._keys = sorted(exact)
+        self._key_ids = [exact[key] for key in self._keys]
+
+        # Trigram -> sorted positions in self._keys, and the number of distinct trigrams of each key
+        self._postings: Dict[str, List[int]] = {}
+        self._gram_counts: List[int] = []
+        for position, key in enumerate(self._keys):
+            grams = set(trigrams(key))
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def complete(self, text: str, limit: int = 10) -> List[str]:
+        """
+        City IDs whose name or ID starts with the text (autocomplete).
+
+        Args:
+            text (str): What the user has typed so far
+            limit (int): Maximum number of cities returned
+
+        Returns:
+            List[str]: Matching city IDs in alphabetical order of the matched key, without duplicates
+
+        Time Complexity: O(log K + matches)
+        """
+        prefix = normalize(text)
+        matches = []
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            node_id = self._key_ids[position]
+            if node_id not in matches:
+                matches.append(node_id)
+                if len(matches) == limit:
+                    break
+            position += 1
+        return matches
+
+    def fuzzy(self, text: str, limit: int = 5, min_score: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        City IDs whose name or ID is spelled like the text, best first.
+
+        Uses a prefix filter: a key needs at least m shared trigrams to reach min_score, so
+        it must share at least one of the query's rarest (n - m + 1) trigrams. Candidates
+        come from those short posting lists only; the common trigrams are then checked
+        for just the candidates by binary search, dropping candidates as soon as they can
+        no longer reach min_score.
+
+        Args:
+            text (str): User input, possibly misspelled
+            limit (int): Maximum number of cities returned
+            min_score (float, optional): Lowest similarity returned (default MIN_SCORE)
+
+        Returns:
+            List[Tuple[str, float]]: (city ID, similarity between 0 and 1) pairs, at least min_score
+
+        Time Complexity: O(R + C * F * log K) for R entries in the rare posting lists,
+                         C candidates and F frequent query trigrams
+        """
+        if min_score is None:
+            min_score = self.MIN_SCORE
+        query = set(trigrams(normalize(text)))
+        postings = [self._postings[gram] for gram in query if gram in self._postings]
+        if not postings:
+            return []
+        postings.sort(key=len)
+
+        # Shared trigrams needed for 2c / (q + k) >= min_score, using k >= c
+        needed = max(1, math.ceil(min_score * len(query) / (2 - min_score) - 1e-9))
+        if needed > len(postings):
+            return []
+        rare = len(postings) - needed + 1
+
+        # Count shared rare trigrams for every key that has any (Counter.update runs in C)
+        shared = Counter()
+        for posting in postings[:rare]:
+            shared.update(posting)
+
+        # Add the frequent trigrams for the candidates only, dropping every candidate that
+        # could not reach min_score even if it shared all the trigrams still to check
+        query_size = len(query)
+        gram_counts = self._gram_counts
+        left = len(postings) - rare
+        candidates = [position for position, count in shared.items()
+                      if 2 * (count + left) >= min_score * (query_size + gram_counts[position])]
+        for posting in postings[rare:]:
+            left -= 1
+            survivors = []
+            for position in candidates:
+                found = bisect_left(posting, position)
+                if found < len(posting) and posting[found] == position:
+                    shared[position] += 1
+                if 2 * (shared[position] + left) >= min_score * (query_size + gram_counts[position]):
+                    survivors.append(position)
+            candidates = survivors
+
+        best: Dict[str, float] = {}
+        for position in candidates:
+            score = 2 * shared[position] / (query_size + gram_counts[position])
+            node_id = self._key_ids[position]
+            if score >= min_score and score > best.get(node_id, 0.0):
+                best[node_id] = score
+        return sorted(best.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def resolve(self, text: str) -> Optional[str]:
+        """
+        Turn typed text into a city ID if it is exactly a city's name or ID.
+
+        Case, accents and separators don't matter, but prefixes and misspellings never
+        resolve on their own: use guess() or suggest() and ask the user to confirm.
+
+        Args:
+            text (str): User input (e.g. 'New York', 'new_york', 'NEW-YORK')
+
+        Returns:
+            Optional[str]: The city ID, or None if no city has that name or ID
+
+        Example:
+            index.resolve('LONDON')    # 'london'
+            index.resolve('lon')       # None (but guess('lon') is 'london')
+        """
+        return self._exact.get(normalize(text))
+
+    def guess(self, text: str) -> Optional[str]:
+        """
+        The one city that text most likely means, for a "Did you mean ...?" question.
+
+        Tries, in order: a prefix shared by only one city, and a misspelling that is clearly
+        closest to one city.
+
+        Args:
+            text (str): User input that did not resolve (e.g. 'new y', 'newyork')
+
+        Returns:
+            Optional[str]: The city ID, or None if nothing or more than one city matches
+                           (use suggest() to show the candidates)
+
+        Example:
+            index.guess('vanc')        # 'vancouver' (only city starting with 'vanc')
+            index.guess('vancuver')    # 'vancouver' (close enough spelling)
+            index.guess('xyz')         # None
+        """
+        key = normalize(text)
+        if not key:
+            return None
+        completions = self.complete(key, limit=2)
+        if len(completions) == 1:
+            return completions[0]
+        if completions:
+            return None
+        matches = self.fuzzy(key, limit=2, min_score=self.ACCEPT_SCORE)
+        if matches and matches[0][1] >= self.ACCEPT_SCORE and (len(matches) == 1 or matches[0][1] > matches[1][1]):
+            return matches[0][0]
+        return None
+
+    def suggest(self, text: str, limit: int = 5) -> List[str]:
+        """
+        Candidate city IDs for text that did not resolve: completions first, then similar spellings.
+
+        Args:
+            text (str): User input
+            limit (int): Maximum number of cities returned
+
+        Returns:
+            List[str]: Candidate city IDs
+        """
+        suggestions = self.complete(text, limit)
+        for node_id, _ in self.fuzzy(text, limit):
+            if len(suggestions) == limit:
+                break
+            if node_id not in suggestions:
+                suggestions.append(node_id)
+        return suggestions
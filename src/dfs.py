@@ -1,11 +1,15 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from src.graph import Graph
+from src.path_labels import PathLabels
+from src.trace import collect_steps, no_route_step
 
 
 def dfs_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[dict], List[Tuple[List[str], float]]]:
     """
     Performs Depth-First Search to find ALL possible routes from start to goal.
     
+    Eager wrapper around dfs_steps: runs the whole search and keeps every step in a list.
+    
     Args:
         graph (Graph): The flight graph containing cities and routes
         start (str): Starting city ID (e.g., 'vancouver')
@@ -18,51 +22,85 @@ def dfs_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[dict], List[
     
     Example:
         steps, all_routes = dfs_pathfind(graph, 'vancouver', 'new_york')
+    """
+    steps, all_routes = collect_steps(dfs_steps(graph, start, goal))
+    return (steps, all_routes)
+
+
+def dfs_steps(graph: Graph, start: str, goal: str) -> Iterator[dict]:
+    """
+    Performs Depth-First Search lazily, yielding each step as soon as it happens.
+    
+    Finds ALL possible routes from start to goal. Steps are produced on demand so a
+    caller can show the first step before the search has finished.
+    
+    Args:
+        graph (Graph): The flight graph containing cities and routes
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'new_york')
+    
+    Yields:
+        dict: One step of the DFS process at a time for users to see
+    
+    Returns:
+        List[Tuple] (as the generator's return value, see collect_steps):
+            - all_routes: List of tuples containing (path, cost) for each route found
+    
+    Example:
+        steps, all_routes = collect_steps(dfs_steps(graph, 'vancouver', 'new_york'))
         # all_routes = [
         #     (['Vancouver', 'New York'], 250.0),
         #     (['Vancouver', 'Beijing', 'New York'], 1600.0)
         # ]
     """
-    # Initialize stack with starting node, path, and cost
-    stack = [(start, [start], 0)]
+    # Search one fixed version of the graph, even if it is updated while the steps are consumed
+    graph = graph.snapshot()
+    # City records (NodeRecord), looked up once instead of through graph.nodes every time
+    nodes = graph.nodes
+
+    # Reject unreachable goals up front instead of enumerating every path in vain
+    if not graph.can_reach(start, goal):
+        yield no_route_step(nodes, start, goal, stack=[])
+        return []
+
+    # Paths are kept as parent pointers; stack entries carry a label number instead of a path list
+    labels = PathLabels(start)
+    # Initialize stack with starting node, its label, and cost
+    stack = [(start, 0, 0)]
     # Store all valid paths found
     all_routes = []
-    # Record each step for users to see
-    steps = []
     
     while stack:
-        current_node, path, cost = stack.pop()
+        current_node, label, cost = stack.pop()
+        path = labels.path(label)
         
         # Record this step for instructional display
         step = {
-            'action': f'Pop: {graph.nodes[current_node]["name"]}',
-            'stack': [graph.nodes[node]["name"] for node, _, _ in stack],
-            'current_path': [graph.nodes[node]["name"] for node in path],
+            'action': f'Pop: {nodes[current_node].name}',
+            'stack': [nodes[node].name for node, _, _ in stack],
+            'current_path': [nodes[node].name for node in path],
             'cost': cost
         }
 
         if current_node == goal:
-            step['action'] = f'Goal found: {graph.nodes[goal]["name"]}!'
-            steps.append(step)
-            # Change city IDs to readable names
-            for i, city_id in enumerate(path):
-                city_name = graph.nodes[city_id]['name']
-                path[i] = city_name
-            all_routes.append((path, cost))
+            step['action'] = f'Goal found: {nodes[goal].name}!'
+            yield step
+            # The path of readable names was already built for the step
+            all_routes.append((list(step['current_path']), cost))
             continue
         
         neighbors = graph.get_neighbors(current_node)
-        neighbor = [(graph.nodes[n]["name"], w) for n, w in neighbors]
+        neighbor = [(nodes[n].name, w) for n, w in neighbors]
         step['neighbors'] = neighbor
             # Add unvisited neighbors to stack
         for neighbor, weight in neighbors:
             # if the city is visited in the current path, skip it to avoid cycles
             if neighbor not in path:
-                stack.append((neighbor, path + [neighbor], cost + weight))
+                stack.append((neighbor, labels.add(neighbor, label), cost + weight))
 
         # Record the updated queue state after adding neighbors
-        updated_stack = [graph.nodes[node]["name"] for node, _, _ in stack]
+        updated_stack = [nodes[node].name for node, _, _ in stack]
         step['updated_stack'] = updated_stack
-        steps.append(step)
+        yield step
     
-    return (steps, all_routes)
+    return all_routes
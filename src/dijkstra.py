@@ -1,33 +1,79 @@
-import heapq
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from src.graph import Graph
+from src.path_labels import PathLabels
+from src.priority_queues import make_queue
+from src.trace import collect_steps, no_route_step
 
 
-def dijkstra_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[str], float]:
+def dijkstra_pathfind(graph: Graph, start: str, goal: str,
+                      weight: Optional[Union[str, Dict[str, float]]] = None,
+                      priority_queue: Union[str, Callable] = 'heap') -> Tuple[List[dict], List[str], float]:
     """
     Performs Dijkstra's shortest path algorithm to find the minimum cost path from start to goal.
     
-    Uses a min-heap (priority queue) to always explore the node with lowest accumulated cost first.
-    Guarantees finding the optimal (lowest cost) path. Records each step for users to see.
+    Eager wrapper around dijkstra_steps: runs the whole search and keeps every step in a list.
     
     Args:
         graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
         start (str): Starting city ID (e.g., 'vancouver')
         goal (str): Destination city ID (e.g., 'new_york')
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost, or a
+            linear combination such as {'weight': 1.0, 'duration': 50.0} (see Graph.get_neighbors).
+            Defaults to the edge weight.
+        priority_queue (str or callable): Frontier queue strategy (see make_queue): 'heap'
+            (default, any costs), or 'bucket'/'radix' for whole-number costs such as whole-dollar fares.
     
     Returns:
         Tuple[List[Dict], List[str], float]:
             - steps: List of dictionaries containing step-by-step actions for users to see
+            - path: List of city names from start to goal (empty list if no path exists)
+            - cost: Total cost of the shortest path. Returns float('inf') if no path exists
+    
+    Example:
+        steps, path, cost = dijkstra_pathfind(graph, 'vancouver', 'new_york')
+        steps, path, cost = dijkstra_pathfind(graph, 'vancouver', 'new_york', priority_queue='radix')
+    """
+    steps, (path, cost) = collect_steps(dijkstra_steps(graph, start, goal, weight, priority_queue))
+    return (steps, path, cost)
+
+
+def dijkstra_steps(graph: Graph, start: str, goal: str,
+                   weight: Optional[Union[str, Dict[str, float]]] = None,
+                   priority_queue: Union[str, Callable] = 'heap') -> Iterator[dict]:
+    """
+    Performs Dijkstra's shortest path algorithm lazily, yielding each step as soon as it happens.
+    
+    Uses a min-heap (priority queue) to always explore the node with lowest accumulated cost first.
+    Guarantees finding the optimal (lowest cost) path. Steps are produced on demand so a
+    caller can show the first step before the search has finished.
+    
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'new_york')
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost, or a
+            linear combination such as {'weight': 1.0, 'duration': 50.0} (see Graph.get_neighbors).
+            Defaults to the edge weight.
+        priority_queue (str or callable): Frontier queue strategy (see make_queue): 'heap'
+            (default, any costs), or 'bucket'/'radix' for whole-number costs such as whole-dollar fares.
+    
+    Yields:
+        dict: One step at a time for users to see
               Each step includes: action, queue state, current path, cost, neighbors, updated queue
+    
+    Returns:
+        Tuple[List[str], float] (as the generator's return value, see collect_steps):
             - path: List of city names from start to goal (empty list if no path exists)
             - cost: Total cost of the shortest path (sum of edge weights). Returns float('inf') if no path exists
     
-    Time Complexity: O((V + E) log V) where V is vertices and E is edges
-    Space Complexity: O(V) for the priority queue and cost dictionary
+    Time Complexity: O((V + E) log V) where V is vertices and E is edges (binary heap);
+                     O(V + E + C) with the bucket queue and O((V + E) log C) with the radix heap,
+                     for a final cost C
+    Space Complexity: O(V + E) for the priority queue, cost dictionary and path labels
     
     Algorithm Overview:
         1. Start with the source node at cost 0
-        2. Use a min-heap to always process the lowest-cost unvisited node next
+        2. Use a min-priority queue (binary heap by default) to always process the lowest-cost unvisited node next
         3. For each node, relax all outgoing edges (update neighbor costs if lower cost found)
         4. Stop when goal node is reached with minimum cost
         5. Continue exploring to ensure optimality
@@ -38,71 +84,77 @@ def dijkstra_pathfind(graph: Graph, start: str, goal: str) -> Tuple[List[str], f
         - Works with non-negative edge weights
         - Greedy algorithm that always picks lowest cost node next
         - Guarantees optimal solution for single-source shortest path
+        - Unreachable goals are rejected before searching (see Graph.can_reach)
     
     Differences from other algorithms:
         - vs BFS: Dijkstra minimizes cost, BFS minimizes hops
         - vs DFS: Dijkstra finds one optimal path, DFS finds all paths
     
     Example:
-        steps, path, cost = dijkstra_pathfind(graph, 'vancouver', 'new_york')
+        steps, (path, cost) = collect_steps(dijkstra_steps(graph, 'vancouver', 'new_york'))
         # path = ['Vancouver', 'Calgary', 'Toronto', 'New York']
         # cost = 550.0  (lowest cost path)
         # steps = [step1, step2, step3, ...]
     
     Raises:
-        Does not raise exceptions; returns empty path and infinite cost if no solution exists
+        ValueError: If a bucket/radix queue meets a cost that is not a whole number.
+        Otherwise returns empty path and infinite cost if no solution exists
     """
-    # Initialize min-heap with starting node at cost 0
-    queue = [(0, start, [start])]
+    # Search one fixed version of the graph, even if it is updated while the steps are consumed
+    graph = graph.snapshot()
+    # City records (NodeRecord), looked up once instead of through graph.nodes every time
+    nodes = graph.nodes
+
+    # Reject unreachable goals up front using the graph's reachability index
+    if not graph.can_reach(start, goal):
+        yield no_route_step(nodes, start, goal, queue=[])
+        return ([], float('inf'))
+
+    # Paths are kept as parent pointers; queue entries carry a label number instead of a path list
+    labels = PathLabels(start)
+    # Initialize the priority queue with starting node at cost 0; items are (city ID, label)
+    queue = make_queue(priority_queue)
+    queue.push(0, (start, 0))
     # Track the minimum cost to reach each node (for cheaper)
     cost = {start: 0}
-    # Store each step for users to see
-    steps = []
     
     # Continue until all reachable nodes are explored
     while queue:
-        # Pop node with lowest cost from min-heap (greedy choice)
-        current_cost, current_node, path = heapq.heappop(queue)
+        # Pop node with lowest cost from the priority queue (greedy choice)
+        current_cost, (current_node, label) = queue.pop()
         
         # Record this step for instructional display
         step = {
-            'action': f'Pop: {graph.nodes[current_node]["name"]} (Cost: {current_cost})',
-            'queue': [(current_cost, graph.nodes[node]["name"]) for current_cost, node, _ in queue],
-            'current_path': [graph.nodes[node]["name"] for node in path],
+            'action': f'Pop: {nodes[current_node].name} (Cost: {current_cost})',
+            'queue': [(current_cost, nodes[node].name) for current_cost, (node, _) in queue],
+            'current_path': [nodes[node].name for node in labels.path(label)],
             'cost': current_cost
         }
 
         # Check if we reached the goal - Dijkstra guarantees this is the minimum cost path
         if current_node == goal:
-            step['action'] = f'Goal found: {graph.nodes[goal]["name"]}!'
-            steps.append(step)
-            # Change city IDs to readable names
-            for i, city_id in enumerate(path):
-                city_name = graph.nodes[city_id]['name']
-                path[i] = city_name
-            return (steps, path, current_cost)
+            step['action'] = f'Goal found: {nodes[goal].name}!'
+            yield step
+            # The path of readable names was already built for the step
+            return (list(step['current_path']), current_cost)
         
         # Get all outgoing flights from current city
-        neighbors = graph.get_neighbors(current_node)
-        neighbor_names = []
-        for neighbor in neighbors:
-            neighbor_id, weight = neighbor
-            neighbor_names.append((graph.nodes[neighbor_id]["name"], weight))
-        step['neighbors'] = neighbor_names
+        neighbors = graph.get_neighbors(current_node) if weight is None else graph.get_neighbors(current_node, weight)
+        step['neighbors'] = [(nodes[neighbor_id].name, edge_cost) for neighbor_id, edge_cost in neighbors]
 
         # Update neighbor costs if cheaper path foun
-        for neighbor, weight in graph.get_neighbors(current_node):
+        for neighbor, edge_cost in neighbors:
             # Calculate new cost to reach neighbor through current node
-            new_cost = current_cost + weight
+            new_cost = current_cost + edge_cost
             # If neighbor hasn't been visited or found cheaper path, update it
             if neighbor not in cost or new_cost < cost[neighbor]:
                 cost[neighbor] = new_cost
-                heapq.heappush(queue, (new_cost, neighbor, path + [neighbor]))
+                queue.push(new_cost, (neighbor, labels.add(neighbor, label)))
 
-        # Record the updated heap state after adding neighbors
-        updated_queue = [(current_cost, graph.nodes[node]["name"]) for current_cost, node, _ in queue]
+        # Record the updated queue state after adding neighbors
+        updated_queue = [(current_cost, nodes[node].name) for current_cost, (node, _) in queue]
         step['updated_queue'] = updated_queue
-        steps.append(step)
+        yield step
 
     # No path found - return empty path and infinite cost
-    return (steps, [], float('inf'))
+    return ([], float('inf'))
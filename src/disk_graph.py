@@ -0,0 +1,292 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from src.graph import NodeRecord
+from src.reachability import ReachabilityIndex
+
+
+class LRUCache:
+    """
+    A bounded least-recently-used cache.
+
+    Attributes:
+        capacity (int): Maximum number of entries kept (0 disables caching)
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that had to go to disk
+
+    Example:
+        cache = LRUCache(2)
+        cache.put('yvr', [('yyz', 350.0)])
+        cache.get('yvr')   # [('yyz', 350.0)]
+    """
+    def __init__(self, capacity: int):
+        """
+        Create an empty cache.
+
+        Args:
+            capacity (int): Maximum number of entries kept
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return the cached value (marking it most recently used), or None if absent."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if the cache is full."""
+        if self.capacity <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _NodeView(Mapping):
+    # Read-only dict-like view of the nodes table, so graph.nodes[node_id]["name"] keeps working
+    def __init__(self, graph: 'DiskGraph'):
+        self._graph = graph
+
+    def __getitem__(self, node_id: str) -> NodeRecord:
+        node = self._graph._node_cache.get(node_id)
+        if node is None:
+            row = self._graph._query_one("SELECT name FROM nodes WHERE id = ?", (node_id,))
+            if row is None:
+                raise KeyError(node_id)
+            node = NodeRecord(row[0])
+            self._graph._node_cache.put(node_id, node)
+        return node
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._graph._query_all("SELECT id FROM nodes ORDER BY rowid")])
+
+    def __len__(self) -> int:
+        return self._graph._query_one("SELECT COUNT(*) FROM nodes")[0]
+
+    def __contains__(self, node_id) -> bool:
+        try:
+            self[node_id]
+        except KeyError:
+            return False
+        return True
+
+
+class DiskGraph:
+    """
+    A directed weighted flight graph stored in SQLite instead of in memory.
+
+    Offers the same interface the searches use (`nodes`, `get_neighbors`, `can_reach`),
+    so bfs_pathfind, dijkstra_pathfind, dfs_pathfind and the other queries run on it
+    unchanged. Only a bounded number of adjacency lists ("pages", one per city) and city
+    records are kept in memory, in LRU caches; everything else is read from disk on demand.
+
+    The reachability index used to reject unreachable goals without searching is opt-in:
+    it is built with one pass over the whole stored graph and kept in memory (a dict over
+    every city plus one bitset per component), which only fits graphs that fit in RAM.
+
+    Attributes:
+        path (str): SQLite database file (':memory:' for a temporary in-memory database)
+        nodes (Mapping): Read-only view of the cities: {node_id: NodeRecord(city_name), ...}
+        neighbor_cache (LRUCache): Cache of adjacency lists, keyed by city ID
+
+    Example:
+        graph = DiskGraph('routes.sqlite', cache_size=4096)
+        graph.add_node('yvr', 'Vancouver')
+        graph.add_node('yyz', 'Toronto')
+        graph.add_edge('yvr', 'yyz', 350.0)
+        graph.commit()
+
+        steps, path, cost = dijkstra_pathfind(graph, 'yvr', 'yyz')
+    """
+    def __init__(self, path: str, cache_size: int = 1024, reachability_index: bool = False):
+        """
+        Open (or create) a disk-backed graph.
+
+        Args:
+            path (str): SQLite database file
+            cache_size (int): Maximum number of adjacency lists and of city records kept in memory
+            reachability_index (bool): Build an in-memory ReachabilityIndex on the first
+                can_reach() call (default False: can_reach only checks that both cities exist,
+                and searches find out reachability themselves)
+        """
+        self.path = path
+        self.reachability_index = reachability_index
+        # Searches may run on other threads (e.g. the background trace writer), so share one
+        # connection and serialize access with a lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS nodes (id TEXT PRIMARY KEY, name TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS edges (from_node TEXT NOT NULL, to_node TEXT NOT NULL,
+                                                  weight REAL NOT NULL);
+                CREATE INDEX IF NOT EXISTS edges_by_from_node ON edges (from_node);
+            """)
+        self.neighbor_cache = LRUCache(cache_size)
+        self._node_cache = LRUCache(cache_size)
+        self.nodes = _NodeView(self)
+        self._reachability = None
+
+    @classmethod
+    def from_graph(cls, graph, path: str, cache_size: int = 1024, reachability_index: bool = False) -> 'DiskGraph':
+        """
+        Copy an in-memory graph into a new disk-backed graph.
+
+        Args:
+            graph: The graph to copy (anything exposing `nodes` and `get_neighbors`)
+            path (str): SQLite database file to write
+            cache_size (int): Cache size for the returned DiskGraph
+            reachability_index (bool): See DiskGraph()
+
+        Returns:
+            DiskGraph: The disk-backed copy
+        """
+        disk_graph = cls(path, cache_size, reachability_index)
+        with disk_graph._lock:
+            disk_graph._connection.executemany(
+                "INSERT OR REPLACE INTO nodes (id, name) VALUES (?, ?)",
+                ((node_id, graph.nodes[node_id]["name"]) for node_id in graph.nodes))
+            disk_graph._connection.executemany(
+                "INSERT INTO edges (from_node, to_node, weight) VALUES (?, ?, ?)",
+                ((node_id, neighbor, weight)
+                 for node_id in graph.nodes for neighbor, weight in graph.get_neighbors(node_id)))
+            disk_graph._connection.commit()
+        return disk_graph
+
+    def snapshot(self) -> 'DiskGraph':
+        """
+        Return the graph itself; searches call this to pin a version of an in-memory Graph.
+
+        A DiskGraph has no versions: every read goes through the same locked connection,
+        so readers see updates as soon as they are written.
+        """
+        return self
+
+    def _query_one(self, sql: str, parameters: tuple = ()):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def _query_all(self, sql: str, parameters: tuple = ()) -> list:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def add_node(self, node_id: str, name: str):
+        """
+        Add a city (node) to the graph. Call commit() to make additions durable.
+
+        Args:
+            node_id (str): Unique identifier for the city (e.g., 'yvr')
+            name (str): Human-readable name of the city (e.g., 'Vancouver')
+        """
+        with self._lock:
+            # Like Graph.add_node, re-adding a city clears its routes
+            self._connection.execute("INSERT OR REPLACE INTO nodes (id, name) VALUES (?, ?)", (node_id, name))
+            self._connection.execute("DELETE FROM edges WHERE from_node = ?", (node_id,))
+        self._node_cache.discard(node_id)
+        self.neighbor_cache.discard(node_id)
+        if self._reachability is not None:
+            self._reachability.add_node(node_id)
+
+    def add_edge(self, from_node: str, to_node: str, weight: float):
+        """
+        Add a one-way flight route. Call commit() to make additions durable.
+
+        Args:
+            from_node (str): Starting city ID (e.g., 'yvr')
+            to_node (str): Destination city ID (e.g., 'yyz')
+            weight (float): Cost of the flight
+        """
+        with self._lock:
+            self._connection.execute("INSERT INTO edges (from_node, to_node, weight) VALUES (?, ?, ?)",
+                                     (from_node, to_node, weight))
+        self.neighbor_cache.discard(from_node)
+        if self._reachability is not None:
+            self._reachability.add_edge(from_node, to_node)
+
+    def commit(self):
+        """Write pending additions to disk."""
+        with self._lock:
+            self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get_neighbors(self, node_id: str,
+                      weight: Optional[Union[str, Dict[str, float]]] = None) -> Optional[List[Tuple[str, float]]]:
+        """
+        Get all outgoing flights from a city, reading them from disk if not cached.
+
+        Args:
+            node_id (str): The city ID to query (e.g., 'yvr')
+            weight (str or Dict[str, float], optional): Which cost to report, as in
+                Graph.get_neighbors. Only the 'weight' attribute is stored on disk, so this
+                may be None, 'weight' or a dict such as {'weight': 0.5}.
+
+        Returns:
+            List[Tuple[str, float]]: List of (neighbor_id, cost) tuples
+            Returns None if node doesn't exist
+
+        Raises:
+            KeyError: If weight names any attribute other than 'weight'
+        """
+        if weight is not None and weight != 'weight':
+            unknown = sorted(set([weight] if isinstance(weight, str) else weight) - {'weight'})
+            if unknown:
+                raise KeyError(f"DiskGraph only stores the 'weight' attribute, not {', '.join(unknown)}")
+            neighbors = self.get_neighbors(node_id)
+            if neighbors is None:
+                return None
+            factor = weight['weight']
+            return [(neighbor, cost * factor) for neighbor, cost in neighbors]
+
+        neighbors = self.neighbor_cache.get(node_id)
+        if neighbors is not None:
+            return neighbors
+        if node_id not in self.nodes:
+            return None
+        neighbors = [(to_node, weight) for to_node, weight in self._query_all(
+            "SELECT to_node, weight FROM edges WHERE from_node = ? ORDER BY rowid", (node_id,))]
+        self.neighbor_cache.put(node_id, neighbors)
+        return neighbors
+
+    def can_reach(self, from_node: str, to_node: str) -> bool:
+        """
+        Check whether any route exists from one city to another, without searching.
+
+        With reachability_index=True, builds a ReachabilityIndex on the first call (one pass
+        over the stored graph, kept in memory); later calls are a single bit test. Otherwise
+        only checks that both cities exist, so a search still runs to find out.
+
+        Args:
+            from_node (str): Starting city ID
+            to_node (str): Destination city ID
+
+        Returns:
+            bool: False if to_node is known to be unreachable from from_node (or either city
+                  doesn't exist), True otherwise
+        """
+        if not self.reachability_index:
+            return from_node in self.nodes and to_node in self.nodes
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self)
+        return self._reachability.can_reach(from_node, to_node)
@@ -0,0 +1,90 @@
+from typing import Callable, List, Optional, Union
+import numpy as np
+from src.graph import Graph
+from src.priority_queues import make_queue
+
+
+def distance_matrix(graph: Graph, sources: List[str], targets: List[str],
+                    out_path: Optional[str] = None, priority_queue: Union[str, Callable] = 'heap') -> np.ndarray:
+    """
+    Computes the cheapest cost from every source city to every target city.
+
+    Runs one Dijkstra search per source (instead of one dijkstra_pathfind call per pair)
+    and stops each search as soon as every reachable target is settled. No paths or step
+    traces are built, only costs.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        sources (List[str]): Origin city IDs (matrix rows)
+        targets (List[str]): Destination city IDs (matrix columns)
+        out_path (str, optional): Write the matrix to this .npy file through a memory map
+                                  instead of holding it in RAM. Rows are written as they finish.
+        priority_queue (str or callable): Frontier queue strategy (see make_queue). 'bucket' or
+                                          'radix' suit whole-number costs such as whole-dollar fares.
+
+    Returns:
+        np.ndarray: float64 array of shape (len(sources), len(targets)). Entry [i, j] is the
+            cheapest cost from sources[i] to targets[j], or inf if there is no route.
+            When out_path is given this is the memory-mapped array backed by that file.
+
+    Time Complexity: O(S * (V + E) log V) in the worst case for S sources
+    Space Complexity: O(V) per search plus the S x T matrix
+
+    Example:
+        matrix = distance_matrix(graph, ['vancouver', 'london'], ['seoul', 'daqing'])
+        # matrix = [[1000., 1300.],
+        #           [ 600.,  900.]]
+
+        # Large matrices can go straight to disk
+        matrix = distance_matrix(graph, origins, destinations, out_path='costs.npy')
+        # later: np.load('costs.npy', mmap_mode='r')
+    """
+    # Every row is computed on the same version of the graph
+    graph = graph.snapshot()
+    shape = (len(sources), len(targets))
+    if out_path is not None:
+        matrix = np.lib.format.open_memmap(out_path, mode='w+', dtype=np.float64, shape=shape)
+        matrix[:] = np.inf
+    else:
+        matrix = np.full(shape, np.inf)
+
+    # A city can appear more than once in targets; remember every column it fills
+    columns = {}
+    for column, target in enumerate(targets):
+        columns.setdefault(target, []).append(column)
+
+    for row, source in enumerate(sources):
+        # Only wait for targets that can actually be reached (no full search for the rest)
+        remaining = {target for target in columns if graph.can_reach(source, target)}
+        if remaining:
+            _fill_row(graph, source, columns, remaining, matrix[row], priority_queue)
+
+    if out_path is not None:
+        matrix.flush()
+    return matrix
+
+
+def _fill_row(graph: Graph, source: str, columns: dict, remaining: set, row: np.ndarray,
+              priority_queue: Union[str, Callable]):
+    # Plain Dijkstra from one source that stops once every wanted target is settled
+    queue = make_queue(priority_queue)
+    queue.push(0.0, source)
+    cost = {source: 0.0}
+    settled = set()
+
+    while queue and remaining:
+        current_cost, current_node = queue.pop()
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+
+        if current_node in remaining:
+            remaining.discard(current_node)
+            for column in columns[current_node]:
+                row[column] = current_cost
+
+        for neighbor, weight in graph.get_neighbors(current_node):
+            new_cost = current_cost + weight
+            if neighbor not in cost or new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                queue.push(new_cost, neighbor)
@@ -1,4 +1,205 @@
-from typing import List, Tuple
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Union
+from src.reachability import ReachabilityIndex
+
+# A published draft with at most this many additions carries the reachability index forward,
+# updated incrementally. Larger drafts drop it and the next can_reach() rebuilds it: one
+# O(V + E) build is cheaper than an O(C) bitset pass per added route.
+REACHABILITY_REPLAY_LIMIT = 16
+
+
+class NodeRecord:
+    """
+    Data stored for one city: a fixed-layout record instead of a per-city dict.
+
+    Uses __slots__ (no per-instance __dict__) and an interned name, so every record and
+    every search step that mentions the city share one string object. Supports
+    record["name"] as well as record.name, like the dict it replaces.
+
+    Attributes:
+        name (str): Human-readable name of the city (e.g., 'Vancouver')
+
+    Example:
+        record = NodeRecord('Vancouver')
+        record.name        # 'Vancouver'
+        record['name']     # 'Vancouver'
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = sys.intern(name)
+
+    def __getitem__(self, key: str):
+        if key != 'name':
+            raise KeyError(key)
+        return self.name
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NodeRecord):
+            return self.name == other.name
+        return other == {'name': self.name}
+
+    def __repr__(self) -> str:
+        return f"NodeRecord({self.name!r})"
+
+    def __getstate__(self):
+        return self.name
+
+    def __setstate__(self, name):
+        self.name = sys.intern(name)
+
+
+class GraphSnapshot:
+    """
+    One immutable version of a Graph.
+
+    Searches read a snapshot instead of the live graph, so a concurrent add_edge can never
+    change the adjacency lists they are iterating. A snapshot is never modified after it is
+    published; an update builds a new snapshot with fresh lists for the changed cities and
+    shares every unchanged adjacency list with the previous one.
+
+    Attributes:
+        nodes (Dict): {node_id: NodeRecord, ...} (read-only)
+        edges (Dict): {node_id: [(neighbor_id, weight), ...], ...} (read-only)
+        edge_ids (Dict): {node_id: [edge_id, ...], ...}, parallel to edges
+        attributes (Dict): {attribute_name: array('d')} edge attribute columns, indexed by edge number.
+                           Columns only ever grow, and a snapshot only reads its own edge numbers.
+        version (int): Number of updates published before this snapshot
+
+    Example:
+        snapshot = graph.snapshot()
+        snapshot.get_neighbors('yvr')   # unaffected by later graph.add_edge calls
+    """
+    def __init__(self, nodes: dict, edges: dict, edge_ids: dict, attributes: dict, version: int):
+        """
+        Store one version of the graph data. Snapshots are created by Graph.
+        """
+        self.nodes = nodes
+        self.edges = edges
+        self.edge_ids = edge_ids
+        self.attributes = attributes
+        self.version = version
+        # Reachability index, built on the first can_reach() call or carried over from the previous version
+        self._reachability = None
+        # Edge-list arrays for vectorized algorithms, built on first use by GraphArrays.from_graph
+        self._arrays = None
+
+    def snapshot(self) -> 'GraphSnapshot':
+        """Return this snapshot (it is already immutable)."""
+        return self
+
+    def get_neighbors(self, node_id: str,
+                      weight: Optional[Union[str, Dict[str, float]]] = None) -> List[Tuple[str, float]]:
+        """
+        Get all outgoing flights from a city in this version. See Graph.get_neighbors.
+        """
+        # Get the outgoing edges (flights) from the given node
+        # Returns None if the node doesn't exist in the graph
+        neighbors = self.edges.get(node_id)
+        if weight is None or neighbors is None:
+            return neighbors
+
+        # Read the selected column(s) by edge number; the graph itself is not copied
+        edge_ids = self.edge_ids[node_id]
+        if isinstance(weight, str):
+            column = self.attributes[weight]
+            costs = [column[edge_id] for edge_id in edge_ids]
+        else:
+            terms = [(self.attributes[name], factor) for name, factor in weight.items()]
+            costs = [sum(column[edge_id] * factor for column, factor in terms) for edge_id in edge_ids]
+        return [(neighbor, cost) for (neighbor, _), cost in zip(neighbors, costs) if cost < float('inf')]
+
+    def can_reach(self, from_node: str, to_node: str) -> bool:
+        """
+        Check whether any route exists in this version. See Graph.can_reach.
+        """
+        # Two readers may both build the index; they build identical ones, so either may win
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self)
+        return self._reachability.can_reach(from_node, to_node)
+
+
+class _Draft:
+    # Updates collected by the writer before they are published as one new snapshot.
+    # The top-level dictionaries are copied lazily, the first time the draft changes them.
+    def __init__(self, base: GraphSnapshot):
+        self.base = base
+        self.nodes = None
+        self.attributes = None
+        # New edge lists of the cities changed in this draft (other cities keep the base lists)
+        self.edges = {}
+        self.edge_ids = {}
+        # Additions in order, replayed on a copy of the reachability index: (node, None) or (from, to)
+        self.changes = []
+        # The shared columns are appended in place; remember where this draft started
+        self.edge_count = len(base.attributes['weight'])
+
+    def add_node(self, node_id: str, name: str):
+        if self.nodes is None:
+            self.nodes = dict(self.base.nodes)
+        self.nodes[node_id] = NodeRecord(name)
+        self.edges[node_id] = []
+        self.edge_ids[node_id] = []
+        self.changes.append((node_id, None))
+
+    def add_edge(self, from_node: str, to_node: str, weight: float, attributes: Dict[str, float]):
+        if from_node not in self.edges:
+            if from_node not in self.base.edges:
+                raise KeyError(from_node)
+            self.edges[from_node] = list(self.base.edges[from_node])
+            self.edge_ids[from_node] = list(self.base.edge_ids[from_node])
+        self.edges[from_node].append((to_node, weight))
+
+        # Append one value to every attribute column under a new edge number
+        columns = self.attributes if self.attributes is not None else self.base.attributes
+        edge_id = len(columns['weight'])
+        self.edge_ids[from_node].append(edge_id)
+        for name in attributes:
+            if name not in columns:
+                if self.attributes is None:
+                    self.attributes = columns = dict(self.base.attributes)
+                # New attribute: earlier edges don't have it
+                columns[name] = array('d', [float('inf')]) * edge_id
+        for name, column in columns.items():
+            column.append(weight if name == 'weight' else attributes.get(name, float('inf')))
+        self.changes.append((from_node, to_node))
+
+    def discard(self):
+        # Drop this draft's values from the shared columns (no published version uses them)
+        for column in self.base.attributes.values():
+            del column[self.edge_count:]
+
+    def publish(self) -> GraphSnapshot:
+        base = self.base
+        # Copy the top-level mapping once per publish; unchanged cities share their lists
+        edges = dict(base.edges)
+        edge_ids = dict(base.edge_ids)
+        edges.update(self.edges)
+        edge_ids.update(self.edge_ids)
+        snapshot = GraphSnapshot(self.nodes if self.nodes is not None else base.nodes, edges, edge_ids,
+                                 self.attributes if self.attributes is not None else base.attributes,
+                                 base.version + 1)
+
+        # Carry an existing reachability index forward, updated incrementally for small drafts
+        if base._reachability is not None and len(self.changes) <= REACHABILITY_REPLAY_LIMIT:
+            reachability = base._reachability.copy(snapshot)
+            try:
+                for from_node, to_node in self.changes:
+                    if to_node is None:
+                        reachability.add_node(from_node)
+                    else:
+                        reachability.add_edge(from_node, to_node)
+            except Exception:
+                # The index is only a cache: never let it stop the updates from being published
+                reachability._stale = True
+            # A stale index would be rebuilt in place while readers use it; let the new version build its own
+            if not reachability._stale:
+                snapshot._reachability = reachability
+        return snapshot
 
 
 class Graph:
@@ -8,41 +209,161 @@ class Graph:
     Stores cities as nodes and flight routes as edges with costs (distances or prices).
     Supports adding nodes and edges, and querying neighbor connections.
     
+    Safe to read while another thread updates it: the data lives in an immutable
+    GraphSnapshot, readers take the current one without locking, and writers build the
+    next snapshot and swap it in with a single assignment (copy-on-write). Wrap many
+    updates in batch() to publish them as one new version.
+    
+    Updates made outside batch() are collected and published together the next time the
+    graph is read, so building a graph with one add_node/add_edge call at a time costs the
+    same as building it in one batch.
+    
     Attributes:
-        nodes (Dict): Dictionary mapping node IDs to node data
-                      Format: {node_id: {'name': city_name}, ...}
-        edges (Dict): Dictionary mapping node IDs to their outgoing edges
-                      Format: {node_id: [(neighbor_id, weight), ...], ...}
+        nodes (Mapping): Read-only view mapping node IDs to node records
+                         Format: {node_id: NodeRecord(city_name), ...} (record['name'] works too)
+        edges (Mapping): Read-only view mapping node IDs to their outgoing edges
+                         Format: {node_id: [(neighbor_id, weight), ...], ...}
+        edge_ids (Mapping): Edge numbers parallel to each edges list
+                            Format: {node_id: [edge_id, ...], ...}
+        attributes (Mapping): Column-wise edge attributes, one float array per attribute name,
+                              indexed by edge number. Always has a 'weight' column.
+                              Format: {'weight': array('d', [...]), 'duration': array('d', [...]), ...}
     
     Example:
         graph = Graph()
         graph.add_node('yvr', 'Vancouver')
         graph.add_node('yyz', 'Toronto')
-        graph.add_edge('yvr', 'yyz', 350.0)
+        graph.add_edge('yvr', 'yyz', 350.0, duration=4.5, distance=3350.0)
         
         neighbors = graph.get_neighbors('yvr')
         # neighbors = [('yyz', 350.0)]
+        neighbors = graph.get_neighbors('yvr', weight='duration')
+        # neighbors = [('yyz', 4.5)]
     """
     def __init__(self):
         """
         Initialize an empty graph with no nodes or edges.
         
-        Initializes two empty dictionaries:
+        Starts from an empty snapshot:
         - nodes: stores city information
         - edges: stores flight routes and their costs
         """
-        # Dictionary to store all cities (nodes) with their names
-        self.nodes = {
-            # node_id1: {'name': city name1},
-            # node_id2: {'name': city name2},
-            # ...
-        }
-        # Dictionary to store all flight routes (edges) with their costs
-        self.edges = {
-            # node_id1: [(to_node1, weight1), (to_node2, weight2), ...],
-            # node_id2: [(to_node3, weight3), (to_node4, weight4), ...],
-            # ...
-        }
+        self._snapshot = GraphSnapshot(
+            # node_id1: NodeRecord(city name1), ...
+            nodes={},
+            # node_id1: [(to_node1, weight1), (to_node2, weight2), ...], ...
+            edges={},
+            # Edge numbers, in the same order as the tuples in edges
+            edge_ids={},
+            # Edge attributes stored column-wise (struct of arrays), indexed by edge number
+            attributes={'weight': array('d')},
+            version=0,
+        )
+        # Writers serialize on this lock; readers never take it
+        self._write_lock = threading.RLock()
+        # Updates of the batch in progress (None outside batch())
+        self._draft = None
+        # Updates made outside batch() that no reader has needed yet (None if there are none)
+        self._pending = None
+    
+    def __getstate__(self):
+        # Locks can't be pickled; only the current version is saved
+        return {'_snapshot': self.snapshot()}
+    
+    def __setstate__(self, state):
+        self._snapshot = state['_snapshot']
+        self._write_lock = threading.RLock()
+        self._draft = None
+        self._pending = None
+    
+    def _publish_pending(self):
+        # Publish the updates collected outside batch() as one new version
+        with self._write_lock:
+            pending, self._pending = self._pending, None
+            if pending is not None:
+                try:
+                    self._snapshot = pending.publish()
+                except BaseException:
+                    # Keep the previous version; a failed draft must not fail every later read too
+                    pending.discard()
+                    raise
+    
+    def _writable_draft(self) -> _Draft:
+        # The draft an update goes into: the open batch's, or the pending one (called with the lock held)
+        if self._draft is not None:
+            return self._draft
+        if self._pending is None:
+            self._pending = _Draft(self._snapshot)
+        return self._pending
+    
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Get the current immutable version of the graph.
+        
+        Takes no lock, except to first publish updates made outside batch() since the last read.
+        
+        Returns:
+            GraphSnapshot: The latest published version. Later updates don't change it.
+        
+        Example:
+            snapshot = graph.snapshot()
+            for neighbor, cost in snapshot.get_neighbors('yvr'):
+                ...  # safe even if another thread calls graph.add_edge meanwhile
+        """
+        if self._pending is not None:
+            self._publish_pending()
+        return self._snapshot
+    
+    @property
+    def nodes(self):
+        """Read-only view of the current cities: {node_id: NodeRecord(city_name), ...}."""
+        return MappingProxyType(self.snapshot().nodes)
+    
+    @property
+    def edges(self):
+        """Read-only view of the current routes: {node_id: [(neighbor_id, weight), ...], ...}."""
+        return MappingProxyType(self.snapshot().edges)
+    
+    @property
+    def edge_ids(self):
+        """Read-only view of the edge numbers parallel to edges."""
+        return MappingProxyType(self.snapshot().edge_ids)
+    
+    @property
+    def attributes(self):
+        """Read-only view of the edge attribute columns."""
+        return MappingProxyType(self.snapshot().attributes)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group several updates into one new version of the graph.
+        
+        Other threads keep seeing the previous version until the block ends, then see all of
+        its updates at once. If the block raises, none of its updates are published.
+        Batches may be nested; the outermost one publishes.
+        
+        Example:
+            with graph.batch():
+                graph.add_edge('yvr', 'yyz', 320.0)
+                graph.add_edge('yyz', 'yvr', 320.0)
+        """
+        with self._write_lock:
+            if self._draft is not None:
+                yield
+                return
+            # Earlier single updates are published first, so a failed batch can't drop them
+            self._publish_pending()
+            self._draft = _Draft(self._snapshot)
+            try:
+                yield
+                # A single assignment, so readers see either the old or the new version
+                self._snapshot = self._draft.publish()
+            except BaseException:
+                self._draft.discard()
+                raise
+            finally:
+                self._draft = None
     
     def add_node(self, node_id: str, name: str):
         """
@@ -56,12 +377,12 @@ class Graph:
             graph.add_node('yvr', 'Vancouver')
             graph.add_node('yyz', 'Toronto')
         """
-        # Store the city name in nodes dictionary
-        self.nodes[node_id] = {'name': name}
-        # Initialize an empty list for edges from this node
-        self.edges[node_id] = []
+        with self._write_lock:
+            # Store the city name and start it with an empty edge list (in the next version)
+            # Interned IDs make the dict lookups during searches pointer comparisons
+            self._writable_draft().add_node(sys.intern(node_id), name)
     
-    def add_edge(self, from_node: str, to_node: str, weight: float):
+    def add_edge(self, from_node: str, to_node: str, weight: float, **attributes: float):
         """
         Add a flight route (edge) from one city to another with a cost.
         
@@ -72,6 +393,8 @@ class Graph:
             from_node (str): Starting city ID (e.g., 'yvr')
             to_node (str): Destination city ID (e.g., 'yyz')
             weight (float): Cost of the flight (distance, price, time, etc.)
+            **attributes (float): Extra named numeric attributes (e.g. duration=4.5).
+                                  Edges without a given attribute store inf for it.
         
         Example:
             # Direct flight from Vancouver to Toronto
@@ -80,31 +403,66 @@ class Graph:
             # Bidirectional flight
             graph.add_edge('yvr', 'yyz', 350.0)
             graph.add_edge('yyz', 'yvr', 350.0)
+            
+            # Flight with extra attributes, selectable later as the weight
+            graph.add_edge('yvr', 'sea', 150.0, duration=1.0, distance=200.0)
         """
-        # Add the destination city and cost as a tuple to the starting city's edge list
-        # This creates a directed edge: from_node -> to_node with weight
-        self.edges[from_node].append((to_node, weight))
+        with self._write_lock:
+            # Add the destination city and cost as a tuple to the starting city's edges
+            # This creates a directed edge: from_node -> to_node with weight
+            # (a KeyError for an unknown from_node is raised before anything changes)
+            self._writable_draft().add_edge(from_node, sys.intern(to_node), weight, attributes)
     
-    def get_neighbors(self, node_id: str) -> List[Tuple[str, float]]:
+    def get_neighbors(self, node_id: str,
+                      weight: Optional[Union[str, Dict[str, float]]] = None) -> List[Tuple[str, float]]:
         """
         Get all outgoing flights from a city.
         
         Args:
             node_id (str): The city ID to query (e.g., 'yvr')
+            weight (str or Dict[str, float], optional): Which cost to report for each flight.
+                - None (default): the edge weight
+                - 'duration': a single attribute column
+                - {'price': 1.0, 'duration': 50.0}: a linear combination of attributes
+                Flights missing a selected attribute are left out.
         
         Returns:
-            List[Tuple[str, float]]: List of (neighbor_id, cost) tuples
+            List[Tuple[str, float]]: List of (neighbor_id, cost) tuples (do not modify it)
             Returns None if node doesn't exist
         
+        Raises:
+            KeyError: If weight names an attribute no edge has
+        
         Example:
             neighbors = graph.get_neighbors('yvr')
             # neighbors = [('yyz', 350.0), ('sea', 150.0)]
             
+            neighbors = graph.get_neighbors('yvr', weight={'weight': 1.0, 'duration': 50.0})
+            # neighbors = [('yyz', 575.0), ('sea', 200.0)]
+            
             # Check if node exists
             neighbors = graph.get_neighbors('nonexistent')
             # neighbors = None
         """
-        # Get the list of outgoing edges (flights) from the given node
-        # Returns None if the node doesn't exist in the graph
-        neighbors = self.edges.get(node_id)
-        return neighbors
+        return self.snapshot().get_neighbors(node_id, weight)
+    
+    def can_reach(self, from_node: str, to_node: str) -> bool:
+        """
+        Check whether any route exists from one city to another, without searching.
+        
+        The first call builds a ReachabilityIndex over the graph; later calls are a single
+        bit test, and each new version carries the index over, updated incrementally.
+        
+        Args:
+            from_node (str): Starting city ID (e.g., 'yvr')
+            to_node (str): Destination city ID (e.g., 'yyz')
+        
+        Returns:
+            bool: True if to_node can be reached from from_node. False if either city doesn't exist.
+        
+        Example:
+            graph.add_edge('yvr', 'yyz', 350.0)
+            graph.can_reach('yvr', 'yyz')   # True
+            graph.can_reach('yyz', 'yvr')   # False (edges are one-way)
+        """
+        return self.snapshot().can_reach(from_node, to_node)
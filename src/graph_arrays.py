@@ -0,0 +1,96 @@
+from typing import Dict, List
+import numpy as np
+from src.graph import GraphSnapshot
+
+
+class GraphArrays:
+    """
+    Array-backed (edge list) copy of a Graph for vectorized algorithms.
+
+    Cities are numbered 0..n-1 and every edge i is stored as sources[i] -> targets[i]
+    with cost weights[i], so whole-graph operations can run as NumPy array expressions
+    instead of Python loops over the dict-of-lists adjacency.
+
+    Attributes:
+        node_ids (List[str]): City ID for each index (index -> ID)
+        index (Dict[str, int]): Index of each city ID (ID -> index)
+        names (List[str]): City name for each index
+        sources (np.ndarray): int64 array of edge start indices
+        targets (np.ndarray): int64 array of edge end indices
+        weights (np.ndarray): float64 array of edge costs
+
+    Example:
+        arrays = GraphArrays.from_graph(graph)
+        arrays.index['yvr']                # 0
+        arrays.weights[arrays.sources == 0]  # costs of every flight out of 'yvr'
+    """
+    def __init__(self, node_ids: List[str], names: List[str],
+                 sources: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+        """
+        Store the arrays. Use GraphArrays.from_graph to build them from a Graph.
+
+        Args:
+            node_ids (List[str]): City ID for each index
+            names (List[str]): City name for each index
+            sources (np.ndarray): Edge start indices
+            targets (np.ndarray): Edge end indices
+            weights (np.ndarray): Edge costs
+        """
+        self.node_ids = node_ids
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.names = names
+        self.sources = sources
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_graph(cls, graph) -> 'GraphArrays':
+        """
+        Build the edge arrays from a graph.
+
+        The arrays of a Graph version are built once and kept on its GraphSnapshot, so
+        repeated queries on an unchanged graph don't copy every edge again.
+
+        Args:
+            graph: The flight graph (anything exposing `nodes` and `get_neighbors`)
+
+        Returns:
+            GraphArrays: Edge-list arrays for the graph (shared; do not modify them)
+        """
+        # Copy one consistent version of the graph
+        graph = graph.snapshot()
+        if isinstance(graph, GraphSnapshot):
+            # Two readers may both build the arrays; they build identical ones, so either may win
+            if graph._arrays is None:
+                graph._arrays = cls._build(graph)
+            return graph._arrays
+        return cls._build(graph)
+
+    @classmethod
+    def _build(cls, graph) -> 'GraphArrays':
+        node_ids = list(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        names = [graph.nodes[node_id]["name"] for node_id in node_ids]
+
+        sources, targets, weights = [], [], []
+        for node_id in node_ids:
+            from_index = index[node_id]
+            for neighbor, weight in graph.get_neighbors(node_id):
+                sources.append(from_index)
+                targets.append(index[neighbor])
+                weights.append(weight)
+
+        return cls(node_ids, names,
+                   np.array(sources, dtype=np.int64),
+                   np.array(targets, dtype=np.int64),
+                   np.array(weights, dtype=np.float64))
+
+    @property
+    def node_count(self) -> int:
+        """Number of cities."""
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of flight routes."""
+        return len(self.weights)
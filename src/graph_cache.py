@@ -0,0 +1,172 @@
+import os
+import zlib
+from typing import List, Tuple
+import src.graph
+import src.reachability
+from src.graph import Graph
+
+
+# Bump this when snapshots must be rebuilt for a reason not visible in SNAPSHOT_MODULES
+CACHE_VERSION = 7
+
+# Modules defining the classes stored in a snapshot. Their files' size and modification time
+# are saved with every snapshot, so any change to the Graph layout rebuilds the cache without
+# a manual version bump.
+SNAPSHOT_MODULES = [src.graph, src.reachability]
+
+# Next to main.py, not relative to the working directory: snapshots are unpickled, so they
+# must only be read from a directory the program's own user controls
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.graph_cache')
+
+# Graphs with fewer routes than this are built directly: building them is faster than
+# importing pickle and loading a snapshot
+MIN_CACHED_EDGES = 2000
+
+# Most snapshots kept in a cache directory; older ones are deleted when a new one is saved
+CACHE_SIZE = 4
+
+
+def layout_stamp() -> List[Tuple[int, int]]:
+    """
+    Cheap fingerprint of the source code of SNAPSHOT_MODULES.
+
+    Uses os.stat only, so nothing is read or hashed on startup.
+
+    Returns:
+        List[Tuple[int, int]]: (size, modification time in ns) of every module file
+    """
+    stamps = []
+    for module in SNAPSHOT_MODULES:
+        status = os.stat(module.__file__)
+        stamps.append((status.st_size, status.st_mtime_ns))
+    return stamps
+
+
+def snapshot_name(cities: List[Tuple[str, str]], edges: List[Tuple[str, str, float]]) -> str:
+    """
+    File name of the snapshot for some source data.
+
+    Different data sets get different files. The name is only a checksum; the data itself
+    is stored in the snapshot and compared on load, so a collision just rebuilds the graph.
+
+    Args:
+        cities (List[Tuple[str, str]]): (city_id, name) pairs
+        edges (List[Tuple[str, str, float]]): (from_node, to_node, weight) routes
+
+    Returns:
+        str: e.g. 'graph-1c291ca3.pickle'
+
+    Example:
+        name = snapshot_name([('yvr', 'Vancouver')], [])
+    """
+    checksum = zlib.crc32(repr((cities, edges)).encode('utf-8'))
+    return f"graph-{checksum:08x}.pickle"
+
+
+def build_graph(cities: List[Tuple[str, str]], edges: List[Tuple[str, str, float]],
+                bidirectional: bool = True) -> Graph:
+    """
+    Build a Graph from city and route lists.
+
+    Args:
+        cities (List[Tuple[str, str]]): (city_id, name) pairs
+        edges (List[Tuple[str, str, float]]): (from_node, to_node, weight) routes
+        bidirectional (bool): Add every route in both directions (default True)
+
+    Returns:
+        Graph: The built flight graph
+    """
+    graph = Graph()
+    # Publish the whole graph as one version instead of one version per route
+    with graph.batch():
+        for city_id, name in cities:
+            graph.add_node(node_id=city_id, name=name)
+        for from_node, to_node, weight in edges:
+            graph.add_edge(from_node=from_node, to_node=to_node, weight=weight)
+            if bidirectional:
+                graph.add_edge(from_node=to_node, to_node=from_node, weight=weight)
+    return graph
+
+
+def load_or_build_graph(cities: List[Tuple[str, str]], edges: List[Tuple[str, str, float]],
+                        cache_dir: str = DEFAULT_CACHE_DIR,
+                        min_edges: int = MIN_CACHED_EDGES) -> Tuple[Graph, bool]:
+    """
+    Load a prebuilt graph snapshot from the cache, or build it and save a snapshot.
+
+    Every snapshot stores the source data, CACHE_VERSION and layout_stamp() it was built
+    from, and is only used if all three still match, so editing the data or the Graph code
+    automatically builds (and caches) a new graph on the next start. A snapshot that can't
+    be loaded for any reason, or that isn't owned by the current user, is ignored and rebuilt.
+
+    Args:
+        cities (List[Tuple[str, str]]): (city_id, name) pairs
+        edges (List[Tuple[str, str, float]]): (from_node, to_node, weight) routes,
+                                              added in both directions
+        cache_dir (str): Directory holding the snapshots (default: .graph_cache next to main.py)
+        min_edges (int): Build graphs with fewer routes directly, without the cache
+
+    Returns:
+        Tuple[Graph, bool]:
+            - graph: The flight graph
+            - from_cache: True if the graph was loaded from a snapshot
+
+    Example:
+        graph, from_cache = load_or_build_graph(cities, edges)
+    """
+    if len(edges) < min_edges:
+        return (build_graph(cities, edges), False)
+
+    # Imported here so small graphs never pay for it
+    import pickle
+
+    snapshot_path = os.path.join(cache_dir, snapshot_name(cities, edges))
+    key = [CACHE_VERSION, layout_stamp(), cities, edges]
+
+    try:
+        with open(snapshot_path, 'rb') as snapshot:
+            if _is_trusted(os.fstat(snapshot.fileno())) and pickle.load(snapshot) == key:
+                graph = pickle.load(snapshot)
+                if isinstance(graph, Graph):
+                    return (graph, True)
+    except Exception:
+        # No snapshot yet, or an unusable one (corrupt, or written by other code that
+        # unpickles with TypeError, ImportError, ...) - fall through and rebuild
+        pass
+
+    graph = build_graph(cities, edges)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a half-written snapshot
+        temporary_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'wb') as snapshot:
+            # The key goes first, so a stale snapshot is rejected before its graph is unpickled
+            pickle.dump(key, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(graph, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, snapshot_path)
+        _prune(cache_dir, keep=snapshot_path)
+    except OSError:
+        # Caching is only an optimization; a read-only directory is fine
+        pass
+    return (graph, False)
+
+
+def _is_trusted(status: os.stat_result) -> bool:
+    # Only unpickle files written by this user and not writable by anyone else
+    if not hasattr(os, 'getuid'):
+        return True
+    return status.st_uid == os.getuid() and not status.st_mode & 0o022
+
+
+def _prune(cache_dir: str, keep: str):
+    # Delete the oldest snapshots beyond CACHE_SIZE (never the one just written)
+    snapshots = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.startswith('graph-') and entry.name.endswith('.pickle') and entry.path != keep:
+            snapshots.append((entry.stat().st_mtime_ns, entry.path))
+    snapshots.sort(reverse=True)
+    for _, path in snapshots[CACHE_SIZE - 1:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,221 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from src.graph import Graph
+
+
+class CompressedGraph:
+    """
+    A smaller graph with the same cheapest costs between its cities, plus how to expand its routes.
+
+    Built by compress_graph. Routes found on `graph` (e.g. with dijkstra_pathfind) are turned
+    back into routes through the original cities with expand().
+
+    Attributes:
+        graph (Graph): The reduced network. Each edge keeps only the weight.
+        expansions (Dict[Tuple[str, str], Tuple[str, ...]]): For every reduced edge that replaces a
+            chain, the city IDs passed through between its two ends
+        node_counts (Tuple[int, int]): (cities before, cities after)
+        edge_counts (Tuple[int, int]): (routes before, routes after)
+
+    Example:
+        compressed = compress_graph(graph, keep=['vancouver', 'daqing'])
+        print(compressed.report())
+        _, path, cost = dijkstra_pathfind(compressed.graph, 'vancouver', 'daqing')
+        path = compressed.expand(path)   # the same route through the original cities
+    """
+    def __init__(self, graph: Graph, expansions: Dict[Tuple[str, str], Tuple[str, ...]], names: Dict[str, str],
+                 node_counts: Tuple[int, int], edge_counts: Tuple[int, int]):
+        """
+        Store a reduction. Use compress_graph to create one.
+
+        Args:
+            graph (Graph): The reduced network
+            expansions (Dict[Tuple[str, str], Tuple[str, ...]]): Cities passed through by each shortcut edge
+            names (Dict[str, str]): City name of every city ID in the original network
+            node_counts (Tuple[int, int]): (cities before, cities after)
+            edge_counts (Tuple[int, int]): (routes before, routes after)
+        """
+        self.graph = graph
+        self.expansions = expansions
+        self.names = names
+        self.node_counts = node_counts
+        self.edge_counts = edge_counts
+        # Kept cities by name, to map route names from searches back to IDs
+        nodes = graph.nodes
+        self._ids_by_name = {nodes[node_id].name: node_id for node_id in nodes}
+
+    def expand_ids(self, path: List[str]) -> List[str]:
+        """
+        Expand a route of city IDs in the reduced graph to the city IDs of the original route.
+
+        Args:
+            path (List[str]): City IDs along a route in `graph`
+
+        Returns:
+            List[str]: City IDs along the same route in the original network
+        """
+        expanded = path[:1]
+        for from_node, to_node in zip(path, path[1:]):
+            expanded.extend(self.expansions.get((from_node, to_node), ()))
+            expanded.append(to_node)
+        return expanded
+
+    def expand(self, path: List[str]) -> List[str]:
+        """
+        Expand a route of city names, as returned by the searches on `graph`, to the original route.
+
+        Cities are identified by name, so kept cities must have distinct names.
+
+        Args:
+            path (List[str]): City names from a search on `graph` (e.g. ['Vancouver', 'Daqing'])
+
+        Returns:
+            List[str]: City names along the same route in the original network
+                       (empty list if path is empty)
+
+        Example:
+            compressed.expand(['Vancouver', 'Daqing'])
+            # ['Vancouver', 'Seoul', 'Beijing', 'Daqing']
+        """
+        node_ids = [self._ids_by_name[name] for name in path]
+        return [self.names[node_id] for node_id in self.expand_ids(node_ids)]
+
+    def report(self) -> str:
+        """
+        Summary of how much the network shrank.
+
+        Returns:
+            str: e.g. 'Cities: 1200 -> 400 (-66.7%), routes: 9000 -> 3100 (-65.6%)'
+        """
+        def shrink(before, after):
+            return f"{before} -> {after} ({(after - before) / before:+.1%})" if before else f"{before} -> {after}"
+        return f"Cities: {shrink(*self.node_counts)}, routes: {shrink(*self.edge_counts)}"
+
+
+def compress_graph(graph: Graph, keep: Iterable[str] = (), remove_dominated: bool = True,
+                   contract_chains: bool = True) -> CompressedGraph:
+    """
+    Shrink a flight network without changing the cheapest cost between any two remaining cities.
+
+    Two reductions are repeated until neither changes anything:
+    - Dominated routes: a route u -> w is dropped if some u -> v -> w is strictly cheaper.
+      Such a route is never part of a cheapest path. Parallel routes keep only the cheapest.
+    - Degree-two chains: a city whose only neighbours (in either direction) are u and w is
+      removed, and u -> v -> w becomes a single route u -> w with the summed cost (the same
+      for w -> v -> u). Chains of pass-through cities collapse into one route.
+
+    Searches on the reduced graph relax fewer routes and visit fewer cities. Cheapest costs
+    are unchanged, so use it with cost-based searches (dijkstra_pathfind); fewest-stop
+    searches (bfs_pathfind) count a collapsed chain as one stop and may miss a dropped
+    direct route. Only the weight is kept, so other edge attributes are not available.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        keep (Iterable[str]): City IDs that must stay in the reduced graph, e.g. every city
+            queries start or end at. Removed cities can't be used as start or goal.
+        remove_dominated (bool): Drop routes with a cheaper two-stop alternative (default True)
+        contract_chains (bool): Collapse chains of degree-two cities (default True)
+
+    Returns:
+        CompressedGraph: The reduced graph and the mapping back to original routes
+
+    Time Complexity: O(R * (E * D + V)) for R rounds (usually 2-3) and maximum out-degree D
+    Space Complexity: O(V + E + total chain length)
+
+    Example:
+        compressed = compress_graph(graph, keep=popular_cities)
+        print(compressed.report())
+    """
+    graph = graph.snapshot()
+    nodes = graph.nodes
+    keep = set(keep)
+
+    # out_edges[u][w] = (cost, cities passed through); in_edges[w] = cities with a route to w
+    out_edges: Dict[str, Dict[str, Tuple[float, Tuple[str, ...]]]] = {node_id: {} for node_id in nodes}
+    in_edges: Dict[str, Set[str]] = {node_id: set() for node_id in nodes}
+    edge_count = 0
+    for node_id in nodes:
+        for neighbor, cost in graph.get_neighbors(node_id):
+            edge_count += 1
+            # Self-loops are never part of a cheapest path
+            if neighbor == node_id:
+                continue
+            _add_route(out_edges, in_edges, node_id, neighbor, cost, ())
+
+    changed = True
+    while changed:
+        changed = False
+        if remove_dominated:
+            changed |= _remove_dominated(out_edges, in_edges)
+        if contract_chains:
+            changed |= _contract_chains(out_edges, in_edges, keep)
+
+    reduced = Graph()
+    expansions = {}
+    with reduced.batch():
+        for node_id in out_edges:
+            reduced.add_node(node_id, nodes[node_id].name)
+        for node_id, routes in out_edges.items():
+            for neighbor, (cost, via) in routes.items():
+                reduced.add_edge(node_id, neighbor, cost)
+                if via:
+                    expansions[(node_id, neighbor)] = via
+
+    names = {node_id: nodes[node_id].name for node_id in nodes}
+    reduced_edge_count = sum(len(routes) for routes in out_edges.values())
+    return CompressedGraph(reduced, expansions, names, (len(nodes), len(out_edges)), (edge_count, reduced_edge_count))
+
+
+def _add_route(out_edges, in_edges, from_node: str, to_node: str, cost: float, via: Tuple[str, ...]):
+    # Add a route, keeping only the cheapest of parallel routes
+    existing = out_edges[from_node].get(to_node)
+    if existing is None or cost < existing[0]:
+        out_edges[from_node][to_node] = (cost, via)
+        in_edges[to_node].add(from_node)
+
+
+def _remove_dominated(out_edges, in_edges) -> bool:
+    # Find every route with a strictly cheaper two-stop alternative first, then drop them all.
+    # With non-negative costs a dominated route lies on no cheapest path, so removing all of
+    # them at once keeps every cheapest cost.
+    dominated = []
+    for from_node, routes in out_edges.items():
+        for middle, (first_cost, _) in routes.items():
+            for to_node, (second_cost, _) in out_edges[middle].items():
+                direct = routes.get(to_node)
+                if direct is not None and to_node != from_node and first_cost + second_cost < direct[0]:
+                    dominated.append((from_node, to_node))
+    for from_node, to_node in dominated:
+        if to_node in out_edges[from_node]:
+            del out_edges[from_node][to_node]
+            in_edges[to_node].discard(from_node)
+    return bool(dominated)
+
+
+def _contract_chains(out_edges, in_edges, keep: Set[str]) -> bool:
+    # Remove degree-two cities, joining their two sides with shortcut routes. Contracting a
+    # city can make its neighbours degree-two, so they are checked again.
+    changed = False
+    pending = list(out_edges)
+    while pending:
+        city = pending.pop()
+        if city in keep or city not in out_edges:
+            continue
+        neighbors = set(out_edges[city]) | in_edges[city]
+        if len(neighbors) != 2:
+            continue
+
+        first, second = neighbors
+        for from_node, to_node in ((first, second), (second, first)):
+            into = out_edges[from_node].get(city)
+            onward = out_edges[city].get(to_node)
+            if into is not None and onward is not None:
+                _add_route(out_edges, in_edges, from_node, to_node, into[0] + onward[0],
+                           into[1] + (city,) + onward[1])
+        # Remove the city and its routes
+        for neighbor in out_edges.pop(city):
+            in_edges[neighbor].discard(city)
+        for neighbor in in_edges.pop(city):
+            del out_edges[neighbor][city]
+        pending.extend(neighbors)
+        changed = True
+    return changed
@@ -0,0 +1,134 @@
+from typing import Dict, List, Tuple
+import numpy as np
+from src.graph import Graph
+from src.graph_arrays import GraphArrays
+
+
+def hop_limited_routes(graph: Graph, start: str, max_stops: int) -> Dict[str, Tuple[List[str], float]]:
+    """
+    Finds the cheapest route from start to EVERY city using at most max_stops connections.
+
+    Runs a Bellman-Ford style relaxation for max_stops + 1 rounds. Round k relaxes every
+    edge at once (vectorized over the edge arrays), so after round k each city holds the
+    cheapest cost using at most k flights. One pass answers all destinations.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        start (str): Starting city ID (e.g., 'vancouver')
+        max_stops (int): Maximum number of connections (intermediate cities).
+                         0 means direct flights only.
+
+    Returns:
+        Dict[str, Tuple[List[str], float]]: For every reachable city ID,
+            (path of city names from start, total cost). Unreachable cities are left out.
+
+    Time Complexity: O(k * E) array operations for k = max_stops + 1 rounds
+    Space Complexity: O(k * V) for the per-round predecessor arrays
+
+    Characteristics:
+        - Finds the LOWEST COST route among routes with at most max_stops connections
+        - With a large enough max_stops it gives the same costs as Dijkstra
+        - Stops early once a round changes nothing
+
+    Example:
+        routes = hop_limited_routes(graph, 'vancouver', max_stops=1)
+        # routes['daqing'] = (['Vancouver', 'Beijing', 'Daqing'], 1600.0)
+    """
+    arrays = GraphArrays.from_graph(graph)
+    dist, parent_edge, parent_round, last_round = _relax(arrays, arrays.index[start], max_stops)
+
+    routes = {}
+    for target in np.flatnonzero(np.isfinite(dist)):
+        routes[arrays.node_ids[target]] = (_unpack_route(arrays, parent_edge, parent_round, target, last_round),
+                                           float(dist[target]))
+    return routes
+
+
+def hop_limited_pathfind(graph: Graph, start: str, goal: str, max_stops: int) -> Tuple[List[str], float]:
+    """
+    Finds the cheapest route from start to goal with at most max_stops connections.
+
+    Answers "cheapest fare with at most 2 connections" directly, instead of enumerating
+    every route with DFS and filtering.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'daqing')
+        max_stops (int): Maximum number of connections (0 = direct flights only)
+
+    Returns:
+        Tuple[List[str], float]:
+            - path: List of city names from start to goal (empty list if no such route exists)
+            - cost: Total cost of the route. Returns float('inf') if no such route exists
+
+    Example:
+        path, cost = hop_limited_pathfind(graph, 'vancouver', 'daqing', max_stops=1)
+        # path = ['Vancouver', 'Beijing', 'Daqing']
+        # cost = 1600.0
+    """
+    # Check reachability and search on the same version of the graph
+    graph = graph.snapshot()
+    if not graph.can_reach(start, goal):
+        return ([], float('inf'))
+
+    # Same relaxation as hop_limited_routes, but only the goal's route is unpacked
+    arrays = GraphArrays.from_graph(graph)
+    dist, parent_edge, parent_round, last_round = _relax(arrays, arrays.index[start], max_stops)
+    target = arrays.index[goal]
+    if not np.isfinite(dist[target]):
+        return ([], float('inf'))
+    return (_unpack_route(arrays, parent_edge, parent_round, target, last_round), float(dist[target]))
+
+
+def _relax(arrays: GraphArrays, start_index: int, max_stops: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    # Bellman-Ford rounds limited to max_stops + 1 flights.
+    # Returns (dist, parent_edge, parent_round, last_round) for _unpack_route.
+    node_count = arrays.node_count
+    rounds = max_stops + 1
+
+    # dist[v] = cheapest cost to v found so far (using at most `round` flights)
+    dist = np.full(node_count, np.inf)
+    dist[start_index] = 0.0
+    # For each round: the edge used to reach each city and the round it was last improved in.
+    # Both are needed to walk a route back without ever exceeding the hop limit.
+    parent_edge = np.full((rounds + 1, node_count), -1, dtype=np.int64)
+    parent_round = np.zeros((rounds + 1, node_count), dtype=np.int64)
+    edge_numbers = np.arange(arrays.edge_count)
+
+    last_round = 0
+    for current_round in range(1, rounds + 1):
+        # Relax every edge at once using the costs from the previous round
+        candidate = dist[arrays.sources] + arrays.weights
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, arrays.targets, candidate)
+
+        improved = new_dist < dist
+        parent_edge[current_round] = parent_edge[current_round - 1]
+        parent_round[current_round] = parent_round[current_round - 1]
+        if not improved.any():
+            # Nothing changed, so later rounds would not change anything either
+            break
+
+        # Record an edge that achieved each improved cost
+        winners = edge_numbers[improved[arrays.targets] & (candidate == new_dist[arrays.targets])]
+        parent_edge[current_round, arrays.targets[winners]] = winners
+        parent_round[current_round, arrays.targets[winners]] = current_round
+        dist = new_dist
+        last_round = current_round
+    return dist, parent_edge, parent_round, last_round
+
+
+def _unpack_route(arrays: GraphArrays, parent_edge: np.ndarray, parent_round: np.ndarray,
+                  target: int, current_round: int) -> List[str]:
+    # Walk back along the recorded edges. After using the edge set in round r,
+    # continue from its start city as it was at round r - 1.
+    path = [arrays.names[target]]
+    node = target
+    while parent_round[current_round, node] > 0:
+        edge = parent_edge[current_round, node]
+        current_round = parent_round[current_round, node] - 1
+        node = arrays.sources[edge]
+        path.append(arrays.names[node])
+    path.reverse()
+    return path
@@ -0,0 +1,389 @@
+import heapq
+import os
+import struct
+from array import array
+from typing import List, Optional, Tuple
+from src.graph import Graph
+
+
+# File layout written by HubLabels.save (little-endian):
+#   header: magic, format version, city count, flags (1 = has path data)
+#   cities: for each city, ID and name as length-prefixed UTF-8
+#   labels: forward then backward, each as offsets (V + 1 int64), hubs (int32), costs (float64)
+#           and, with path data, next/previous cities (int32)
+_MAGIC = b'HUBL'
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHIB')
+_LENGTH = struct.Struct('<I')
+
+
+class HubLabels:
+    """
+    Two-hop hub labels: cheapest cost between any two cities from two short sorted lists.
+
+    Every city v gets a forward label (hubs v can reach, with the cost from v) and a backward
+    label (hubs that reach v, with the cost to v), both sorted by hub. The labels are built so
+    that every cheapest route s -> t passes through a hub in both forward(s) and backward(t),
+    so a query is a merge-join of the two lists: min over shared hubs h of
+    cost(s, h) + cost(h, t). No search runs at query time.
+
+    Labels are built with pruned landmark labeling: cities are taken as hubs in order of
+    importance (most routes first), each runs a Dijkstra search forwards and backwards, and
+    the search is cut off at every city whose cost the labels built so far already give.
+
+    Intended for static networks; rebuild after the graph changes.
+
+    Attributes:
+        node_ids (List[str]): City ID for each city number (in hub order: most important first)
+        names (List[str]): City name for each city number
+        index (Dict[str, int]): City number of each city ID
+        has_paths (bool): Whether routes can be unpacked (see pathfind)
+
+    Example:
+        labels = HubLabels.build(graph)
+        labels.save('hubs.bin')
+
+        labels = HubLabels.load('hubs.bin')
+        labels.cost('vancouver', 'daqing')       # 1300.0
+        labels.pathfind('vancouver', 'daqing')   # (['Vancouver', 'Seoul', 'Beijing', 'Daqing'], 1300.0)
+    """
+    def __init__(self, node_ids: List[str], names: List[str],
+                 forward_hubs: List[array], forward_costs: List[array],
+                 backward_hubs: List[array], backward_costs: List[array],
+                 forward_next: Optional[List[array]] = None, backward_previous: Optional[List[array]] = None):
+        """
+        Store computed labels. Use HubLabels.build or HubLabels.load to create them.
+
+        Args:
+            node_ids (List[str]): City ID for each city number
+            names (List[str]): City name for each city number
+            forward_hubs, forward_costs: Per city, hubs it reaches (sorted) and the cost to each
+            backward_hubs, backward_costs: Per city, hubs reaching it (sorted) and the cost from each
+            forward_next (optional): Per forward entry, the next city on the route to the hub
+            backward_previous (optional): Per backward entry, the previous city on the route from the hub
+        """
+        self.node_ids = node_ids
+        self.names = names
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self._forward_hubs = forward_hubs
+        self._forward_costs = forward_costs
+        self._backward_hubs = backward_hubs
+        self._backward_costs = backward_costs
+        self._forward_next = forward_next
+        self._backward_previous = backward_previous
+
+    @property
+    def has_paths(self) -> bool:
+        return self._forward_next is not None
+
+    @classmethod
+    def build(cls, graph: Graph, with_paths: bool = False, batch_size: int = 1, executor=None) -> 'HubLabels':
+        """
+        Build the labels with pruned Dijkstra searches from every city, most important first.
+
+        Hubs are processed in batches. The searches of one batch only prune against the
+        labels of earlier batches, so they are independent of each other and can run in
+        parallel on an executor. Larger batches prune a little less (labels get somewhat
+        bigger) but are still exact; batch_size=1 gives the smallest labels.
+
+        Args:
+            graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+            with_paths (bool): Also keep what is needed to unpack routes (default False)
+            batch_size (int): Hubs searched independently of each other per round
+            executor (concurrent.futures.Executor, optional): Runs the searches of a batch
+                with executor.map. Default: run them one after another.
+
+        Returns:
+            HubLabels: The built labels
+
+        Time Complexity: O(V * (V_p + E_p) log V_p) where V_p, E_p are the cities and routes
+                         a pruned search visits; usually far below V^2 on hub-and-spoke networks
+        Space Complexity: O(V * L) for an average label size L
+        """
+        graph = graph.snapshot()
+        node_ids = list(graph.nodes)
+        # Hub order: most connected cities first, since many cheapest routes pass through them
+        position = {node_id: i for i, node_id in enumerate(node_ids)}
+        outgoing = [[(position[neighbor], weight) for neighbor, weight in graph.get_neighbors(node_id)]
+                    for node_id in node_ids]
+        incoming = [[] for _ in node_ids]
+        for i, edges in enumerate(outgoing):
+            for j, weight in edges:
+                incoming[j].append((i, weight))
+        order = sorted(range(len(node_ids)), key=lambda i: (-(len(outgoing[i]) + len(incoming[i])), i))
+
+        # Renumber cities so city number == hub rank; label lists then stay sorted by appending
+        rank = {old: new for new, old in enumerate(order)}
+        outgoing = [[(rank[j], weight) for j, weight in outgoing[old]] for old in order]
+        incoming = [[(rank[j], weight) for j, weight in incoming[old]] for old in order]
+        node_ids = [node_ids[old] for old in order]
+        names = [graph.nodes[node_id]["name"] for node_id in node_ids]
+
+        count = len(node_ids)
+        forward_hubs = [array('i') for _ in range(count)]
+        forward_costs = [array('d') for _ in range(count)]
+        forward_next = [array('i') for _ in range(count)] if with_paths else None
+        backward_hubs = [array('i') for _ in range(count)]
+        backward_costs = [array('d') for _ in range(count)]
+        backward_previous = [array('i') for _ in range(count)] if with_paths else None
+        forward = (forward_hubs, forward_costs)
+        backward = (backward_hubs, backward_costs)
+
+        step = max(1, batch_size)
+        for first in range(0, count, step):
+            # Searching forwards from a hub fills backward labels (costs from the hub), and
+            # searching backwards fills forward labels (costs to the hub)
+            tasks = [(hub, reverse, incoming if reverse else outgoing, forward, backward)
+                     for hub in range(first, min(count, first + step)) for reverse in (False, True)]
+            if executor is None:
+                results = list(map(_search_task, tasks))
+            else:
+                # One chunk per worker: the graph and labels are sent to a process pool once
+                # per chunk rather than once per search (ignored by thread pools)
+                chunksize = -(-len(tasks) // (os.cpu_count() or 1))
+                results = list(executor.map(_search_task, tasks, chunksize=chunksize))
+            # Append in hub order, so every label list stays sorted by hub
+            for (hub, reverse, *_), entries in zip(tasks, results):
+                hubs, costs = forward if reverse else backward
+                links = forward_next if reverse else backward_previous
+                for node, cost, link in entries:
+                    hubs[node].append(hub)
+                    costs[node].append(cost)
+                    if with_paths:
+                        links[node].append(link)
+
+        return cls(node_ids, names, forward_hubs, forward_costs, backward_hubs, backward_costs,
+                   forward_next, backward_previous)
+
+    def _best_hub(self, source: int, target: int) -> Tuple[float, int, int]:
+        # Merge-join of forward(source) and backward(target): (cost, position in each list)
+        hubs_out, costs_out = self._forward_hubs[source], self._forward_costs[source]
+        hubs_in, costs_in = self._backward_hubs[target], self._backward_costs[target]
+        best, best_out, best_in = float('inf'), -1, -1
+        i, j = 0, 0
+        while i < len(hubs_out) and j < len(hubs_in):
+            if hubs_out[i] < hubs_in[j]:
+                i += 1
+            elif hubs_out[i] > hubs_in[j]:
+                j += 1
+            else:
+                cost = costs_out[i] + costs_in[j]
+                if cost < best:
+                    best, best_out, best_in = cost, i, j
+                i += 1
+                j += 1
+        return best, best_out, best_in
+
+    def cost(self, start: str, goal: str) -> float:
+        """
+        Cheapest cost from start to goal.
+
+        Args:
+            start (str): Starting city ID
+            goal (str): Destination city ID
+
+        Returns:
+            float: Cheapest cost, or float('inf') if there is no route
+
+        Time Complexity: O(L) for the two label sizes
+        """
+        return self._best_hub(self.index[start], self.index[goal])[0]
+
+    def pathfind(self, start: str, goal: str) -> Tuple[List[str], float]:
+        """
+        Cheapest route from start to goal, unpacked hop by hop from the labels.
+
+        Each hop is found with one more label query: either step back from the goal to the
+        city before it on the route from the hub, or (when the goal is the hub) step forward
+        from the start to the next city towards it.
+
+        Args:
+            start (str): Starting city ID (e.g., 'vancouver')
+            goal (str): Destination city ID (e.g., 'daqing')
+
+        Returns:
+            Tuple[List[str], float]:
+                - path: List of city names from start to goal (empty list if no path exists)
+                - cost: Total cost of the path. Returns float('inf') if no path exists
+
+        Raises:
+            ValueError: If the labels were built without with_paths=True
+
+        Time Complexity: O(P * L) for P cities on the route
+        """
+        if not self.has_paths:
+            raise ValueError("Route unpacking needs labels built with with_paths=True")
+        source, target = self.index[start], self.index[goal]
+        cost = self._best_hub(source, target)[0]
+        if cost == float('inf'):
+            return ([], cost)
+
+        front, back = [source], [target]
+        while source != target:
+            _, out_position, in_position = self._best_hub(source, target)
+            previous = self._backward_previous[target][in_position]
+            if previous != -1:
+                target = previous
+                back.append(target)
+            else:
+                # The hub is the goal itself: move the start one city towards it
+                source = self._forward_next[source][out_position]
+                front.append(source)
+        # source == target is now the city where both halves meet
+        route = front + back[-2::-1]
+        return ([self.names[city] for city in route], cost)
+
+    def label_sizes(self) -> Tuple[int, int]:
+        """
+        Total number of forward and backward label entries (a measure of index size).
+
+        Returns:
+            Tuple[int, int]: (forward entries, backward entries)
+        """
+        return (sum(len(hubs) for hubs in self._forward_hubs), sum(len(hubs) for hubs in self._backward_hubs))
+
+    def save(self, path: str):
+        """
+        Save the labels to a compact binary file.
+
+        Args:
+            path (str): Destination file (e.g. 'hubs.bin')
+        """
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(self.node_ids), int(self.has_paths)))
+            for text in self.node_ids + self.names:
+                encoded = text.encode('utf-8')
+                file.write(_LENGTH.pack(len(encoded)))
+                file.write(encoded)
+            for lists in ((self._forward_hubs, self._forward_costs, self._forward_next),
+                          (self._backward_hubs, self._backward_costs, self._backward_previous)):
+                offsets = array('q', [0])
+                for hubs in lists[0]:
+                    offsets.append(offsets[-1] + len(hubs))
+                _write_array(file, offsets)
+                for per_city, typecode in zip(lists, 'idi'):
+                    if per_city is not None:
+                        _write_array(file, _concatenate(per_city, typecode))
+
+    @classmethod
+    def load(cls, path: str) -> 'HubLabels':
+        """
+        Load labels written by save().
+
+        Args:
+            path (str): File written by save()
+
+        Returns:
+            HubLabels: The loaded labels
+
+        Raises:
+            ValueError: If the file is not a hub label file of this format version
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, count, flags = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"{path} is not a hub label file (format version {_FORMAT_VERSION})")
+        has_paths = bool(flags & 1)
+
+        offset = _HEADER.size
+        texts = []
+        for _ in range(2 * count):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            texts.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+
+        parts = []
+        for _ in range(2):
+            offsets, offset = _read_array(data, offset, 'q', count + 1)
+            total = offsets[-1]
+            hubs, offset = _read_array(data, offset, 'i', total)
+            costs, offset = _read_array(data, offset, 'd', total)
+            links = None
+            if has_paths:
+                links, offset = _read_array(data, offset, 'i', total)
+            parts.append([_split(values, offsets) if values is not None else None for values in (hubs, costs, links)])
+
+        (forward_hubs, forward_costs, forward_next), (backward_hubs, backward_costs, backward_previous) = parts
+        return cls(texts[:count], texts[count:], forward_hubs, forward_costs, backward_hubs, backward_costs,
+                   forward_next, backward_previous)
+
+
+def _search_task(task: tuple) -> List[Tuple[int, float, int]]:
+    # One search of a batch; module-level so process pools can pickle it
+    hub, reverse, edges, forward, backward = task
+    if reverse:
+        return _pruned_search(hub, edges, forward, backward)
+    return _pruned_search(hub, edges, backward, forward)
+
+
+def _pruned_search(hub: int, edges: List[list], labels_here: Tuple[List[array], List[array]],
+                   labels_hub: Tuple[List[array], List[array]]) -> List[Tuple[int, float, int]]:
+    # Dijkstra from hub along edges. A city is labelled (and expanded) only if the existing
+    # labels can't already give its cost: query(hub, city) combines the hub's own label on the
+    # other side (labels_hub) with the city's label on this side (labels_here).
+    # Returns (city, cost, link) entries; link is the city it was reached from (-1 for the hub).
+    inf = float('inf')
+    # Cost between the hub and each of its existing hubs, indexed by hub, for O(label size) queries
+    via = [inf] * len(edges)
+    for other, other_cost in zip(labels_hub[0][hub], labels_hub[1][hub]):
+        via[other] = other_cost
+    here_hubs, here_costs = labels_here
+
+    entries = []
+    queue = [(0.0, hub, -1)]
+    best = {hub: 0.0}
+    settled = set()
+    while queue:
+        cost, city, link = heapq.heappop(queue)
+        if city in settled:
+            continue
+        settled.add(city)
+
+        # Prune: an earlier hub already covers this pair at this cost or less
+        pruned = False
+        for other, other_cost in zip(here_hubs[city], here_costs[city]):
+            if via[other] + other_cost <= cost:
+                pruned = True
+                break
+        if pruned:
+            continue
+
+        entries.append((city, cost, link))
+        for neighbor, weight in edges[city]:
+            new_cost = cost + weight
+            if neighbor not in settled and new_cost < best.get(neighbor, inf):
+                best[neighbor] = new_cost
+                heapq.heappush(queue, (new_cost, neighbor, city))
+    return entries
+
+
+def _concatenate(per_city: List[array], typecode: str) -> array:
+    # One flat array of all cities' entries, in city order
+    flat = array(typecode)
+    for values in per_city:
+        flat.extend(values)
+    return flat
+
+
+def _split(flat: array, offsets: array) -> List[array]:
+    # Inverse of _concatenate
+    return [flat[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def _write_array(file, values: array):
+    # Arrays are stored little-endian regardless of the machine
+    if array('i', [1]).tobytes()[0] != 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    file.write(values.tobytes())
+
+
+def _read_array(data: bytes, offset: int, typecode: str, length: int) -> Tuple[array, int]:
+    values = array(typecode)
+    end = offset + length * values.itemsize
+    values.frombytes(data[offset:end])
+    if array('i', [1]).tobytes()[0] != 1:
+        values.byteswap()
+    return values, end
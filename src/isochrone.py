@@ -0,0 +1,112 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from src.graph import Graph
+from src.path_labels import PathLabels
+from src.priority_queues import make_queue
+
+
+def budget_routes(graph: Graph, start: str, budget: float, with_routes: bool = False,
+                  weight: Optional[Union[str, Dict[str, float]]] = None,
+                  priority_queue: Union[str, Callable] = 'heap') -> Dict[str, Tuple[Optional[List[str]], float]]:
+    """
+    Finds every city reachable from start within a cost budget (an isochrone), with its cheapest cost.
+
+    Answers "where can you fly from Vancouver for $800 or less?" with one bounded Dijkstra
+    search instead of one dijkstra_pathfind per destination. Routes costing more than the
+    budget are never queued, so the work grows with the region inside the budget, not with
+    the whole graph.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        start (str): Starting city ID (e.g., 'vancouver')
+        budget (float): Maximum total cost (inclusive)
+        with_routes (bool): Also return the cheapest route to each city (default False)
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost (see Graph.get_neighbors)
+        priority_queue (str or callable): Frontier queue strategy (see make_queue)
+
+    Returns:
+        Dict[str, Tuple[Optional[List[str]], float]]: For every city ID within the budget,
+            (path of city names from start, or None if with_routes is False, cheapest cost).
+            Includes start itself at cost 0. Empty if start is not in the graph.
+
+    Time Complexity: O((V_b + E_b) log V_b) for the V_b cities and E_b routes inside the budget
+    Space Complexity: O(V_b + E_b)
+
+    Example:
+        routes = budget_routes(graph, 'vancouver', 800.0)
+        # routes = {'vancouver': (None, 0.0), 'new_york': (None, 250.0), ...}
+
+        routes = budget_routes(graph, 'vancouver', 800.0, with_routes=True)
+        # routes['new_york'] = (['Vancouver', 'New York'], 250.0)
+    """
+    return multi_source_budget_routes(graph, [start], budget, with_routes, weight, priority_queue)
+
+
+def multi_source_budget_routes(graph: Graph, starts: Iterable[str], budget: float, with_routes: bool = False,
+                               weight: Optional[Union[str, Dict[str, float]]] = None,
+                               priority_queue: Union[str, Callable] = 'heap'
+                               ) -> Dict[str, Tuple[Optional[List[str]], float]]:
+    """
+    Finds every city reachable within a cost budget from ANY of several home airports.
+
+    One bounded Dijkstra search seeded with all start cities at cost 0, so each city gets
+    the cheapest cost from whichever home airport is cheapest for it.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        starts (Iterable[str]): Home airport city IDs (e.g., ['vancouver', 'seattle'])
+        budget (float): Maximum total cost (inclusive)
+        with_routes (bool): Also return the cheapest route to each city (default False)
+        weight (str or Dict[str, float], optional): Edge attribute to use as the cost (see Graph.get_neighbors)
+        priority_queue (str or callable): Frontier queue strategy (see make_queue)
+
+    Returns:
+        Dict[str, Tuple[Optional[List[str]], float]]: For every city ID within the budget,
+            (path of city names from the home airport it is cheapest from, or None if
+            with_routes is False, cheapest cost). Start cities not in the graph are ignored.
+
+    Time Complexity: O((V_b + E_b) log V_b) for the V_b cities and E_b routes inside the budget
+    Space Complexity: O(V_b + E_b)
+
+    Example:
+        routes = multi_source_budget_routes(graph, ['vancouver', 'london'], 700.0, with_routes=True)
+        # routes['seoul'] = (['London', 'Seoul'], 600.0)
+    """
+    # Search one fixed version of the graph
+    graph = graph.snapshot()
+    nodes = graph.nodes
+
+    queue = make_queue(priority_queue)
+    cost = {}
+    # Route labels are only kept when routes are wanted: one PathLabels tree per home airport
+    trees = []
+    for start in starts:
+        if start in nodes and start not in cost:
+            cost[start] = 0
+            trees.append(PathLabels(start))
+            # Items are (city ID, tree number, label)
+            queue.push(0, (start, len(trees) - 1, 0))
+
+    settled = {}
+    while queue:
+        current_cost, (current_node, tree, label) = queue.pop()
+        # Skip stale queue entries for cities already settled more cheaply
+        if current_node in settled:
+            continue
+        settled[current_node] = (tree, label, current_cost)
+
+        neighbors = graph.get_neighbors(current_node) if weight is None else graph.get_neighbors(current_node, weight)
+        for neighbor, edge_cost in neighbors:
+            new_cost = current_cost + edge_cost
+            # Never queue anything over budget: this is what bounds the search
+            if new_cost > budget or neighbor in settled:
+                continue
+            if neighbor not in cost or new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                next_label = trees[tree].add(neighbor, label) if with_routes else 0
+                queue.push(new_cost, (neighbor, tree, next_label))
+
+    routes = {}
+    for city, (tree, label, city_cost) in settled.items():
+        path = [nodes[node].name for node in trees[tree].path(label)] if with_routes else None
+        routes[city] = (path, city_cost)
+    return routes
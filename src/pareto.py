@@ -0,0 +1,93 @@
+import heapq
+from typing import List, Tuple
+from src.graph import Graph
+
+
+def pareto_pathfind(graph: Graph, start: str, goal: str) -> List[Tuple[List[str], float]]:
+    """
+    Finds every Pareto-optimal route between two cities for (cost, number of stops).
+
+    A route is Pareto-optimal if no other route is both cheaper (or equal) AND has fewer
+    (or equal) stops. The result always contains the cheapest route (what Dijkstra finds)
+    and the fewest-stop route (what BFS finds), plus every useful trade-off in between,
+    all from a single traversal.
+
+    Uses multi-criteria label setting: labels (cost, hops) are popped from a min-heap in
+    increasing cost order, so a label at a city is only useful if it has fewer hops than
+    every label already settled there. That makes each city's label set a single
+    "fewest hops so far" number, and dominance pruning a single comparison.
+
+    Args:
+        graph (Graph): The flight graph containing cities (nodes) and routes (edges with weights)
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'daqing')
+
+    Returns:
+        List[Tuple[List[str], float]]: (path of city names, cost) for each Pareto-optimal route,
+            ordered from cheapest (most stops) to fewest stops (most expensive).
+            Empty list if no route exists.
+
+    Time Complexity: O(L log L) for L labels created, L <= V * (V - 1)
+    Space Complexity: O(L) for the labels
+
+    Characteristics:
+        - First route = lowest cost (same cost as Dijkstra)
+        - Last route = fewest hops (same hop count as BFS)
+        - Works with non-negative edge weights
+
+    Example:
+        routes = pareto_pathfind(graph, 'vancouver', 'daqing')
+        # routes = [
+        #     (['Vancouver', 'Seoul', 'Beijing', 'Daqing'], 1300.0),
+        #     (['Vancouver', 'Beijing', 'Daqing'], 1600.0)
+        # ]
+    """
+    # Read one fixed version of the graph even if it is updated concurrently
+    graph = graph.snapshot()
+    if not graph.can_reach(start, goal):
+        return []
+
+    # Labels are stored as two parallel lists: the city and the parent label number.
+    # Heap entries are then just (cost, hops, label number) tuples of numbers.
+    label_node = [start]
+    label_parent = [-1]
+    heap = [(0, 0, 0)]
+    # Fewest hops of any settled label at each city (the whole Pareto label set, in one number)
+    best_hops = {}
+    goal_labels = []
+
+    while heap:
+        cost, hops, label = heapq.heappop(heap)
+        node = label_node[label]
+
+        # A settled label at this city is at least as cheap, so it must also have fewer hops
+        if hops >= best_hops.get(node, float('inf')):
+            continue
+        best_hops[node] = hops
+
+        if node == goal:
+            goal_labels.append((label, cost))
+            # Later labels cost at least as much and need at least one hop, so none can win
+            if hops <= 1:
+                break
+            continue
+
+        goal_hops = best_hops.get(goal, float('inf'))
+        next_hops = hops + 1
+        for neighbor, weight in graph.get_neighbors(node):
+            # Prune labels dominated at the neighbor or unable to beat the goal's fewest hops
+            if next_hops >= best_hops.get(neighbor, float('inf')) or next_hops >= goal_hops:
+                continue
+            label_node.append(neighbor)
+            label_parent.append(label)
+            heapq.heappush(heap, (cost + weight, next_hops, len(label_node) - 1))
+
+    routes = []
+    for label, cost in goal_labels:
+        path = []
+        while label != -1:
+            path.append(graph.nodes[label_node[label]]["name"])
+            label = label_parent[label]
+        path.reverse()
+        routes.append((path, cost))
+    return routes
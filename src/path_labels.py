@@ -0,0 +1,67 @@
+from typing import List
+
+
+class PathLabels:
+    """
+    Search-tree paths stored as parent pointers instead of one list per frontier entry.
+
+    Every frontier entry (queue, heap or stack) carries an integer label instead of a copy
+    of its whole path. A label is a position in two parallel lists: the city it reached and
+    the label it was reached from. Pushing a neighbor then costs two list appends rather
+    than a new list of the path's length, and the path is rebuilt only when the entry is
+    popped.
+
+    Attributes:
+        node (List[str]): City ID of each label
+        parent (List[int]): Label each label was reached from (-1 for the start)
+
+    Example:
+        labels = PathLabels('vancouver')           # label 0
+        seoul = labels.add('seoul', 0)             # label 1
+        beijing = labels.add('beijing', seoul)     # label 2
+        labels.path(beijing)
+        # ['vancouver', 'seoul', 'beijing']
+    """
+    __slots__ = ('node', 'parent')
+
+    def __init__(self, start: str):
+        """
+        Start a search tree at one city (label 0).
+
+        Args:
+            start (str): Starting city ID
+        """
+        self.node = [start]
+        self.parent = [-1]
+
+    def add(self, node: str, parent: int) -> int:
+        """
+        Record that node was reached from the entry with label parent.
+
+        Args:
+            node (str): City ID reached
+            parent (int): Label of the entry it was reached from
+
+        Returns:
+            int: The new label
+        """
+        self.node.append(node)
+        self.parent.append(parent)
+        return len(self.node) - 1
+
+    def path(self, label: int) -> List[str]:
+        """
+        Rebuild the city IDs from the start to a label.
+
+        Args:
+            label (int): Label to walk back from
+
+        Returns:
+            List[str]: City IDs, start first
+        """
+        path = []
+        while label != -1:
+            path.append(self.node[label])
+            label = self.parent[label]
+        path.reverse()
+        return path
@@ -0,0 +1,218 @@
+import heapq
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+
+class BinaryHeapQueue:
+    """
+    Min-priority queue on a binary heap (heapq). The default for Dijkstra.
+
+    Works with any non-negative costs, including fractions. Entries with equal priority
+    come out in insertion order; a sequence number breaks ties, so the stored items
+    themselves are never compared.
+
+    Example:
+        queue = BinaryHeapQueue()
+        queue.push(350.0, 'yyz')
+        queue.push(150.0, 'sea')
+        queue.pop()   # (150.0, 'sea')
+    """
+    __slots__ = ('_heap', '_sequence')
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = 0
+
+    def push(self, priority: float, item: Any):
+        """Add an item with a priority."""
+        heapq.heappush(self._heap, (priority, self._sequence, item))
+        self._sequence += 1
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return the (priority, item) with the lowest priority."""
+        priority, _, item = heapq.heappop(self._heap)
+        return priority, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        """Iterate over the queued (priority, item) pairs in heap order (for display)."""
+        return ((priority, item) for priority, _, item in self._heap)
+
+
+def _whole_number(priority: float) -> int:
+    # Bucket queues index by the exact cost, so only whole-number costs are allowed
+    key = int(priority)
+    if key != priority:
+        raise ValueError(f"Cost {priority} is not a whole number; use the 'heap' queue for fractional weights")
+    return key
+
+
+class BucketQueue:
+    """
+    Monotone bucket queue (Dial's algorithm) for whole-number costs.
+
+    Keeps one bucket per cost value and a cursor that only moves forward: pop scans the
+    cursor up to the next non-empty bucket. Every push and pop is O(1) apart from that
+    scan, which costs one step per cost unit over the whole search (the final cost of the
+    last popped entry), so it wins when costs are small integers and the frontier is large.
+
+    Priorities must be whole numbers and never lower than the last popped priority
+    (true for Dijkstra with non-negative integer weights).
+
+    Example:
+        queue = BucketQueue()
+        queue.push(3, 'yyz')
+        queue.push(1, 'sea')
+        queue.pop()   # (1, 'sea')
+    """
+    __slots__ = ('_buckets', '_cursor', '_size')
+
+    def __init__(self):
+        # {cost: [(priority, item), ...]}; only non-empty buckets are stored
+        self._buckets: Dict[int, List[Tuple[float, Any]]] = {}
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, priority: float, item: Any):
+        """
+        Add an item with a whole-number priority.
+
+        Raises:
+            ValueError: If priority is not a whole number or is below the last popped priority
+        """
+        key = _whole_number(priority)
+        if key < self._cursor:
+            raise ValueError(f"Priority {priority} is below the last popped priority {self._cursor}")
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [(priority, item)]
+        else:
+            bucket.append((priority, item))
+        self._size += 1
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return the (priority, item) with the lowest priority."""
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        # Walk the cursor forward to the next non-empty bucket
+        while self._cursor not in self._buckets:
+            self._cursor += 1
+        bucket = self._buckets[self._cursor]
+        entry = bucket.pop()
+        if not bucket:
+            del self._buckets[self._cursor]
+        self._size -= 1
+        return entry
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        """Iterate over the queued (priority, item) pairs, bucket by bucket (for display)."""
+        return (entry for bucket in self._buckets.values() for entry in bucket)
+
+
+class RadixHeap:
+    """
+    Radix heap for whole-number costs.
+
+    Entries are kept in buckets by the highest bit in which their priority differs from
+    the last popped priority (bucket 0 holds entries equal to it). When bucket 0 is empty,
+    the lowest non-empty bucket is emptied and redistributed around its minimum, into
+    strictly lower buckets. Each entry moves at most once per bit, so a pop costs
+    O(log C) amortized for costs up to C, without the per-cost-unit scan of BucketQueue.
+
+    Priorities must be whole numbers and never lower than the last popped priority
+    (true for Dijkstra with non-negative integer weights).
+
+    Example:
+        queue = RadixHeap()
+        queue.push(1200, 'yyz')
+        queue.push(150, 'sea')
+        queue.pop()   # (150, 'sea')
+    """
+    __slots__ = ('_buckets', '_last', '_size')
+
+    def __init__(self):
+        # Bucket i holds (key, priority, item) entries whose key differs from _last first at bit i - 1
+        self._buckets: List[List[Tuple[int, float, Any]]] = [[]]
+        self._last = 0
+        self._size = 0
+
+    def push(self, priority: float, item: Any):
+        """
+        Add an item with a whole-number priority.
+
+        Raises:
+            ValueError: If priority is not a whole number or is below the last popped priority
+        """
+        key = _whole_number(priority)
+        if key < self._last:
+            raise ValueError(f"Priority {priority} is below the last popped priority {self._last}")
+        index = (key ^ self._last).bit_length()
+        while len(self._buckets) <= index:
+            self._buckets.append([])
+        self._buckets[index].append((key, priority, item))
+        self._size += 1
+
+    def pop(self) -> Tuple[float, Any]:
+        """Remove and return the (priority, item) with the lowest priority."""
+        if not self._size:
+            raise IndexError("pop from an empty RadixHeap")
+        buckets = self._buckets
+        if not buckets[0]:
+            # Empty the lowest non-empty bucket and spread it out around its minimum
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket = buckets[index]
+            buckets[index] = []
+            # Compare keys only: items may not be orderable, and ties need no ordering
+            self._last = last = min(entry[0] for entry in bucket)
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        _, priority, item = buckets[0].pop()
+        self._size -= 1
+        return priority, item
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        """Iterate over the queued (priority, item) pairs, bucket by bucket (for display)."""
+        return ((priority, item) for bucket in self._buckets for _, priority, item in bucket)
+
+
+# Queue strategies selectable by name in dijkstra_pathfind and distance_matrix
+PRIORITY_QUEUES: Dict[str, Callable[[], Any]] = {
+    'heap': BinaryHeapQueue,
+    'bucket': BucketQueue,
+    'radix': RadixHeap,
+}
+
+
+def make_queue(queue: Union[str, Callable[[], Any]] = 'heap'):
+    """
+    Create an empty priority queue.
+
+    Args:
+        queue (str or callable): 'heap' (binary heap, default, any non-negative costs),
+            'bucket' (Dial's bucket queue) or 'radix' (radix heap), the last two for
+            whole-number costs only. A class or factory with the same push/pop/len/iter
+            interface is also accepted.
+
+    Returns:
+        A new, empty queue
+
+    Raises:
+        ValueError: If queue is an unknown name
+
+    Example:
+        queue = make_queue('bucket')
+    """
+    if callable(queue):
+        return queue()
+    if queue not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue {queue!r}; expected one of {', '.join(PRIORITY_QUEUES)}")
+    return PRIORITY_QUEUES[queue]()
@@ -0,0 +1,206 @@
+from typing import Dict, List, Set
+
+
+class ReachabilityIndex:
+    """
+    Precomputed "can A reach B at all?" answers for a directed flight graph.
+
+    Cities that can all reach each other form a strongly connected component (SCC).
+    Collapsing every SCC into one node gives the condensation, which has no cycles.
+    For each component we keep a bitset (a Python int) of every component it can reach,
+    so a reachability question is a single bit test instead of a full search.
+
+    Attributes:
+        component (Dict): Maps each node ID to its component number
+        reach (List[int]): reach[c] has bit d set if component c can reach component d
+
+    Example:
+        index = ReachabilityIndex(graph)
+        index.can_reach('vancouver', 'daqing')   # True
+        index.can_reach('daqing', 'nowhere')     # False
+
+    Time Complexity: O(V + E) to build (plus the bitset unions on the condensation)
+    Space Complexity: O(C^2 / 8) bytes for C components
+    """
+    def __init__(self, graph):
+        """
+        Build the index from any graph exposing `nodes` and `get_neighbors`.
+
+        Args:
+            graph: The flight graph (Graph or another object with the same interface)
+        """
+        self.graph = graph
+        self.component: Dict[str, int] = {}
+        self.reach: List[int] = []
+        # Targets of routes to cities that don't exist (yet); adding one of them rebuilds the index
+        self._dangling: Set[str] = set()
+        # Set when an edge merges components; the index is rebuilt on the next query
+        self._stale = False
+        self._build()
+
+    def _build(self):
+        """
+        Compute SCCs with an iterative version of Tarjan's algorithm.
+
+        Tarjan finishes a component only after every component it can reach,
+        so each component's reach set can be filled in the moment it is found.
+        Routes to cities that aren't in the graph are ignored (nothing can be reached through them).
+        """
+        graph = self.graph
+        component = {}
+        reach = []
+        dangling = set()
+        order = {}       # DFS discovery number of each node
+        low = {}         # Lowest discovery number reachable from the node's subtree
+        on_stack = set()
+        stack = []
+
+        for root in graph.nodes:
+            if root in order:
+                continue
+            # Each frame is (node, iterator over its outgoing edges)
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            frames = [(root, iter(graph.get_neighbors(root)))]
+
+            while frames:
+                node, neighbors = frames[-1]
+                descended = False
+                for neighbor, _ in neighbors:
+                    if neighbor in dangling:
+                        continue
+                    if neighbor not in order:
+                        neighbor_edges = graph.get_neighbors(neighbor)
+                        if neighbor_edges is None:
+                            # A route to a city that doesn't exist
+                            dangling.add(neighbor)
+                            continue
+                        order[neighbor] = low[neighbor] = len(order)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        frames.append((neighbor, iter(neighbor_edges)))
+                        descended = True
+                        break
+                    if neighbor in on_stack:
+                        low[node] = min(low[node], order[neighbor])
+                if descended:
+                    continue
+
+                # All edges of `node` are done
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+                if low[node] == order[node]:
+                    # `node` is the root of a component: pop its members off the stack
+                    number = len(reach)
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = number
+                        members.append(member)
+                        if member == node:
+                            break
+                    # Every component reachable from here is already numbered
+                    bits = 1 << number
+                    for member in members:
+                        for neighbor, _ in graph.get_neighbors(member):
+                            neighbor_component = component.get(neighbor)
+                            if neighbor_component is not None and neighbor_component != number:
+                                bits |= reach[neighbor_component]
+                    reach.append(bits)
+
+        # Assign only after the build finishes so concurrent readers never see half a build
+        self.component = component
+        self.reach = reach
+        self._dangling = dangling
+        self._stale = False
+
+    def copy(self, graph) -> 'ReachabilityIndex':
+        """
+        Copy the index for a new version of the graph, so the copy can be updated independently.
+
+        Args:
+            graph: The graph version the copy describes (used if it has to be rebuilt)
+
+        Returns:
+            ReachabilityIndex: An independent copy of this index
+        """
+        duplicate = ReachabilityIndex.__new__(ReachabilityIndex)
+        duplicate.graph = graph
+        duplicate.component = dict(self.component)
+        duplicate.reach = list(self.reach)
+        duplicate._dangling = set(self._dangling)
+        duplicate._stale = self._stale
+        return duplicate
+
+    def can_reach(self, from_node: str, to_node: str) -> bool:
+        """
+        Check whether any route exists from one city to another.
+
+        Args:
+            from_node (str): Starting city ID
+            to_node (str): Destination city ID
+
+        Returns:
+            bool: True if to_node is reachable from from_node (a city always reaches itself).
+                  False if either city is not in the graph.
+        """
+        if self._stale:
+            self._build()
+        from_component = self.component.get(from_node)
+        to_component = self.component.get(to_node)
+        if from_component is None or to_component is None:
+            return False
+        return (self.reach[from_component] >> to_component) & 1 == 1
+
+    def add_node(self, node_id: str):
+        """
+        Record a newly added city as its own component.
+
+        Args:
+            node_id (str): The new city ID
+        """
+        if node_id in self.component or node_id in self._dangling:
+            # Re-adding a city clears its routes, and routes added before the city existed
+            # now lead somewhere, so the index has to be rebuilt
+            self._stale = True
+            return
+        self.component[node_id] = len(self.reach)
+        self.reach.append(1 << len(self.reach))
+
+    def add_edge(self, from_node: str, to_node: str):
+        """
+        Update the index after a route from_node -> to_node was added.
+
+        If the new route does not close a cycle, every component that reaches from_node
+        gains everything to_node reaches (one bitset OR per component). If it does close
+        a cycle, components merge and the index is rebuilt lazily on the next query.
+
+        Args:
+            from_node (str): Starting city ID of the new route
+            to_node (str): Destination city ID of the new route
+        """
+        if self._stale:
+            return
+        from_component = self.component.get(from_node)
+        to_component = self.component.get(to_node)
+        if from_component is None or to_component is None:
+            # A route from or to a city that doesn't exist yet: rebuild once it matters
+            self._stale = True
+            return
+        reach = self.reach
+        # Already reachable - nothing changes
+        if (reach[from_component] >> to_component) & 1:
+            return
+        # to_node can already get back to from_node, so the edge merges components
+        if (reach[to_component] >> from_component) & 1:
+            self._stale = True
+            return
+        added = reach[to_component]
+        for number, bits in enumerate(reach):
+            if (bits >> from_component) & 1:
+                reach[number] = bits | added
@@ -0,0 +1,222 @@
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+from src.graph import Graph
+
+
+# One scheduled flight leg. Times are plain numbers in one unit (e.g. minutes since midnight).
+Connection = namedtuple('Connection', ['from_city', 'to_city', 'departure_time', 'arrival_time', 'fare', 'trip_id'])
+
+
+class Timetable:
+    """
+    Scheduled flights between the cities of a Graph, for time-dependent routing.
+
+    Instead of turning every departure into an extra graph node, each flight leg is one
+    Connection, and all connections are kept in a single list sorted by departure time.
+    The Connection Scan Algorithm (earliest_arrival_pathfind) then answers a query with
+    one forward pass over that list.
+
+    Attributes:
+        graph (Graph): The flight graph the cities come from (used for names)
+        default_min_connection_time (float): Minimum time needed to change flights at any city
+        min_connection_times (Dict[str, float]): Per-city overrides of the minimum connection time
+
+    Example:
+        timetable = Timetable(graph, default_min_connection_time=45)
+        timetable.add_connection('vancouver', 'seoul', 600, 1260, 1000.0)
+        timetable.add_connection('seoul', 'beijing', 1320, 1460, 100.0)
+        path, arrival = earliest_arrival_pathfind(timetable, 'vancouver', 'beijing', departure_time=480)
+        # path = ['Vancouver', 'Seoul', 'Beijing']
+        # arrival = 1460
+    """
+    def __init__(self, graph: Graph, default_min_connection_time: float = 0):
+        """
+        Create an empty timetable.
+
+        Args:
+            graph (Graph): The flight graph whose cities the connections use
+            default_min_connection_time (float): Minimum time to change flights at any city
+        """
+        self.graph = graph
+        self.default_min_connection_time = default_min_connection_time
+        self.min_connection_times: Dict[str, float] = {}
+        self._connections: List[Connection] = []
+        self._departure_times: List[float] = []
+        # Connections are appended unsorted and sorted once before the next query
+        self._sorted = True
+
+    def add_connection(self, from_city: str, to_city: str, departure_time: float, arrival_time: float,
+                       fare: float, trip_id: Optional[str] = None):
+        """
+        Add one scheduled flight leg.
+
+        Args:
+            from_city (str): Departure city ID (e.g., 'vancouver')
+            to_city (str): Arrival city ID (e.g., 'seoul')
+            departure_time (float): Departure time
+            arrival_time (float): Arrival time (not before departure_time)
+            fare (float): Price of the leg
+            trip_id (str, optional): Legs sharing a trip_id are one aircraft making stops;
+                                     staying on board needs no connection time
+
+        Raises:
+            ValueError: If a city is not in the graph or the flight arrives before it departs
+        """
+        if from_city not in self.graph.nodes or to_city not in self.graph.nodes:
+            raise ValueError(f"Unknown city in connection {from_city} -> {to_city}")
+        if arrival_time < departure_time:
+            raise ValueError(f"Connection {from_city} -> {to_city} arrives before it departs")
+        self._connections.append(Connection(from_city, to_city, departure_time, arrival_time, fare, trip_id))
+        self._sorted = False
+
+    def set_min_connection_time(self, city: str, minimum: float):
+        """
+        Set the minimum time needed to change flights at one city.
+
+        Args:
+            city (str): City ID
+            minimum (float): Minimum connection time at that city
+        """
+        self.min_connection_times[city] = minimum
+
+    def _sort(self):
+        # Sort by departure time (then arrival time) and refresh the departure-time index
+        self._connections.sort(key=lambda connection: (connection.departure_time, connection.arrival_time))
+        self._departure_times = [connection.departure_time for connection in self._connections]
+        self._sorted = True
+
+    @property
+    def connections(self) -> List[Connection]:
+        """All connections, sorted by departure time (then arrival time)."""
+        if not self._sorted:
+            self._sort()
+        return self._connections
+
+    def first_departure_at_or_after(self, time: float) -> int:
+        """
+        Position of the first connection departing at or after a time (binary search).
+
+        Args:
+            time (float): The earliest departure time of interest
+
+        Returns:
+            int: Index into `connections`
+        """
+        if not self._sorted:
+            self._sort()
+        return bisect_left(self._departure_times, time)
+
+
+def earliest_arrival_journey(timetable: Timetable, start: str, goal: str,
+                             departure_time: float) -> List[Connection]:
+    """
+    Finds the flight legs that reach goal as early as possible (Connection Scan Algorithm).
+
+    Scans connections in departure order, starting at the first one leaving at or after
+    departure_time. A connection is usable if its aircraft is already being ridden (same
+    trip_id) or if its departure city was reached at least the minimum connection time
+    before it leaves (no connection time is needed at the start city). Each usable
+    connection may improve the earliest arrival at its destination. The scan stops once
+    connections depart after the best arrival found at the goal.
+
+    Args:
+        timetable (Timetable): The scheduled flights
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'beijing')
+        departure_time (float): Earliest time the traveller can leave start
+
+    Returns:
+        List[Connection]: The legs of the journey in order (empty list if goal cannot be reached
+            or start == goal)
+
+    Time Complexity: O(C) for C connections scanned
+    Space Complexity: O(V + T) for V cities and T trips
+    """
+    if start == goal:
+        return []
+
+    connections = timetable.connections
+    earliest = {start: departure_time}
+    # For each city: (first connection boarded, connection left) of the best arrival
+    arrived_by: Dict[str, Tuple[int, int]] = {}
+    # For each trip: the first of its connections the traveller could board
+    boarded_at: Dict[str, int] = {}
+    infinity = float('inf')
+
+    for number in range(timetable.first_departure_at_or_after(departure_time), len(connections)):
+        connection = connections[number]
+        # Nothing departing now can beat the current arrival at the goal
+        if connection.departure_time >= earliest.get(goal, infinity):
+            break
+
+        on_board = connection.trip_id is not None and connection.trip_id in boarded_at
+        if not on_board:
+            reached = earliest.get(connection.from_city, infinity)
+            if connection.from_city != start:
+                reached += timetable.min_connection_times.get(connection.from_city,
+                                                              timetable.default_min_connection_time)
+            if reached > connection.departure_time:
+                continue
+            if connection.trip_id is not None:
+                boarded_at[connection.trip_id] = number
+
+        if connection.arrival_time < earliest.get(connection.to_city, infinity):
+            earliest[connection.to_city] = connection.arrival_time
+            entered = boarded_at[connection.trip_id] if connection.trip_id is not None else number
+            arrived_by[connection.to_city] = (entered, number)
+
+    if goal not in arrived_by:
+        return []
+
+    # Walk back from the goal one ride (trip segment) at a time
+    journey = []
+    city = goal
+    while city != start:
+        entered, left = arrived_by[city]
+        ride = [connections[left]]
+        trip_id = connections[left].trip_id
+        if trip_id is not None:
+            # Collect the trip's legs between boarding and leaving, walking back city by city
+            for number in range(left - 1, entered - 1, -1):
+                if connections[number].trip_id == trip_id and connections[number].to_city == ride[-1].from_city:
+                    ride.append(connections[number])
+        ride.reverse()
+        journey[:0] = ride
+        city = connections[entered].from_city
+    return journey
+
+
+def earliest_arrival_pathfind(timetable: Timetable, start: str, goal: str,
+                              departure_time: float) -> Tuple[List[str], float]:
+    """
+    Finds the earliest-arriving route from start to goal on the timetable.
+
+    Same (path, cost) shape as the other searches, with the arrival time as the cost.
+    Use earliest_arrival_journey to get the individual legs (times, fares, trips).
+
+    Args:
+        timetable (Timetable): The scheduled flights
+        start (str): Starting city ID (e.g., 'vancouver')
+        goal (str): Destination city ID (e.g., 'beijing')
+        departure_time (float): Earliest time the traveller can leave start
+
+    Returns:
+        Tuple[List[str], float]:
+            - path: List of city names from start to goal (empty list if goal cannot be reached)
+            - cost: Arrival time at goal. Returns float('inf') if goal cannot be reached
+
+    Example:
+        path, arrival = earliest_arrival_pathfind(timetable, 'vancouver', 'beijing', departure_time=480)
+        # path = ['Vancouver', 'Seoul', 'Beijing']
+        # arrival = 1460
+    """
+    names = timetable.graph.nodes
+    if start == goal:
+        return ([names[start]["name"]], departure_time)
+
+    journey = earliest_arrival_journey(timetable, start, goal, departure_time)
+    if not journey:
+        return ([], float('inf'))
+    path = [names[start]["name"]] + [names[leg.to_city]["name"] for leg in journey]
+    return (path, journey[-1].arrival_time)
@@ -0,0 +1,270 @@
+import threading
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+# Order and labels used when printing a step dictionary.
+# Each search only fills in the keys it uses (e.g. BFS has 'previous_level', DFS has 'stack').
+STEP_FIELDS = [
+    ('queue', 'Queue'),
+    ('stack', 'Stack'),
+    ('previous_level', 'Previous level'),
+]
+EXPANSION_FIELDS = [
+    ('neighbors', 'Neighbors'),
+    ('updated_queue', 'Updated Queue'),
+    ('updated_stack', 'Updated Stack'),
+]
+
+
+def collect_steps(step_iterator: Iterator[dict]) -> Tuple[List[dict], tuple]:
+    """
+    Run a step generator to the end and keep every step in a list.
+
+    The step generators (bfs_steps, dfs_steps, dijkstra_steps) yield one step at a time
+    and return their final result through StopIteration. This helper turns that back into
+    the eager (steps, result) shape used by the *_pathfind functions.
+
+    Args:
+        step_iterator (Iterator[dict]): Generator returned by one of the *_steps functions
+
+    Returns:
+        Tuple[List[dict], tuple]:
+            - steps: Every step the generator yielded, in order
+            - result: The value the generator returned (e.g. (path, cost))
+
+    Example:
+        steps, (path, cost) = collect_steps(bfs_steps(graph, 'vancouver', 'seoul'))
+    """
+    steps = []
+    while True:
+        try:
+            steps.append(next(step_iterator))
+        except StopIteration as finished:
+            return (steps, finished.value)
+
+
+def format_step(index: int, step: dict) -> str:
+    """
+    Render a single step dictionary as the text block shown to users.
+
+    Args:
+        index (int): 1-based step number
+        step (dict): Step dictionary yielded by a search
+
+    Returns:
+        str: Multi-line text for the step (ends with a blank line)
+
+    Example:
+        print(format_step(1, step))
+        # Step 1:
+        #   Action: Dequeue: Vancouver
+        #   ...
+    """
+    # The total is not shown because a lazy trace does not know it up front
+    lines = [f"Step {index}:"]
+    lines.append(f"  Action: {step['action']}")
+    for key, label in STEP_FIELDS:
+        if key in step:
+            lines.append(f"  {label}: {step[key]}")
+    lines.append(f"  Path so far: {' → '.join(step['current_path'])} (Cost: {step['cost']})")
+    # Only expanded steps have neighbors (the goal step does not)
+    for key, label in EXPANSION_FIELDS:
+        if key in step:
+            lines.append(f"  {label}: {step[key]}")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def no_route_step(nodes, start: str, goal: str, cost: float = 0, **fields) -> dict:
+    """
+    Build the single step a search yields when it rejects an unreachable goal up front.
+
+    Args:
+        nodes: The searched graph's city records ({node_id: NodeRecord, ...})
+        start (str): Starting city ID
+        goal (str): Destination city ID
+        cost (float): Cost shown for the (start-only) path
+        **fields: The search's empty frontier fields (e.g. queue=[], previous_level=[])
+
+    Returns:
+        dict: Step dictionary, naming both cities by their city names
+              (or IDs, for cities not in the graph)
+
+    Example:
+        yield no_route_step(nodes, 'vancouver', 'nowhere', queue=[])
+        # {'action': 'No route: nowhere cannot be reached from Vancouver', ...}
+    """
+    start_name = nodes[start].name if start in nodes else start
+    goal_name = nodes[goal].name if goal in nodes else goal
+    return {
+        'action': f'No route: {goal_name} cannot be reached from {start_name}',
+        **fields,
+        'current_path': [start_name],
+        'cost': cost
+    }
+
+
+def is_goal_step(step: dict) -> bool:
+    """Return True if the step records reaching the goal."""
+    return step['action'].startswith('Goal found')
+
+
+class StepPager:
+    """
+    Page through a lazy step iterator without building the whole trace first.
+
+    Steps are pulled from the generator only when they are about to be shown (or skipped),
+    so the first page appears immediately even on very large graphs. Only the current
+    position is kept in memory, never the full list of steps.
+
+    Attributes:
+        position (int): Number of steps consumed so far
+        result (tuple): The search result, available once the iterator is exhausted
+        finished (bool): True once the iterator has been exhausted
+
+    Example:
+        pager = StepPager(dijkstra_steps(graph, 'vancouver', 'seoul'))
+        print(pager.next_page(5))      # steps 1-5
+        print(pager.jump_to(40))       # skips to step 40
+        print(pager.jump_to_goal())    # skips to the next 'Goal found' step
+        path, cost = pager.finish()
+    """
+    def __init__(self, step_iterator: Iterator[dict]):
+        """
+        Wrap a step generator.
+
+        Args:
+            step_iterator (Iterator[dict]): Generator returned by one of the *_steps functions
+        """
+        self._steps = step_iterator
+        self.position = 0
+        self.result = None
+        self.finished = False
+        # Look one step ahead so `finished` is already True once the last step is shown
+        self._pending = self._pull()
+        self.finished = self._pending is None
+
+    def _pull(self) -> Optional[dict]:
+        # Pull one step from the generator; record its return value when it runs out
+        try:
+            return next(self._steps)
+        except StopIteration as done:
+            self.result = done.value
+            return None
+
+    def _next_step(self) -> Optional[dict]:
+        step = self._pending
+        if step is None:
+            self.finished = True
+            return None
+        self.position += 1
+        self._pending = self._pull()
+        self.finished = self._pending is None
+        return step
+
+    def next_page(self, page_size: int = 1) -> str:
+        """
+        Render the next page of steps.
+
+        Args:
+            page_size (int): Number of steps on the page
+
+        Returns:
+            str: Rendered steps (empty string when no steps are left)
+        """
+        rendered = []
+        for _ in range(page_size):
+            step = self._next_step()
+            if step is None:
+                break
+            rendered.append(format_step(self.position, step))
+        return "".join(rendered)
+
+    def jump_to(self, step_number: int) -> str:
+        """
+        Skip forward without rendering and show step `step_number`.
+
+        Args:
+            step_number (int): 1-based step to show. Must be after the current position.
+
+        Returns:
+            str: The rendered step, or an explanatory message if it cannot be shown
+        """
+        if step_number <= self.position:
+            return f"Already past step {step_number} (at step {self.position}).\n"
+        while self.position < step_number - 1:
+            if self._next_step() is None:
+                return f"Trace ended after {self.position} steps.\n"
+        return self.next_page(1) or f"Trace ended after {self.position} steps.\n"
+
+    def jump_to_goal(self) -> str:
+        """
+        Skip forward to the next step that reaches the goal and show it.
+
+        Returns:
+            str: The rendered goal step, or a message if the goal is never reached
+        """
+        while True:
+            step = self._next_step()
+            if step is None:
+                return f"Goal not reached (trace ended after {self.position} steps).\n"
+            if is_goal_step(step):
+                return format_step(self.position, step)
+
+    def finish(self) -> tuple:
+        """
+        Consume any remaining steps without rendering them and return the search result.
+
+        Returns:
+            tuple: The value returned by the step generator (e.g. (path, cost))
+        """
+        while not self.finished:
+            self._next_step()
+        return self.result
+
+
+def write_trace_in_background(make_steps: Callable[[], Iterator[dict]], filename: str) -> threading.Thread:
+    """
+    Write a full step trace to a file on a background thread.
+
+    A fresh step generator is created for the writer so the interactive pager
+    can consume its own generator at the same time.
+
+    Args:
+        make_steps (Callable): Zero-argument function returning a new step generator
+        filename (str): File to write the trace to
+
+    Returns:
+        threading.Thread: The started writer thread (call join() to wait for it). After
+                          join(), its `error` attribute holds the exception that stopped the
+                          write (e.g. FileNotFoundError), or None if the trace was written.
+
+    Example:
+        writer = write_trace_in_background(lambda: bfs_steps(graph, start, goal), 'trace.txt')
+        ...
+        writer.join()
+        if writer.error is not None:
+            print(f"Could not write trace: {writer.error}")
+    """
+    def write():
+        try:
+            with open(filename, 'w', encoding='utf-8') as trace_file:
+                steps = make_steps()
+                index = 0
+                # Write in chunks so large traces never sit in memory all at once
+                while True:
+                    chunk = list(islice(steps, 256))
+                    if not chunk:
+                        break
+                    for step in chunk:
+                        index += 1
+                        trace_file.write(format_step(index, step))
+        except Exception as error:
+            # Keep the error for the caller instead of printing a traceback over the step output
+            writer.error = error
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.error = None
+    writer.start()
+    return writer
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the precomputed all-pairs table
+"""
+import os
+import random
+import tempfile
+import unittest
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+
+try:
+    import numpy
+    from src.all_pairs import AllPairsTable
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestAllPairs(unittest.TestCase):
+    """Test cases for AllPairsTable"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # Create a simple graph:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   |                  |
+        #   v                  v
+        #   D --4-----------> E
+        
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+    
+    def test_pathfind(self):
+        """Test a looked-up route and cost"""
+        table = AllPairsTable.build(self.graph)
+        self.assertEqual(table.pathfind("A", "E"), (["City A", "City D", "City E"], 7.0))
+        self.assertEqual(table.pathfind("B", "B"), (["City B"], 0.0))
+        self.assertEqual(table.cost("A", "C"), 15.0)
+    
+    def test_no_path(self):
+        """Test that unreachable pairs give an empty path and infinite cost"""
+        table = AllPairsTable.build(self.graph)
+        self.assertEqual(table.pathfind("E", "A"), ([], float('inf')))
+    
+    def test_unknown_city(self):
+        """Test that a city missing from the table gives no path, like dijkstra_pathfind"""
+        table = AllPairsTable.build(self.graph)
+        self.assertEqual(table.pathfind("A", "Z"), ([], float('inf')))
+        self.assertEqual(table.pathfind("Z", "A"), ([], float('inf')))
+        self.assertEqual(table.cost("Z", "A"), float('inf'))
+        _, path, cost = dijkstra_pathfind(self.graph, "A", "Z")
+        self.assertEqual((path, cost), table.pathfind("A", "Z"))
+    
+    def test_parallel_edges_use_cheapest(self):
+        """Test that the cheaper of two parallel flights is used"""
+        self.graph.add_edge("A", "B", 1.0)
+        table = AllPairsTable.build(self.graph)
+        self.assertEqual(table.cost("A", "C"), 11.0)
+    
+    def test_save_and_load(self):
+        """Test that a saved table answers the same queries after loading"""
+        table = AllPairsTable.build(self.graph)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npz")
+            table.save(path)
+            loaded = AllPairsTable.load(path)
+        
+        self.assertEqual(loaded.node_ids, table.node_ids)
+        self.assertEqual(loaded.pathfind("A", "E"), table.pathfind("A", "E"))
+    
+    def test_matches_dijkstra_on_random_graph(self):
+        """Test every pair against dijkstra_pathfind"""
+        rng = random.Random(5)
+        graph = Graph()
+        node_ids = [str(i) for i in range(25)]
+        for node_id in node_ids:
+            graph.add_node(node_id, f"City {node_id}")
+        for _ in range(80):
+            from_node, to_node = rng.sample(node_ids, 2)
+            graph.add_edge(from_node, to_node, float(rng.randint(1, 50)))
+        
+        table = AllPairsTable.build(graph)
+        for start in node_ids:
+            for goal in node_ids:
+                _, path, cost = dijkstra_pathfind(graph, start, goal)
+                table_path, table_cost = table.pathfind(start, goal)
+                self.assertEqual(table_cost, cost)
+                self.assertEqual(len(table_path) > 0, len(path) > 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the city-name lookup index
+"""
+import unittest
+from src.graph import Graph
+from src.city_index import CityIndex, normalize
+
+
+class TestCityIndex(unittest.TestCase):
+    """Test cases for CityIndex"""
+    
+    def setUp(self):
+        """Set up a test graph and its index for each test"""
+        self.graph = Graph()
+        
+        for node_id, name in [("vancouver", "Vancouver"), ("new_york", "New York"), ("newark", "Newark"),
+                              ("london", "London"), ("sao_paulo", "São Paulo"), ("yvr", "Vancouver Intl")]:
+            self.graph.add_node(node_id, name)
+        self.index = CityIndex(self.graph)
+    
+    def test_normalize(self):
+        """Test that case, accents and separators don't matter"""
+        self.assertEqual(normalize("  New_York "), "new york")
+        self.assertEqual(normalize("NEW-YORK"), "new york")
+        self.assertEqual(normalize("São  Paulo"), "sao paulo")
+    
+    def test_exact_names_and_ids(self):
+        """Test that both names and IDs resolve, however they are typed"""
+        self.assertEqual(self.index.resolve("new york"), "new_york")
+        self.assertEqual(self.index.resolve("New_York"), "new_york")
+        self.assertEqual(self.index.resolve("sao paulo"), "sao_paulo")
+        self.assertEqual(self.index.resolve("YVR"), "yvr")
+        # An exact name wins even though it is also a prefix of another city
+        self.assertEqual(self.index.resolve("vancouver"), "vancouver")
+    
+    def test_prefix(self):
+        """Test that a prefix is only guessed, and only when it identifies one city"""
+        self.assertIsNone(self.index.resolve("lon"))
+        self.assertIsNone(self.index.resolve("s"))
+        self.assertEqual(self.index.guess("lon"), "london")
+        self.assertIsNone(self.index.guess("new"))
+        self.assertEqual(self.index.complete("new"), ["new_york", "newark"])
+        self.assertEqual(self.index.complete("new", limit=1), ["new_york"])
+        self.assertEqual(self.index.complete("x"), [])
+    
+    def test_fuzzy(self):
+        """Test that misspellings are only guessed, as the closest city"""
+        self.assertIsNone(self.index.resolve("vancuver"))
+        self.assertEqual(self.index.guess("vancuver"), "vancouver")
+        self.assertEqual(self.index.guess("new yrok"), "new_york")
+        self.assertEqual(self.index.fuzzy("londn")[0][0], "london")
+        self.assertIsNone(self.index.guess("qqqq"))
+        self.assertEqual(self.index.suggest("qqqq"), [])
+    
+    def test_suggest(self):
+        """Test that suggestions list completions before similar spellings"""
+        self.assertEqual(self.index.suggest("new")[:2], ["new_york", "newark"])
+        self.assertIn("london", self.index.suggest("lodnon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
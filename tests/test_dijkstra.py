@@ -171,6 +171,30 @@ class TestDijkstra(unittest.TestCase):
         self.assertEqual(cost, 3.0)
         self.assertNotIn("D", path[1:])  # D is not second node
 
+    def test_dijkstra_weight_selector(self):
+        """Test optimizing a different edge attribute without rebuilding the graph"""
+        # Make A -> B -> C -> E the fastest route while A -> D -> E stays the cheapest
+        graph = Graph()
+        for node_id in ["A", "B", "C", "D", "E"]:
+            graph.add_node(node_id, f"City {node_id}")
+        graph.add_edge("A", "B", 5.0, duration=1.0)
+        graph.add_edge("B", "C", 10.0, duration=1.0)
+        graph.add_edge("A", "D", 3.0, duration=5.0)
+        graph.add_edge("D", "E", 4.0, duration=5.0)
+        graph.add_edge("C", "E", 2.0, duration=1.0)
+        
+        _, path, cost = dijkstra_pathfind(graph, start="A", goal="E")
+        self.assertEqual(path, ["City A", "City D", "City E"])
+        self.assertEqual(cost, 7.0)
+        
+        _, path, cost = dijkstra_pathfind(graph, start="A", goal="E", weight="duration")
+        self.assertEqual(path, ["City A", "City B", "City C", "City E"])
+        self.assertEqual(cost, 3.0)
+        
+        # 1 * price + 2 * duration: A-D-E = 7 + 20 = 27, A-B-C-E = 17 + 6 = 23
+        _, path, cost = dijkstra_pathfind(graph, start="A", goal="E", weight={"weight": 1.0, "duration": 2.0})
+        self.assertEqual(cost, 23.0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
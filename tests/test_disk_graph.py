@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the disk-backed graph
+"""
+import os
+import tempfile
+import unittest
+from src.graph import Graph
+from src.bfs import bfs_pathfind
+from src.dfs import dfs_pathfind
+from src.dijkstra import dijkstra_pathfind
+from src.disk_graph import DiskGraph, LRUCache
+
+
+class TestDiskGraph(unittest.TestCase):
+    """Test cases for DiskGraph and its LRU cache"""
+    
+    def setUp(self):
+        """Set up an in-memory graph and a disk-backed copy for each test"""
+        self.graph = Graph()
+        
+        # Create a simple graph:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   |                  |
+        #   v                  v
+        #   D --4-----------> E
+        
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+        
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "routes.sqlite")
+        self.disk_graph = DiskGraph.from_graph(self.graph, self.path, cache_size=2, reachability_index=True)
+    
+    def tearDown(self):
+        """Close the database and remove the temporary directory"""
+        self.disk_graph.close()
+        self.directory.cleanup()
+    
+    def test_nodes_view(self):
+        """Test the dict-like nodes view"""
+        self.assertEqual(len(self.disk_graph.nodes), 5)
+        self.assertIn("A", self.disk_graph.nodes)
+        self.assertNotIn("X", self.disk_graph.nodes)
+        self.assertEqual(self.disk_graph.nodes["C"]["name"], "City C")
+        self.assertEqual(list(self.disk_graph.nodes), ["A", "B", "C", "D", "E"])
+    
+    def test_get_neighbors(self):
+        """Test reading adjacency lists from disk"""
+        self.assertEqual(self.disk_graph.get_neighbors("A"), [("B", 5.0), ("D", 3.0)])
+        self.assertEqual(self.disk_graph.get_neighbors("E"), [])
+        self.assertIsNone(self.disk_graph.get_neighbors("nonexistent"))
+    
+    def test_searches_work_unchanged(self):
+        """Test that the existing searches give the same answers on disk and in memory"""
+        for start, goal in [("A", "E"), ("A", "C"), ("E", "A"), ("B", "B")]:
+            self.assertEqual(dijkstra_pathfind(self.disk_graph, start, goal),
+                             dijkstra_pathfind(self.graph, start, goal))
+            self.assertEqual(bfs_pathfind(self.disk_graph, start, goal),
+                             bfs_pathfind(self.graph, start, goal))
+            self.assertEqual(dfs_pathfind(self.disk_graph, start, goal)[1],
+                             dfs_pathfind(self.graph, start, goal)[1])
+    
+    def test_reachability_index_is_opt_in(self):
+        """Test that without the index can_reach only checks the cities exist"""
+        disk_graph = DiskGraph(self.path)
+        try:
+            self.assertTrue(disk_graph.can_reach("E", "A"))
+            self.assertFalse(disk_graph.can_reach("E", "nonexistent"))
+            self.assertIsNone(disk_graph._reachability)
+            # The search itself finds there is no route
+            _, path, cost = dijkstra_pathfind(disk_graph, "E", "A")
+            self.assertEqual((path, cost), ([], float('inf')))
+            self.assertEqual(dijkstra_pathfind(disk_graph, "A", "E")[1:], (["City A", "City D", "City E"], 7.0))
+        finally:
+            disk_graph.close()
+    
+    def test_weight_selection(self):
+        """Test that only the stored weight can be selected"""
+        self.assertEqual(self.disk_graph.get_neighbors("A", weight="weight"), [("B", 5.0), ("D", 3.0)])
+        self.assertEqual(self.disk_graph.get_neighbors("A", weight={"weight": 2.0}), [("B", 10.0), ("D", 6.0)])
+        with self.assertRaises(KeyError):
+            self.disk_graph.get_neighbors("A", weight="duration")
+        with self.assertRaises(KeyError):
+            dijkstra_pathfind(self.disk_graph, "A", "E", weight="duration")
+    
+    def test_additions_persist(self):
+        """Test that committed additions are visible after reopening the file"""
+        self.disk_graph.add_node("F", "City F")
+        self.disk_graph.add_edge("E", "F", 1.0)
+        self.disk_graph.commit()
+        self.disk_graph.close()
+        
+        self.disk_graph = DiskGraph(self.path)
+        _, path, cost = dijkstra_pathfind(self.disk_graph, "A", "F")
+        self.assertEqual(path, ["City A", "City D", "City E", "City F"])
+        self.assertEqual(cost, 8.0)
+    
+    def test_added_edge_updates_cache_and_reachability(self):
+        """Test that a new edge is seen even if the old adjacency list was cached"""
+        self.assertFalse(self.disk_graph.can_reach("E", "A"))
+        self.disk_graph.get_neighbors("E")
+        
+        self.disk_graph.add_edge("E", "A", 1.0)
+        self.assertEqual(self.disk_graph.get_neighbors("E"), [("A", 1.0)])
+        self.assertTrue(self.disk_graph.can_reach("E", "A"))
+    
+    def test_cache_is_bounded(self):
+        """Test that the adjacency cache never holds more than its capacity"""
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.disk_graph.get_neighbors(node_id)
+        self.assertEqual(len(self.disk_graph.neighbor_cache), 2)
+    
+    def test_lru_eviction_order(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
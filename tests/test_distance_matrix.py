@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the many-to-many distance matrix
+"""
+import os
+import tempfile
+import unittest
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+
+try:
+    import numpy
+    from src.distance_matrix import distance_matrix
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestDistanceMatrix(unittest.TestCase):
+    """Test cases for distance_matrix"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # Create a simple graph:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   |                  |
+        #   v                  v
+        #   D --4-----------> E
+        
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+    
+    def test_matches_dijkstra(self):
+        """Test every entry against a separate Dijkstra search"""
+        node_ids = ["A", "B", "C", "D", "E"]
+        matrix = distance_matrix(self.graph, node_ids, node_ids)
+        
+        self.assertEqual(matrix.shape, (5, 5))
+        for i, source in enumerate(node_ids):
+            for j, target in enumerate(node_ids):
+                _, _, cost = dijkstra_pathfind(self.graph, source, target)
+                self.assertEqual(matrix[i, j], cost)
+    
+    def test_unreachable_is_inf(self):
+        """Test that unreachable pairs are infinite"""
+        matrix = distance_matrix(self.graph, ["E"], ["A", "E"])
+        self.assertEqual(matrix[0, 0], float('inf'))
+        self.assertEqual(matrix[0, 1], 0.0)
+    
+    def test_repeated_targets(self):
+        """Test that a city listed twice fills both columns"""
+        matrix = distance_matrix(self.graph, ["A"], ["E", "C", "E"])
+        self.assertEqual(list(matrix[0]), [7.0, 15.0, 7.0])
+    
+    def test_memory_mapped_output(self):
+        """Test writing the matrix straight to a .npy file"""
+        with tempfile.TemporaryDirectory() as directory:
+            out_path = os.path.join(directory, "costs.npy")
+            distance_matrix(self.graph, ["A", "B"], ["C", "E"], out_path=out_path)
+            
+            loaded = numpy.load(out_path)
+            self.assertEqual(loaded.tolist(), [[15.0, 7.0], [10.0, 12.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
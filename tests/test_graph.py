@@ -3,7 +3,7 @@
 Unit tests for the Graph class
 """
 import unittest
-from src.graph import Graph
+from src.graph import Graph, NodeRecord
 
 
 class TestGraph(unittest.TestCase):
@@ -143,6 +143,63 @@ class TestGraph(unittest.TestCase):
         neighbors = self.graph.get_neighbors("vancouver")
         self.assertEqual(neighbors[0][1], 0.0)
 
+    def test_edge_attributes_are_columns(self):
+        """Test that extra edge attributes are stored column-wise by edge number"""
+        self.graph.add_node("vancouver", "Vancouver")
+        self.graph.add_node("toronto", "Toronto")
+        self.graph.add_node("calgary", "Calgary")
+        
+        self.graph.add_edge("vancouver", "toronto", 350.0, duration=4.5)
+        self.graph.add_edge("vancouver", "calgary", 150.0, duration=1.5, distance=700.0)
+        
+        self.assertEqual(list(self.graph.attributes["weight"]), [350.0, 150.0])
+        self.assertEqual(list(self.graph.attributes["duration"]), [4.5, 1.5])
+        # The first edge was added before 'distance' existed
+        self.assertEqual(list(self.graph.attributes["distance"]), [float('inf'), 700.0])
+        self.assertEqual(self.graph.edge_ids["vancouver"], [0, 1])
+    
+    def test_get_neighbors_with_weight_selector(self):
+        """Test selecting an attribute or a linear combination as the cost"""
+        self.graph.add_node("vancouver", "Vancouver")
+        self.graph.add_node("toronto", "Toronto")
+        self.graph.add_node("calgary", "Calgary")
+        
+        self.graph.add_edge("vancouver", "toronto", 350.0, duration=4.5)
+        self.graph.add_edge("vancouver", "calgary", 150.0, duration=1.5)
+        
+        self.assertEqual(self.graph.get_neighbors("vancouver", weight="duration"),
+                         [("toronto", 4.5), ("calgary", 1.5)])
+        self.assertEqual(self.graph.get_neighbors("vancouver", weight={"weight": 1.0, "duration": 100.0}),
+                         [("toronto", 800.0), ("calgary", 300.0)])
+        # The default stays the plain weight
+        self.assertEqual(self.graph.get_neighbors("vancouver"), [("toronto", 350.0), ("calgary", 150.0)])
+    
+    def test_get_neighbors_skips_missing_attribute(self):
+        """Test that flights without the selected attribute are left out"""
+        self.graph.add_node("vancouver", "Vancouver")
+        self.graph.add_node("toronto", "Toronto")
+        self.graph.add_node("calgary", "Calgary")
+        
+        self.graph.add_edge("vancouver", "toronto", 350.0)
+        self.graph.add_edge("vancouver", "calgary", 150.0, duration=1.5)
+        
+        self.assertEqual(self.graph.get_neighbors("vancouver", weight="duration"), [("calgary", 1.5)])
+    
+    def test_node_records(self):
+        """Test that cities are compact records with shared (interned) names"""
+        self.graph.add_node("vancouver", "".join(["Van", "couver"]))
+        self.graph.add_node("yvr", "".join(["Vanc", "ouver"]))
+        
+        record = self.graph.nodes["vancouver"]
+        self.assertIsInstance(record, NodeRecord)
+        self.assertFalse(hasattr(record, "__dict__"))
+        # Both access styles work, and records compare equal to the dicts they replace
+        self.assertEqual(record.name, "Vancouver")
+        self.assertEqual(record["name"], "Vancouver")
+        self.assertEqual(record, {"name": "Vancouver"})
+        # Equal names built separately end up as one string object
+        self.assertIs(record.name, self.graph.nodes["yvr"].name)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
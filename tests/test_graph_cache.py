@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the cached graph snapshots
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.graph_cache import CACHE_SIZE, build_graph, load_or_build_graph, snapshot_name
+
+
+class TestGraphCache(unittest.TestCase):
+    """Test cases for building, saving and loading graph snapshots"""
+    
+    def setUp(self):
+        """Set up source data and a temporary cache directory for each test"""
+        self.cities = [("A", "City A"), ("B", "City B"), ("C", "City C")]
+        self.edges = [("A", "B", 5.0), ("B", "C", 10.0)]
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = self.directory.name
+    
+    def tearDown(self):
+        """Remove the temporary cache directory"""
+        self.directory.cleanup()
+    
+    def test_build_graph_is_bidirectional(self):
+        """Test that every route is added in both directions"""
+        graph = build_graph(self.cities, self.edges)
+        
+        self.assertEqual(len(graph.nodes), 3)
+        self.assertIn(("B", 5.0), graph.get_neighbors("A"))
+        self.assertIn(("A", 5.0), graph.get_neighbors("B"))
+    
+    def test_first_load_builds_then_caches(self):
+        """Test that the first start builds the graph and the second loads the snapshot"""
+        graph, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        
+        cached_graph, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertTrue(from_cache)
+        self.assertEqual(cached_graph.nodes, graph.nodes)
+        self.assertEqual(cached_graph.edges, graph.edges)
+    
+    def test_changed_data_is_not_loaded_from_old_snapshot(self):
+        """Test that editing the source data changes the snapshot key"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        changed_edges = self.edges + [("A", "C", 1.0)]
+        
+        self.assertNotEqual(snapshot_name(self.cities, self.edges), snapshot_name(self.cities, changed_edges))
+        graph, from_cache = load_or_build_graph(self.cities, changed_edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+        self.assertIn(("C", 1.0), graph.get_neighbors("A"))
+    
+    def test_corrupt_snapshot_is_rebuilt(self):
+        """Test that an unreadable snapshot is ignored and replaced"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        snapshot_name = os.listdir(self.cache_dir)[0]
+        with open(os.path.join(self.cache_dir, snapshot_name), 'wb') as snapshot:
+            snapshot.write(b"not a pickle")
+        
+        graph, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+        self.assertEqual(len(graph.nodes), 3)
+
+    
+    def test_snapshot_of_other_code_is_rebuilt(self):
+        """Test that snapshots failing to load with any exception are rebuilt"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        snapshot_name = os.listdir(self.cache_dir)[0]
+        with open(os.path.join(self.cache_dir, snapshot_name), 'wb') as snapshot:
+            # A pickle naming a module that doesn't exist raises ModuleNotFoundError
+            snapshot.write(b"cmissing_module\nGraph\n.")
+        
+        graph, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+        self.assertEqual(len(graph.nodes), 3)
+    
+    def test_changed_graph_code_is_rebuilt(self):
+        """Test that editing the Graph code rebuilds the snapshot without a version bump"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        with mock.patch("src.graph_cache.layout_stamp", return_value=[(0, 0)]):
+            _, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+    
+    def test_snapshot_name_collision_is_rebuilt(self):
+        """Test that a snapshot of other data under the same name is not loaded"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        changed_edges = self.edges + [("A", "C", 1.0)]
+        with mock.patch("src.graph_cache.snapshot_name", return_value=os.listdir(self.cache_dir)[0]):
+            graph, from_cache = load_or_build_graph(self.cities, changed_edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+        self.assertIn(("C", 1.0), graph.get_neighbors("A"))
+    
+    @unittest.skipUnless(hasattr(os, "getuid"), "file permissions are POSIX-only")
+    def test_snapshot_writable_by_others_is_not_loaded(self):
+        """Test that a snapshot others could have replaced is never unpickled"""
+        load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        os.chmod(os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0]), 0o666)
+        
+        _, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir, min_edges=0)
+        self.assertFalse(from_cache)
+    
+    def test_old_snapshots_are_pruned(self):
+        """Test that saving a snapshot keeps only the CACHE_SIZE newest ones"""
+        for i in range(CACHE_SIZE + 2):
+            load_or_build_graph(self.cities, self.edges + [("A", "C", float(i))],
+                                cache_dir=self.cache_dir, min_edges=0)
+        self.assertEqual(len(os.listdir(self.cache_dir)), CACHE_SIZE)
+    
+    def test_small_graph_is_built_without_cache(self):
+        """Test that graphs below min_edges are built directly and nothing is written"""
+        graph, from_cache = load_or_build_graph(self.cities, self.edges, cache_dir=self.cache_dir)
+        self.assertFalse(from_cache)
+        self.assertEqual(len(graph.nodes), 3)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for graph compression (dominated routes and degree-two chains)
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+from src.graph_compression import compress_graph
+
+
+class TestGraphCompression(unittest.TestCase):
+    """Test cases for compress_graph and CompressedGraph"""
+
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+
+        # Create a graph with a pass-through chain and a dominated route (all routes both ways):
+        #   A --1-- B --2-- C --3-- D
+        #   |                       |
+        #   +----------20-----------+   (dominated: A-B-C-D costs 6)
+        #   A --4-- E
+
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+
+        for from_node, to_node, cost in [("A", "B", 1.0), ("B", "C", 2.0), ("C", "D", 3.0),
+                                         ("A", "D", 20.0), ("A", "E", 4.0)]:
+            self.graph.add_edge(from_node, to_node, cost)
+            self.graph.add_edge(to_node, from_node, cost)
+
+    def test_chain_is_collapsed(self):
+        """Test that the pass-through cities become one route with the summed cost"""
+        compressed = compress_graph(self.graph, keep=["A", "D", "E"])
+
+        self.assertEqual(sorted(compressed.graph.nodes), ["A", "D", "E"])
+        self.assertEqual(compressed.graph.get_neighbors("A"), [("D", 6.0), ("E", 4.0)])
+        self.assertEqual(compressed.expansions[("A", "D")], ("B", "C"))
+        self.assertEqual(compressed.expansions[("D", "A")], ("C", "B"))
+        self.assertEqual(compressed.node_counts, (5, 3))
+        self.assertEqual(compressed.edge_counts, (10, 4))
+
+    def test_dominated_route_is_removed(self):
+        """Test that a route with a cheaper two-stop alternative is dropped"""
+        graph = Graph()
+        for node_id in ["A", "B", "C"]:
+            graph.add_node(node_id, f"City {node_id}")
+        graph.add_edge("A", "B", 1.0)
+        graph.add_edge("B", "C", 1.0)
+        graph.add_edge("A", "C", 5.0)
+        graph.add_edge("A", "C", 7.0)
+
+        compressed = compress_graph(graph, contract_chains=False)
+        self.assertEqual(compressed.graph.get_neighbors("A"), [("B", 1.0)])
+
+        # An equally cheap direct route stays
+        graph.add_edge("A", "C", 2.0)
+        compressed = compress_graph(graph, contract_chains=False)
+        self.assertEqual(compressed.graph.get_neighbors("A"), [("B", 1.0), ("C", 2.0)])
+
+    def test_kept_cities_stay(self):
+        """Test that cities in keep are never contracted"""
+        compressed = compress_graph(self.graph, keep=["A", "B", "D", "E"])
+
+        self.assertIn("B", compressed.graph.nodes)
+        self.assertNotIn("C", compressed.graph.nodes)
+
+    def test_expand_route(self):
+        """Test that a route found on the reduced graph expands to the original route"""
+        compressed = compress_graph(self.graph, keep=["D", "E"])
+        _, path, cost = dijkstra_pathfind(compressed.graph, "E", "D")
+
+        self.assertEqual(cost, 10.0)
+        self.assertEqual(compressed.expand(path), ["City E", "City A", "City B", "City C", "City D"])
+        self.assertEqual(compressed.expand([]), [])
+
+    def test_report(self):
+        """Test the shrink summary"""
+        compressed = compress_graph(self.graph, keep=["A", "D", "E"])
+
+        self.assertEqual(compressed.report(), "Cities: 5 -> 3 (-40.0%), routes: 10 -> 4 (-60.0%)")
+
+    def test_matches_original_costs(self):
+        """Test that cheapest costs and expanded routes match the original on random networks"""
+        for seed in range(3):
+            rng = random.Random(seed)
+            graph = Graph()
+            for i in range(40):
+                graph.add_node(f"c{i}", f"City {i}")
+            # A sparse ring with spurs gives chains; random extra routes give dominated ones
+            for i in range(40):
+                graph.add_edge(f"c{i}", f"c{(i + 1) % 40}", float(rng.randint(1, 20)))
+                graph.add_edge(f"c{(i + 1) % 40}", f"c{i}", float(rng.randint(1, 20)))
+            for _ in range(15):
+                graph.add_edge(f"c{rng.randrange(40)}", f"c{rng.randrange(40)}", float(rng.randint(1, 60)))
+
+            keep = [f"c{i}" for i in range(0, 40, 7)]
+            compressed = compress_graph(graph, keep=keep)
+            self.assertLess(compressed.node_counts[1], 40)
+
+            ids = {name: node_id for node_id, name in compressed.names.items()}
+            for start in keep:
+                for goal in keep:
+                    if start == goal:
+                        continue
+                    _, _, cost = dijkstra_pathfind(graph, start, goal)
+                    _, path, reduced_cost = dijkstra_pathfind(compressed.graph, start, goal)
+                    self.assertEqual(reduced_cost, cost)
+
+                    # The expanded route exists in the original graph and has the same cost
+                    route = compressed.expand(path)
+                    route_cost = 0.0
+                    for from_name, to_name in zip(route, route[1:]):
+                        route_cost += min(c for n, c in graph.get_neighbors(ids[from_name]) if n == ids[to_name])
+                    self.assertEqual(route_cost, cost)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Unit tests for copy-on-write graph snapshots and concurrent reads during updates
+"""
+import pickle
+import threading
+import unittest
+from unittest import mock
+from src.graph import REACHABILITY_REPLAY_LIMIT, Graph
+from src.dijkstra import dijkstra_pathfind, dijkstra_steps
+
+
+class TestGraphSnapshots(unittest.TestCase):
+    """Test cases for Graph.snapshot, Graph.batch and concurrent access"""
+
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+
+        # A chain of cities, each one flight from the next:
+        #   c0 --1--> c1 --1--> c2 --> ... --> c19
+
+        for i in range(20):
+            self.graph.add_node(f"c{i}", f"City {i}")
+        for i in range(19):
+            self.graph.add_edge(f"c{i}", f"c{i + 1}", 1.0)
+
+    def test_snapshot_is_unaffected_by_later_updates(self):
+        """A snapshot keeps the version it was taken from"""
+        snapshot = self.graph.snapshot()
+        self.graph.add_edge("c0", "c19", 5.0)
+        self.graph.add_node("c20", "City 20")
+
+        self.assertEqual(snapshot.get_neighbors("c0"), [("c1", 1.0)])
+        self.assertNotIn("c20", snapshot.nodes)
+        self.assertEqual(self.graph.get_neighbors("c0"), [("c1", 1.0), ("c19", 5.0)])
+        self.assertGreater(self.graph.snapshot().version, snapshot.version)
+
+    def test_unchanged_cities_share_adjacency_lists(self):
+        """Publishing a version only copies the changed cities' edge lists"""
+        before = self.graph.snapshot()
+        self.graph.add_edge("c0", "c19", 5.0)
+        after = self.graph.snapshot()
+
+        self.assertIs(before.edges["c5"], after.edges["c5"])
+        self.assertIsNot(before.edges["c0"], after.edges["c0"])
+
+    def test_batch_publishes_once(self):
+        """Updates inside batch() become visible together when the block ends"""
+        version = self.graph.snapshot().version
+        with self.graph.batch():
+            self.graph.add_edge("c19", "c0", 1.0)
+            self.graph.add_edge("c18", "c0", 1.0)
+            # Not published yet
+            self.assertEqual(self.graph.get_neighbors("c19"), [])
+
+        self.assertEqual(self.graph.snapshot().version, version + 1)
+        self.assertEqual(self.graph.get_neighbors("c19"), [("c0", 1.0)])
+        self.assertTrue(self.graph.can_reach("c19", "c5"))
+
+    def test_single_updates_publish_once_per_read(self):
+        """Updates outside batch() are published together when the graph is next read"""
+        version = self.graph.snapshot().version
+        for i in range(19):
+            self.graph.add_edge(f"c{i + 1}", f"c{i}", 1.0)
+        self.graph.add_node("c20", "City 20")
+
+        snapshot = self.graph.snapshot()
+        self.assertEqual(snapshot.version, version + 1)
+        self.assertEqual(snapshot.get_neighbors("c19"), [("c18", 1.0)])
+        self.assertIn("c20", self.graph.nodes)
+        # Reading again publishes nothing new
+        self.assertIs(self.graph.snapshot(), snapshot)
+
+    def test_pending_updates_survive_failed_batch(self):
+        """A failed batch doesn't discard single updates made before it"""
+        self.graph.add_edge("c19", "c0", 1.0)
+        with self.assertRaises(KeyError):
+            with self.graph.batch():
+                self.graph.add_edge("unknown", "c0", 1.0)
+
+        self.assertEqual(self.graph.get_neighbors("c19"), [("c0", 1.0)])
+
+    def test_failed_batch_publishes_nothing(self):
+        """An exception inside batch() discards its updates"""
+        snapshot = self.graph.snapshot()
+        with self.assertRaises(KeyError):
+            with self.graph.batch():
+                self.graph.add_edge("c19", "c0", 1.0)
+                self.graph.add_edge("unknown", "c0", 1.0)
+
+        self.assertIs(self.graph.snapshot(), snapshot)
+        self.assertEqual(self.graph.get_neighbors("c19"), [])
+        self.assertEqual(len(self.graph.attributes["weight"]), 19)
+
+    def test_views_are_read_only(self):
+        """nodes and edges can't be changed behind the graph's back"""
+        with self.assertRaises(TypeError):
+            self.graph.nodes["x"] = {"name": "X"}
+        with self.assertRaises(TypeError):
+            self.graph.edges["c0"] = []
+
+    def test_reachability_index_carries_over(self):
+        """can_reach stays correct across versions once its index is built"""
+        self.assertFalse(self.graph.can_reach("c19", "c0"))
+        old = self.graph.snapshot()
+        self.graph.add_edge("c19", "c0", 1.0)
+
+        self.assertTrue(self.graph.can_reach("c19", "c0"))
+        self.assertFalse(old.can_reach("c19", "c0"))
+
+    def test_large_update_rebuilds_reachability_index(self):
+        """Many additions at once drop the carried index instead of replaying them one by one"""
+        self.assertFalse(self.graph.can_reach("c19", "c0"))
+        with self.graph.batch():
+            for i in range(REACHABILITY_REPLAY_LIMIT + 1):
+                self.graph.add_node(f"x{i}", f"Extra {i}")
+            self.graph.add_edge("c19", "x0", 1.0)
+
+        self.assertIsNone(self.graph.snapshot()._reachability)
+        self.assertTrue(self.graph.can_reach("c0", "x0"))
+        self.assertFalse(self.graph.can_reach("x0", "c0"))
+
+    def test_route_added_before_its_city(self):
+        """A route to a city added afterwards publishes cleanly once the index exists"""
+        self.assertTrue(self.graph.can_reach("c0", "c19"))
+        self.graph.add_edge("c19", "x", 1.0)
+        self.graph.add_node("x", "X")
+
+        self.assertEqual(len(self.graph.nodes), 21)
+        self.assertTrue(self.graph.can_reach("c0", "x"))
+
+    def test_failing_index_update_still_publishes(self):
+        """An error while updating the carried index drops the index, not the updates"""
+        self.assertTrue(self.graph.can_reach("c0", "c19"))
+        with mock.patch("src.reachability.ReachabilityIndex.add_edge", side_effect=RuntimeError):
+            self.graph.add_edge("c19", "c0", 1.0)
+            self.assertEqual(self.graph.get_neighbors("c19"), [("c0", 1.0)])
+
+        self.assertTrue(self.graph.can_reach("c19", "c0"))
+
+    def test_failed_publish_keeps_previous_version(self):
+        """If publishing pending updates fails, reads after it see the previous version"""
+        snapshot = self.graph.snapshot()
+        self.graph.add_edge("c19", "c0", 1.0)
+        with mock.patch("src.graph.GraphSnapshot.__init__", side_effect=MemoryError):
+            with self.assertRaises(MemoryError):
+                self.graph.snapshot()
+
+        self.assertIs(self.graph.snapshot(), snapshot)
+        self.assertEqual(len(self.graph.attributes["weight"]), 19)
+        self.graph.add_edge("c19", "c0", 1.0)
+        self.assertEqual(self.graph.get_neighbors("c19"), [("c0", 1.0)])
+
+    def test_steps_search_a_fixed_version(self):
+        """A step-by-step search is not disturbed by updates between steps"""
+        steps = dijkstra_steps(self.graph, "c0", "c19")
+        next(steps)
+        # A shortcut added mid-search belongs to the next version, not this search
+        self.graph.add_edge("c1", "c19", 0.5)
+        for _ in steps:
+            pass
+
+        _, path, cost = dijkstra_pathfind(self.graph, "c0", "c19")
+        self.assertEqual(cost, 1.5)
+        self.assertEqual(path, ["City 0", "City 1", "City 19"])
+
+    def test_pickle_round_trip(self):
+        """A graph can be pickled (the write lock is recreated)"""
+        copy = pickle.loads(pickle.dumps(self.graph))
+        self.assertEqual(copy.get_neighbors("c0"), [("c1", 1.0)])
+        copy.add_edge("c19", "c0", 1.0)
+        self.assertEqual(self.graph.get_neighbors("c19"), [])
+
+    def test_concurrent_reads_during_updates(self):
+        """Readers running Dijkstra never see a half-applied update while writers add routes"""
+        writers, edges_per_writer = 4, 200
+        errors = []
+        done = threading.Event()
+
+        def write(writer):
+            try:
+                for i in range(edges_per_writer):
+                    # Shortcuts back to c0 keep the chain's forward costs unchanged
+                    self.graph.add_edge(f"c{(writer * 7 + i) % 20}", "c0", 100.0, duration=float(i))
+            except Exception as error:
+                errors.append(error)
+
+        def read():
+            try:
+                while not done.is_set():
+                    snapshot = self.graph.snapshot()
+                    # Every edge list matches its edge numbers, and every number is in the columns
+                    for node_id, neighbors in snapshot.edges.items():
+                        edge_ids = snapshot.edge_ids[node_id]
+                        assert len(neighbors) == len(edge_ids)
+                        assert all(edge_id < len(snapshot.attributes["weight"]) for edge_id in edge_ids)
+                    _, path, cost = dijkstra_pathfind(self.graph, "c0", "c19")
+                    assert cost == 19.0 and len(path) == 20, (path, cost)
+            except Exception as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        writer_threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+        for thread in readers + writer_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        edge_count = sum(len(neighbors) for neighbors in self.graph.edges.values())
+        self.assertEqual(edge_count, 19 + writers * edges_per_writer)
+        self.assertEqual(len(self.graph.attributes["duration"]), 19 + writers * edges_per_writer)
+
+
+if __name__ == '__main__':
+    unittest.main()
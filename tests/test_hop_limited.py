@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hop-limited cheapest routes
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.dfs import dfs_pathfind
+
+try:
+    import numpy
+    from src.graph_arrays import GraphArrays
+    from src.hop_limited import hop_limited_pathfind, hop_limited_routes
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestHopLimited(unittest.TestCase):
+    """Test cases for hop_limited_pathfind and hop_limited_routes"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # Cheapest route to E has 3 flights, but a pricier one has only 1:
+        #   A --1--> B --1--> C --1--> E
+        #   A --10--------------------> E
+        #   A --2--> D --2--> E
+        
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 1.0)
+        self.graph.add_edge("B", "C", 1.0)
+        self.graph.add_edge("C", "E", 1.0)
+        self.graph.add_edge("A", "E", 10.0)
+        self.graph.add_edge("A", "D", 2.0)
+        self.graph.add_edge("D", "E", 2.0)
+    
+    def test_direct_only(self):
+        """Test that max_stops=0 only allows direct flights"""
+        path, cost = hop_limited_pathfind(self.graph, "A", "E", max_stops=0)
+        self.assertEqual(path, ["City A", "City E"])
+        self.assertEqual(cost, 10.0)
+    
+    def test_one_connection(self):
+        """Test the cheapest route with at most one connection"""
+        path, cost = hop_limited_pathfind(self.graph, "A", "E", max_stops=1)
+        self.assertEqual(path, ["City A", "City D", "City E"])
+        self.assertEqual(cost, 4.0)
+    
+    def test_enough_connections_gives_cheapest(self):
+        """Test that a generous limit finds the overall cheapest route"""
+        path, cost = hop_limited_pathfind(self.graph, "A", "E", max_stops=5)
+        self.assertEqual(path, ["City A", "City B", "City C", "City E"])
+        self.assertEqual(cost, 3.0)
+    
+    def test_no_route_within_limit(self):
+        """Test a destination that needs more connections than allowed"""
+        path, cost = hop_limited_pathfind(self.graph, "A", "C", max_stops=0)
+        self.assertEqual(path, [])
+        self.assertEqual(cost, float('inf'))
+    
+    def test_all_destinations_in_one_pass(self):
+        """Test that one call answers every reachable destination"""
+        routes = hop_limited_routes(self.graph, "A", max_stops=1)
+        
+        self.assertEqual(routes["A"], (["City A"], 0.0))
+        self.assertEqual(routes["C"], (["City A", "City B", "City C"], 2.0))
+        self.assertEqual(routes["E"][1], 4.0)
+    
+    def test_edge_arrays_are_built_once_per_version(self):
+        """Test that repeated queries reuse the edge arrays until the graph changes"""
+        arrays = GraphArrays.from_graph(self.graph)
+        hop_limited_pathfind(self.graph, "A", "E", 1)
+        self.assertIs(GraphArrays.from_graph(self.graph), arrays)
+
+        self.graph.add_edge("E", "A", 1.0)
+        self.assertIsNot(GraphArrays.from_graph(self.graph), arrays)
+        self.assertEqual(GraphArrays.from_graph(self.graph).edge_count, arrays.edge_count + 1)
+
+    def test_matches_filtered_dfs(self):
+        """Test against enumerating every route with DFS and filtering by stops"""
+        rng = random.Random(3)
+        graph = Graph()
+        node_ids = [str(i) for i in range(8)]
+        for node_id in node_ids:
+            graph.add_node(node_id, f"City {node_id}")
+        for _ in range(20):
+            from_node, to_node = rng.sample(node_ids, 2)
+            graph.add_edge(from_node, to_node, float(rng.randint(1, 20)))
+        
+        for max_stops in range(4):
+            routes = hop_limited_routes(graph, "0", max_stops)
+            for goal in node_ids[1:]:
+                _, all_routes = dfs_pathfind(graph, "0", goal)
+                allowed = [cost for path, cost in all_routes if len(path) - 2 <= max_stops]
+                expected = min(allowed, default=float('inf'))
+                path, cost = routes.get(goal, ([], float('inf')))
+                self.assertEqual(cost, expected)
+                if path:
+                    self.assertLessEqual(len(path) - 2, max_stops)
+
+
+if __name__ == "__main__":
+    unittest.main()
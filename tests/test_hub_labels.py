@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the two-hop hub label index
+"""
+import os
+import random
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+from src.hub_labels import HubLabels
+
+
+class TestHubLabels(unittest.TestCase):
+    """Test cases for HubLabels"""
+
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+
+        # Create a simple graph:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   |                  |
+        #   v                  v
+        #   D --4-----------> E
+
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+
+    def random_graph(self, seed, count=40, routes=120):
+        rng = random.Random(seed)
+        graph = Graph()
+        for i in range(count):
+            graph.add_node(f"c{i}", f"City {i}")
+        for _ in range(routes):
+            graph.add_edge(f"c{rng.randrange(count)}", f"c{rng.randrange(count)}", float(rng.randint(1, 50)))
+        return graph
+
+    def test_costs(self):
+        """Test query costs on the simple graph"""
+        labels = HubLabels.build(self.graph)
+
+        self.assertEqual(labels.cost("A", "E"), 7.0)
+        self.assertEqual(labels.cost("A", "C"), 15.0)
+        self.assertEqual(labels.cost("C", "C"), 0.0)
+        self.assertEqual(labels.cost("E", "A"), float('inf'))
+
+    def test_pathfind(self):
+        """Test route unpacking"""
+        labels = HubLabels.build(self.graph, with_paths=True)
+
+        self.assertEqual(labels.pathfind("A", "E"), (["City A", "City D", "City E"], 7.0))
+        self.assertEqual(labels.pathfind("B", "B"), (["City B"], 0.0))
+        self.assertEqual(labels.pathfind("E", "A"), ([], float('inf')))
+
+    def test_pathfind_needs_paths(self):
+        """Test that unpacking without path data is refused"""
+        labels = HubLabels.build(self.graph)
+
+        with self.assertRaises(ValueError):
+            labels.pathfind("A", "E")
+
+    def test_matches_dijkstra(self):
+        """Test every pair against dijkstra_pathfind on random networks"""
+        for seed in range(3):
+            graph = self.random_graph(seed)
+            labels = HubLabels.build(graph, with_paths=True)
+            for start in graph.nodes:
+                for goal in graph.nodes:
+                    _, path, cost = dijkstra_pathfind(graph, start, goal)
+                    if start == goal:
+                        cost = 0.0
+                    self.assertEqual(labels.cost(start, goal), cost)
+
+                    route, route_cost = labels.pathfind(start, goal)
+                    self.assertEqual(route_cost, cost)
+                    if route:
+                        self.assertEqual(route[0], graph.nodes[start].name)
+                        self.assertEqual(route[-1], graph.nodes[goal].name)
+
+    def test_labels_are_pruned(self):
+        """Test that pruning keeps labels well below one entry per pair"""
+        graph = self.random_graph(1, count=60, routes=240)
+        labels = HubLabels.build(graph)
+
+        forward, backward = labels.label_sizes()
+        self.assertLess(forward, 60 * 60)
+        self.assertLess(backward, 60 * 60)
+
+    def test_batched_parallel_build(self):
+        """Test that batched searches on an executor give the same costs"""
+        graph = self.random_graph(2)
+        serial = HubLabels.build(graph)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parallel = HubLabels.build(graph, batch_size=8, executor=executor)
+
+        for start in graph.nodes:
+            for goal in graph.nodes:
+                self.assertEqual(parallel.cost(start, goal), serial.cost(start, goal))
+
+    def test_save_and_load(self):
+        """Test that the binary file round-trips"""
+        labels = HubLabels.build(self.graph, with_paths=True)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hubs.bin")
+            labels.save(path)
+            loaded = HubLabels.load(path)
+
+        self.assertEqual(loaded.node_ids, labels.node_ids)
+        self.assertEqual(loaded.names, labels.names)
+        self.assertEqual(loaded.label_sizes(), labels.label_sizes())
+        self.assertEqual(loaded.pathfind("A", "E"), (["City A", "City D", "City E"], 7.0))
+
+    def test_load_rejects_other_files(self):
+        """Test that a file of another format is rejected"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "other.bin")
+            with open(path, 'wb') as file:
+                file.write(b'\0' * 32)
+            with self.assertRaises(ValueError):
+                HubLabels.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
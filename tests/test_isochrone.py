@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for budget isochrone queries
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+from src.isochrone import budget_routes, multi_source_budget_routes
+
+
+class TestIsochrone(unittest.TestCase):
+    """Test cases for budget_routes and multi_source_budget_routes"""
+
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+
+        # Create a simple graph:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   |                  |
+        #   v                  v
+        #   D --4-----------> E
+
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+
+    def test_costs_within_budget(self):
+        """Test that only cities within the budget are returned, with cheapest costs"""
+        routes = budget_routes(self.graph, "A", 7.0)
+
+        self.assertEqual(routes, {"A": (None, 0), "D": (None, 3.0), "B": (None, 5.0), "E": (None, 7.0)})
+
+    def test_routes(self):
+        """Test that routes are returned on request"""
+        routes = budget_routes(self.graph, "A", 20.0, with_routes=True)
+
+        self.assertEqual(routes["E"], (["City A", "City D", "City E"], 7.0))
+        self.assertEqual(routes["C"], (["City A", "City B", "City C"], 15.0))
+        self.assertEqual(routes["A"], (["City A"], 0))
+
+    def test_search_stays_inside_budget(self):
+        """Test that cities beyond the budget are never expanded"""
+        expanded = []
+        original = self.graph.snapshot().get_neighbors
+
+        class CountingSnapshot:
+            nodes = self.graph.nodes
+
+            def snapshot(self):
+                return self
+
+            def get_neighbors(self, node_id):
+                expanded.append(node_id)
+                return original(node_id)
+
+        budget_routes(CountingSnapshot(), "A", 4.0)
+        self.assertEqual(sorted(expanded), ["A", "D"])
+
+    def test_multi_source(self):
+        """Test that each city gets the cost from its cheapest home airport"""
+        routes = multi_source_budget_routes(self.graph, ["A", "C"], 5.0, with_routes=True)
+
+        self.assertEqual(routes["E"], (["City C", "City E"], 2.0))
+        self.assertEqual(routes["D"], (["City A", "City D"], 3.0))
+        self.assertEqual(routes["C"], (["City C"], 0))
+        self.assertNotIn("Z", routes)
+
+    def test_matches_dijkstra(self):
+        """Test that costs match dijkstra_pathfind on a random network"""
+        rng = random.Random(5)
+        graph = Graph()
+        for i in range(30):
+            graph.add_node(f"c{i}", f"City {i}")
+        for _ in range(90):
+            graph.add_edge(f"c{rng.randrange(30)}", f"c{rng.randrange(30)}", float(rng.randint(1, 50)))
+
+        budget = 60.0
+        routes = budget_routes(graph, "c0", budget, with_routes=True)
+        for node_id in graph.nodes:
+            _, path, cost = dijkstra_pathfind(graph, "c0", node_id)
+            if cost <= budget:
+                self.assertEqual(routes[node_id][1], cost)
+                self.assertEqual(len(routes[node_id][0]), len(path) if node_id != "c0" else 1)
+            else:
+                self.assertNotIn(node_id, routes)
+
+
+if __name__ == "__main__":
+    unittest.main()
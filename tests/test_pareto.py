@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Pareto-optimal (cost, stops) route search
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.bfs import bfs_pathfind
+from src.dfs import dfs_pathfind
+from src.dijkstra import dijkstra_pathfind
+from src.pareto import pareto_pathfind
+
+
+class TestPareto(unittest.TestCase):
+    """Test cases for pareto_pathfind"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # Three routes from A to E with different trade-offs:
+        #   A --1--> B --1--> C --1--> E   (cost 3, 3 hops)
+        #   A --2--> D --2--> E            (cost 4, 2 hops)
+        #   A --10--> E                    (cost 10, 1 hop)
+        #   A --3--> F --3--> E            (cost 6, 2 hops - dominated by A -> D -> E)
+        
+        for node_id in ["A", "B", "C", "D", "E", "F"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 1.0)
+        self.graph.add_edge("B", "C", 1.0)
+        self.graph.add_edge("C", "E", 1.0)
+        self.graph.add_edge("A", "D", 2.0)
+        self.graph.add_edge("D", "E", 2.0)
+        self.graph.add_edge("A", "E", 10.0)
+        self.graph.add_edge("A", "F", 3.0)
+        self.graph.add_edge("F", "E", 3.0)
+    
+    def test_full_frontier(self):
+        """Test that every trade-off is returned and dominated routes are not"""
+        routes = pareto_pathfind(self.graph, "A", "E")
+        
+        self.assertEqual(routes, [
+            (["City A", "City B", "City C", "City E"], 3.0),
+            (["City A", "City D", "City E"], 4.0),
+            (["City A", "City E"], 10.0),
+        ])
+    
+    def test_ends_match_dijkstra_and_bfs(self):
+        """Test that the frontier ends agree with Dijkstra (cost) and BFS (hops)"""
+        routes = pareto_pathfind(self.graph, "A", "E")
+        _, dijkstra_path, dijkstra_cost = dijkstra_pathfind(self.graph, "A", "E")
+        _, bfs_path, _ = bfs_pathfind(self.graph, "A", "E")
+        
+        self.assertEqual(routes[0][1], dijkstra_cost)
+        self.assertEqual(len(routes[-1][0]), len(bfs_path))
+    
+    def test_same_start_and_goal(self):
+        """Test when start and goal are the same"""
+        self.assertEqual(pareto_pathfind(self.graph, "A", "A"), [(["City A"], 0)])
+    
+    def test_no_path(self):
+        """Test that an unreachable goal gives no routes"""
+        self.assertEqual(pareto_pathfind(self.graph, "E", "A"), [])
+    
+    def test_matches_brute_force(self):
+        """Test against the Pareto frontier of every route enumerated by DFS"""
+        rng = random.Random(11)
+        graph = Graph()
+        node_ids = [str(i) for i in range(8)]
+        for node_id in node_ids:
+            graph.add_node(node_id, f"City {node_id}")
+        for _ in range(22):
+            from_node, to_node = rng.sample(node_ids, 2)
+            graph.add_edge(from_node, to_node, float(rng.randint(1, 9)))
+        
+        for goal in node_ids[1:]:
+            _, all_routes = dfs_pathfind(graph, "0", goal)
+            points = {(len(path) - 1, cost) for path, cost in all_routes}
+            expected = sorted((cost, hops) for hops, cost in points
+                              if not any(h <= hops and c <= cost and (h, c) != (hops, cost) for h, c in points))
+            
+            routes = pareto_pathfind(graph, "0", goal)
+            self.assertEqual([(cost, len(path) - 1) for path, cost in routes], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
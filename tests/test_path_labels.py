@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Unit tests for parent-pointer path labels
+"""
+import unittest
+from src.path_labels import PathLabels
+
+
+class TestPathLabels(unittest.TestCase):
+    """Test cases for PathLabels"""
+    
+    def setUp(self):
+        """Set up a small search tree for each test"""
+        # Label numbers in brackets:
+        #   vancouver[0] --> seoul[1] --> beijing[2]
+        #                \-> beijing[3]
+        self.labels = PathLabels("vancouver")
+        self.seoul = self.labels.add("seoul", 0)
+        self.beijing_via_seoul = self.labels.add("beijing", self.seoul)
+        self.beijing_direct = self.labels.add("beijing", 0)
+    
+    def test_labels_are_consecutive(self):
+        """Test that labels number the entries in the order they were added"""
+        self.assertEqual((self.seoul, self.beijing_via_seoul, self.beijing_direct), (1, 2, 3))
+    
+    def test_path(self):
+        """Test rebuilding paths from the start to a label"""
+        self.assertEqual(self.labels.path(0), ["vancouver"])
+        self.assertEqual(self.labels.path(self.beijing_via_seoul), ["vancouver", "seoul", "beijing"])
+        self.assertEqual(self.labels.path(self.beijing_direct), ["vancouver", "beijing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
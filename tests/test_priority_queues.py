@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pluggable priority queues used by Dijkstra
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.dijkstra import dijkstra_pathfind
+from src.priority_queues import BinaryHeapQueue, BucketQueue, RadixHeap, make_queue
+
+
+class TestPriorityQueues(unittest.TestCase):
+    """Test cases for BinaryHeapQueue, BucketQueue and RadixHeap"""
+
+    def test_pop_order(self):
+        """Test that every queue pops in non-decreasing priority order"""
+        rng = random.Random(7)
+        for queue_class in (BinaryHeapQueue, BucketQueue, RadixHeap):
+            queue = queue_class()
+            popped = []
+            # Interleave pushes and pops like Dijkstra: pushes never go below the last pop
+            last = 0
+            for _ in range(500):
+                for _ in range(rng.randint(0, 3)):
+                    queue.push(last + rng.randint(0, 2000), "x")
+                if queue:
+                    last, _ = queue.pop()
+                    popped.append(last)
+            while queue:
+                popped.append(queue.pop()[0])
+            self.assertEqual(popped, sorted(popped), queue_class.__name__)
+            self.assertEqual(len(queue), 0)
+
+    def test_iteration_lists_queued_entries(self):
+        """Test that iterating a queue shows every queued (priority, item) pair"""
+        for queue_class in (BinaryHeapQueue, BucketQueue, RadixHeap):
+            queue = queue_class()
+            for priority, item in [(5, "a"), (1, "b"), (5, "c")]:
+                queue.push(priority, item)
+            self.assertEqual(sorted(queue), [(1, "b"), (5, "a"), (5, "c")])
+
+    def test_equal_costs_never_compare_items(self):
+        """Test that ties are popped without comparing the (unorderable) items"""
+        for queue_class in (BinaryHeapQueue, BucketQueue, RadixHeap):
+            queue = queue_class()
+            for number, priority in enumerate([3, 7, 7, 7, 12, 12]):
+                queue.push(priority, {"city": number})
+            popped = [queue.pop()[0] for _ in range(6)]
+            self.assertEqual(popped, [3, 7, 7, 7, 12, 12], queue_class.__name__)
+
+    def test_integer_queues_reject_fractional_and_decreasing_costs(self):
+        """Test that bucket queues refuse costs they can't index"""
+        for queue_class in (BucketQueue, RadixHeap):
+            queue = queue_class()
+            with self.assertRaises(ValueError):
+                queue.push(1.5, "x")
+            queue.push(10.0, "x")
+            queue.pop()
+            with self.assertRaises(ValueError):
+                queue.push(9, "y")
+
+    def test_make_queue(self):
+        """Test selecting a queue by name"""
+        self.assertIsInstance(make_queue(), BinaryHeapQueue)
+        self.assertIsInstance(make_queue("bucket"), BucketQueue)
+        self.assertIsInstance(make_queue(RadixHeap), RadixHeap)
+        with self.assertRaises(ValueError):
+            make_queue("fibonacci")
+
+    def test_dijkstra_costs_match_for_every_queue(self):
+        """Test that Dijkstra finds the same cheapest costs with every queue"""
+        rng = random.Random(3)
+        graph = Graph()
+        for i in range(40):
+            graph.add_node(f"c{i}", f"City {i}")
+        for _ in range(150):
+            graph.add_edge(f"c{rng.randrange(40)}", f"c{rng.randrange(40)}", float(rng.randint(1, 900)))
+
+        for _ in range(30):
+            start, goal = f"c{rng.randrange(40)}", f"c{rng.randrange(40)}"
+            _, _, expected = dijkstra_pathfind(graph, start, goal)
+            for name in ("bucket", "radix"):
+                _, path, cost = dijkstra_pathfind(graph, start, goal, priority_queue=name)
+                self.assertEqual(cost, expected)
+                self.assertEqual(bool(path), expected != float("inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SCC reachability index
+"""
+import random
+import unittest
+from src.graph import Graph
+from src.reachability import ReachabilityIndex
+from src.bfs import bfs_pathfind
+from src.dijkstra import dijkstra_pathfind
+from src.dfs import dfs_pathfind
+
+
+def reachable_by_search(graph, start):
+    """Brute-force set of nodes reachable from start (reference answer)"""
+    seen = {start}
+    stack = [start]
+    while stack:
+        for neighbor, _ in graph.get_neighbors(stack.pop()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+class TestReachability(unittest.TestCase):
+    """Test cases for ReachabilityIndex and Graph.can_reach"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # A <-> B form one component, C -> D is one-way:
+        #   A <--> B --> C --> D
+        
+        for node_id in ["A", "B", "C", "D"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 1.0)
+        self.graph.add_edge("B", "A", 1.0)
+        self.graph.add_edge("B", "C", 2.0)
+        self.graph.add_edge("C", "D", 3.0)
+    
+    def test_components(self):
+        """Test that cities reaching each other share a component"""
+        index = ReachabilityIndex(self.graph)
+        
+        self.assertEqual(index.component["A"], index.component["B"])
+        self.assertNotEqual(index.component["C"], index.component["D"])
+    
+    def test_can_reach_is_directed(self):
+        """Test that reachability follows edge direction"""
+        self.assertTrue(self.graph.can_reach("A", "D"))
+        self.assertTrue(self.graph.can_reach("B", "A"))
+        self.assertFalse(self.graph.can_reach("D", "A"))
+        self.assertTrue(self.graph.can_reach("D", "D"))
+    
+    def test_unknown_city(self):
+        """Test that unknown cities are never reachable"""
+        self.assertFalse(self.graph.can_reach("A", "nowhere"))
+    
+    def test_incremental_updates(self):
+        """Test that new nodes and edges update an already built index"""
+        self.assertFalse(self.graph.can_reach("D", "A"))
+        
+        # Closing the cycle merges every city into one component
+        self.graph.add_edge("D", "A", 4.0)
+        self.assertTrue(self.graph.can_reach("D", "B"))
+        
+        self.graph.add_node("E", "City E")
+        self.assertFalse(self.graph.can_reach("A", "E"))
+        self.graph.add_edge("C", "E", 1.0)
+        self.assertTrue(self.graph.can_reach("A", "E"))
+        self.assertFalse(self.graph.can_reach("E", "A"))
+    
+    def test_route_to_missing_city_is_ignored(self):
+        """Test that a route to a city that doesn't exist doesn't break the index or searches"""
+        self.graph.add_edge("C", "zzz", 1.0)
+        
+        self.assertTrue(self.graph.can_reach("A", "D"))
+        self.assertFalse(self.graph.can_reach("C", "zzz"))
+        _, path, cost = dijkstra_pathfind(self.graph, "A", "B")
+        self.assertEqual((path, cost), (["City A", "City B"], 1.0))
+    
+    def test_route_added_before_its_city(self):
+        """Test that a route added before its destination city counts once the city exists"""
+        self.assertTrue(self.graph.can_reach("A", "D"))
+        self.graph.add_edge("D", "E", 1.0)
+        self.assertFalse(self.graph.can_reach("D", "E"))
+        
+        self.graph.add_node("E", "City E")
+        self.assertTrue(self.graph.can_reach("A", "E"))
+        
+        # The same when the index was built while the route led nowhere
+        self.graph.add_edge("E", "F", 1.0)
+        self.assertFalse(ReachabilityIndex(self.graph.snapshot()).can_reach("E", "F"))
+        self.assertFalse(self.graph.can_reach("E", "F"))
+        self.graph.add_node("F", "City F")
+        self.assertTrue(self.graph.can_reach("A", "F"))
+    
+    def test_matches_search_on_random_graphs(self):
+        """Test the index against a brute-force search while edges are added"""
+        rng = random.Random(7)
+        graph = Graph()
+        node_ids = [str(i) for i in range(30)]
+        for node_id in node_ids:
+            graph.add_node(node_id, f"City {node_id}")
+        
+        for _ in range(60):
+            graph.add_edge(rng.choice(node_ids), rng.choice(node_ids), 1.0)
+            for start in node_ids:
+                reachable = reachable_by_search(graph, start)
+                for goal in node_ids:
+                    self.assertEqual(graph.can_reach(start, goal), goal in reachable)
+    
+    def test_searches_stop_immediately_without_route(self):
+        """Test that BFS and Dijkstra reject an unreachable goal in a single step"""
+        steps, path, cost = bfs_pathfind(self.graph, start="D", goal="A")
+        self.assertEqual(len(steps), 1)
+        self.assertEqual(path, [])
+        self.assertEqual(cost, float('inf'))
+        
+        steps, path, cost = dijkstra_pathfind(self.graph, start="D", goal="A")
+        self.assertEqual(len(steps), 1)
+        self.assertEqual(cost, float('inf'))
+    
+    def test_no_route_step_names_both_cities(self):
+        """Test that every search names both cities in its no-route step"""
+        for steps in (bfs_pathfind(self.graph, "D", "A")[0], dijkstra_pathfind(self.graph, "D", "A")[0],
+                      dfs_pathfind(self.graph, "D", "A")[0]):
+            self.assertEqual(steps[0]['action'], "No route: City A cannot be reached from City D")
+            self.assertEqual(steps[0]['current_path'], ["City D"])
+        
+        steps = dijkstra_pathfind(self.graph, "D", "nowhere")[0]
+        self.assertEqual(steps[0]['action'], "No route: nowhere cannot be reached from City D")
+
+
+if __name__ == "__main__":
+    unittest.main()
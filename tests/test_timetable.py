@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for timetable routing with the Connection Scan Algorithm
+"""
+import unittest
+from src.graph import Graph
+from src.timetable import Timetable, earliest_arrival_journey, earliest_arrival_pathfind
+
+
+class TestTimetable(unittest.TestCase):
+    """Test cases for Timetable and earliest-arrival queries"""
+    
+    def setUp(self):
+        """Set up cities and a small timetable for each test (times in minutes)"""
+        self.graph = Graph()
+        for node_id in ["A", "B", "C", "D"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.timetable = Timetable(self.graph, default_min_connection_time=30)
+        # A -> B -> C with a tight 20 minute connection at B, and a slower later option
+        self.timetable.add_connection("A", "B", 600, 700, 100.0)
+        self.timetable.add_connection("B", "C", 720, 800, 80.0)
+        self.timetable.add_connection("B", "C", 760, 860, 90.0)
+        # Direct flight that arrives later than the connecting options
+        self.timetable.add_connection("A", "C", 610, 900, 300.0)
+    
+    def test_respects_min_connection_time(self):
+        """Test that a connection shorter than the minimum is not used"""
+        path, arrival = earliest_arrival_pathfind(self.timetable, "A", "C", departure_time=500)
+        self.assertEqual(path, ["City A", "City B", "City C"])
+        self.assertEqual(arrival, 860)
+    
+    def test_per_city_min_connection_time(self):
+        """Test a per-city override allowing the tight connection"""
+        self.timetable.set_min_connection_time("B", 15)
+        path, arrival = earliest_arrival_pathfind(self.timetable, "A", "C", departure_time=500)
+        self.assertEqual(arrival, 800)
+    
+    def test_departure_time_filters_connections(self):
+        """Test that flights leaving before the traveller is ready are skipped"""
+        path, arrival = earliest_arrival_pathfind(self.timetable, "A", "C", departure_time=605)
+        self.assertEqual(path, ["City A", "City C"])
+        self.assertEqual(arrival, 900)
+    
+    def test_journey_legs(self):
+        """Test that the journey lists legs with their times and fares"""
+        journey = earliest_arrival_journey(self.timetable, "A", "C", departure_time=500)
+        self.assertEqual([(leg.from_city, leg.to_city, leg.fare) for leg in journey],
+                         [("A", "B", 100.0), ("B", "C", 90.0)])
+    
+    def test_staying_on_board_needs_no_connection_time(self):
+        """Test that legs of the same trip can be chained without a connection time"""
+        self.timetable.add_connection("A", "B", 620, 650, 50.0, trip_id="T1")
+        self.timetable.add_connection("B", "D", 655, 700, 50.0, trip_id="T1")
+        path, arrival = earliest_arrival_pathfind(self.timetable, "A", "D", departure_time=500)
+        
+        self.assertEqual(path, ["City A", "City B", "City D"])
+        self.assertEqual(arrival, 700)
+    
+    def test_unreachable(self):
+        """Test a destination with no connections"""
+        self.assertEqual(earliest_arrival_pathfind(self.timetable, "A", "D", departure_time=500),
+                         ([], float('inf')))
+    
+    def test_same_start_and_goal(self):
+        """Test when start and goal are the same"""
+        self.assertEqual(earliest_arrival_pathfind(self.timetable, "A", "A", departure_time=500),
+                         (["City A"], 500))
+    
+    def test_invalid_connection(self):
+        """Test that invalid connections are rejected"""
+        with self.assertRaises(ValueError):
+            self.timetable.add_connection("A", "X", 0, 10, 1.0)
+        with self.assertRaises(ValueError):
+            self.timetable.add_connection("A", "B", 10, 0, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
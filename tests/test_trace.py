@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for lazy step traces and the step pager
+"""
+import os
+import tempfile
+import unittest
+from src.graph import Graph
+from src.bfs import bfs_steps, bfs_pathfind
+from src.dijkstra import dijkstra_steps
+from src.trace import StepPager, collect_steps, write_trace_in_background
+
+
+class TestTrace(unittest.TestCase):
+    """Test cases for step generators, StepPager and background trace writing"""
+    
+    def setUp(self):
+        """Set up a test graph for each test"""
+        self.graph = Graph()
+        
+        # Same graph as the search tests:
+        #   A --5--> B --10--> C
+        #   |                  |
+        #   3                  2
+        #   v                  v
+        #   D --4-----------> E
+        
+        for node_id in ["A", "B", "C", "D", "E"]:
+            self.graph.add_node(node_id, f"City {node_id}")
+        
+        self.graph.add_edge("A", "B", 5.0)
+        self.graph.add_edge("B", "C", 10.0)
+        self.graph.add_edge("A", "D", 3.0)
+        self.graph.add_edge("D", "E", 4.0)
+        self.graph.add_edge("C", "E", 2.0)
+    
+    def test_steps_are_lazy(self):
+        """Test that the first step is available before the search finishes"""
+        steps = dijkstra_steps(self.graph, start="A", goal="E")
+        first = next(steps)
+        self.assertEqual(first['action'], 'Pop: City A (Cost: 0)')
+    
+    def test_collect_steps_matches_pathfind(self):
+        """Test that collecting a step generator gives the same result as the eager function"""
+        steps, (path, cost) = collect_steps(bfs_steps(self.graph, start="A", goal="E"))
+        eager_steps, eager_path, eager_cost = bfs_pathfind(self.graph, start="A", goal="E")
+        
+        self.assertEqual(steps, eager_steps)
+        self.assertEqual(path, eager_path)
+        self.assertEqual(cost, eager_cost)
+    
+    def test_pager_pages_and_finishes(self):
+        """Test paging through steps and getting the result at the end"""
+        pager = StepPager(dijkstra_steps(self.graph, start="A", goal="E"))
+        page = pager.next_page(2)
+        
+        self.assertIn("Step 1:", page)
+        self.assertIn("Step 2:", page)
+        self.assertEqual(pager.position, 2)
+        
+        path, cost = pager.finish()
+        self.assertTrue(pager.finished)
+        self.assertEqual(path, ["City A", "City D", "City E"])
+        self.assertEqual(cost, 7.0)
+    
+    def test_pager_jump_to_step(self):
+        """Test jumping forward to a specific step"""
+        pager = StepPager(dijkstra_steps(self.graph, start="A", goal="E"))
+        rendered = pager.jump_to(3)
+        
+        self.assertTrue(rendered.startswith("Step 3:"))
+        self.assertEqual(pager.position, 3)
+        # Jumping backwards is not possible on a lazy trace
+        self.assertIn("Already past", pager.jump_to(1))
+    
+    def test_pager_jump_to_goal(self):
+        """Test jumping straight to the goal step"""
+        pager = StepPager(bfs_steps(self.graph, start="A", goal="E"))
+        rendered = pager.jump_to_goal()
+        
+        self.assertIn("Goal found: City E!", rendered)
+        # The goal is the last BFS step, so the pager knows it is done
+        self.assertTrue(pager.finished)
+    
+    def test_pager_goal_not_reached(self):
+        """Test jumping to the goal when there is no route"""
+        self.graph.add_node("Y", "City Y")
+        pager = StepPager(bfs_steps(self.graph, start="A", goal="Y"))
+        
+        self.assertIn("Goal not reached", pager.jump_to_goal())
+        self.assertEqual(pager.finish(), ([], float('inf')))
+    
+    def test_write_trace_in_background(self):
+        """Test writing the full trace to a file on a background thread"""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "trace.txt")
+            writer = write_trace_in_background(
+                lambda: dijkstra_steps(self.graph, start="A", goal="E"), filename)
+            writer.join()
+            
+            with open(filename, encoding='utf-8') as trace_file:
+                trace = trace_file.read()
+        
+        steps, _ = collect_steps(dijkstra_steps(self.graph, start="A", goal="E"))
+        self.assertIn(f"Step {len(steps)}:", trace)
+        self.assertIn("Goal found: City E!", trace)
+        self.assertIsNone(writer.error)
+    
+    def test_write_trace_failure_is_recorded(self):
+        """Test that a failed trace write is reported on the writer, not printed"""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "missing", "trace.txt")
+            writer = write_trace_in_background(
+                lambda: dijkstra_steps(self.graph, start="A", goal="E"), filename)
+            writer.join()
+        
+        self.assertIsInstance(writer.error, FileNotFoundError)
+
+
+if __name__ == "__main__":
+    unittest.main()